@@ -4,9 +4,10 @@ This adapter stores cached references using their SHA256 hash as the filename,
 eliminating collision risks and enabling automatic deduplication.
 """
 
-import hashlib
+import os
 import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 # Unix-only imports for file locking
@@ -16,6 +17,7 @@ if sys.platform != "win32":
 from ..core.errors import CacheCorruptionError, CacheMissError
 from ..ports.cache import CachePort
 from ..ports.hash import HashPort
+from .hash_sha import sha256_mapped
 
 
 class ContentAddressedCache(CachePort):
@@ -148,9 +150,8 @@ class ContentAddressedCache(CachePort):
                 if sys.platform != "win32":
                     fcntl.flock(f.fileno(), fcntl.LOCK_SH)
 
-                # Read and hash content
-                content = f.read()
-                actual_sha = hashlib.sha256(content).hexdigest()
+                # Hash content in place via mmap (no full in-memory copy)
+                actual_sha = sha256_mapped(f)
 
                 # Release lock automatically when exiting context
 
@@ -220,6 +221,36 @@ class ContentAddressedCache(CachePort):
 
         return path
 
+    def reserve_temp(self, bucket: str, prefix: str) -> Path:
+        """Reserve a staging file inside the cache directory (same filesystem)."""
+        self.base_dir.mkdir(parents=True, mode=0o700, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=self.base_dir, prefix=".tmp.")
+        os.close(fd)
+        return Path(name)
+
+    def commit_temp(self, bucket: str, prefix: str, tmp_path: Path, sha: str) -> Path:
+        """Move a staged reference to its content address without rehashing it.
+
+        Args:
+            bucket: S3 bucket name
+            prefix: Deltaspace prefix
+            tmp_path: File returned by ``reserve_temp`` (consumed)
+            sha: SHA256 of the staged content, already verified by the caller
+
+        Returns:
+            Path to cached file (content-addressed)
+        """
+        path = self._cas_path(sha)
+        if path.exists():
+            # Deduplication: identical content is already cached
+            tmp_path.unlink(missing_ok=True)
+        else:
+            path.parent.mkdir(parents=True, mode=0o700, exist_ok=True)
+            os.replace(tmp_path, path)
+
+        self._deltaspace_to_sha[(bucket, prefix)] = sha
+        return path
+
     def evict(self, bucket: str, prefix: str) -> None:
         """Remove cached reference for given deltaspace.
 
@@ -1,8 +1,9 @@
 """Filesystem cache adapter."""
 
-import hashlib
+import os
 import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 # Unix-only imports for file locking
@@ -12,6 +13,7 @@ if sys.platform != "win32":
 from ..core.errors import CacheCorruptionError, CacheMissError
 from ..ports.cache import CachePort
 from ..ports.hash import HashPort
+from .hash_sha import sha256_mapped
 
 
 class FsCacheAdapter(CachePort):
@@ -66,9 +68,8 @@ class FsCacheAdapter(CachePort):
                 if sys.platform != "win32":
                     fcntl.flock(f.fileno(), fcntl.LOCK_SH)
 
-                # Read and hash content
-                content = f.read()
-                actual_sha = hashlib.sha256(content).hexdigest()
+                # Hash content in place via mmap (no full in-memory copy)
+                actual_sha = sha256_mapped(f)
 
                 # Release lock automatically when exiting context
 
@@ -97,6 +98,20 @@ class FsCacheAdapter(CachePort):
         shutil.copy2(src, path)
         return path
 
+    def reserve_temp(self, bucket: str, prefix: str) -> Path:
+        """Reserve a staging file next to the reference's cache path."""
+        path = self.ref_path(bucket, prefix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=path.parent, prefix=".reference.", suffix=".tmp")
+        os.close(fd)
+        return Path(name)
+
+    def commit_temp(self, bucket: str, prefix: str, tmp_path: Path, sha: str) -> Path:
+        """Move a staged, verified reference into place (atomic rename, no copy)."""
+        path = self.ref_path(bucket, prefix)
+        os.replace(tmp_path, path)
+        return path
+
     def evict(self, bucket: str, prefix: str) -> None:
         """Remove cached reference."""
         path = self.ref_path(bucket, prefix)
@@ -9,6 +9,7 @@ Useful for:
 
 import hashlib
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
 # Unix-only imports for compatibility
@@ -40,6 +41,8 @@ class MemoryCache(CachePort):
     Storage Layout:
     - Key: (bucket, prefix) tuple
     - Value: (content_bytes, sha256) tuple
+    - Entries are kept in an OrderedDict from least to most recently used, so
+      touching and evicting an entry are both O(1).
     """
 
     def __init__(
@@ -58,15 +61,12 @@ class MemoryCache(CachePort):
         self.hasher = hasher
         self.max_size_bytes = max_size_mb * 1024 * 1024
 
-        # Storage: (bucket, prefix) -> (content_bytes, sha256)
-        self._cache: dict[tuple[str, str], tuple[bytes, str]] = {}
+        # Storage: (bucket, prefix) -> (content_bytes, sha256), in LRU order
+        self._cache: OrderedDict[tuple[str, str], tuple[bytes, str]] = OrderedDict()
 
         # Size tracking
         self._current_size = 0
 
-        # Access order for LRU eviction: (bucket, prefix) list
-        self._access_order: list[tuple[str, str]] = []
-
         # Temp directory for file-based API compatibility
         if temp_dir is None:
             import tempfile
@@ -77,18 +77,19 @@ class MemoryCache(CachePort):
 
         self.temp_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
 
+    @property
+    def _access_order(self) -> list[tuple[str, str]]:
+        """Cache keys from least to most recently used."""
+        return list(self._cache)
+
     def _update_access(self, key: tuple[str, str]) -> None:
         """Update LRU access order.
 
         Args:
             key: Cache key (bucket, prefix)
         """
-        # Remove old position if exists
-        if key in self._access_order:
-            self._access_order.remove(key)
-
-        # Add to end (most recently used)
-        self._access_order.append(key)
+        # Move to end (most recently used)
+        self._cache.move_to_end(key)
 
     def _evict_lru(self, needed_bytes: int) -> None:
         """Evict least recently used entries to free space.
@@ -96,19 +97,10 @@ class MemoryCache(CachePort):
         Args:
             needed_bytes: Bytes needed for new entry
         """
-        while self._current_size + needed_bytes > self.max_size_bytes and self._access_order:
+        while self._current_size + needed_bytes > self.max_size_bytes and self._cache:
             # Evict least recently used
-            lru_key = self._access_order[0]
-            bucket, prefix = lru_key
-
-            # Remove from cache
-            if lru_key in self._cache:
-                content, _ = self._cache[lru_key]
-                self._current_size -= len(content)
-                del self._cache[lru_key]
-
-            # Remove from access order
-            self._access_order.remove(lru_key)
+            _, (content, _) = self._cache.popitem(last=False)
+            self._current_size -= len(content)
 
     def ref_path(self, bucket: str, prefix: str) -> Path:
         """Get placeholder path for in-memory reference.
@@ -228,17 +220,19 @@ class MemoryCache(CachePort):
                 f"(limit: {self.max_size_bytes} bytes)"
             )
 
+        # Drop any previous entry for this deltaspace before sizing
+        key = (bucket, prefix)
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._current_size -= len(previous[0])
+
         # Evict LRU entries if needed
         self._evict_lru(content_size)
 
-        # Store in memory
-        key = (bucket, prefix)
+        # Store in memory (inserted as most recently used)
         self._cache[key] = (content, sha)
         self._current_size += content_size
 
-        # Update LRU
-        self._update_access(key)
-
         # Return virtual path
         return self.ref_path(bucket, prefix)
 
@@ -251,15 +245,10 @@ class MemoryCache(CachePort):
         """
         key = (bucket, prefix)
 
-        # Remove from cache
-        if key in self._cache:
-            content, _ = self._cache[key]
-            self._current_size -= len(content)
-            del self._cache[key]
-
-        # Remove from LRU tracking
-        if key in self._access_order:
-            self._access_order.remove(key)
+        # Remove from cache (and LRU tracking)
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._current_size -= len(entry[0])
 
         # Clean up temp file if exists
         temp_path = self.ref_path(bucket, prefix)
@@ -275,5 +264,4 @@ class MemoryCache(CachePort):
         Useful for testing and cleanup.
         """
         self._cache.clear()
-        self._access_order.clear()
         self._current_size = 0
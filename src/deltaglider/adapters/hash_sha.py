@@ -1,29 +1,48 @@
 """SHA256 hash adapter."""
 
 import hashlib
+import mmap
 from pathlib import Path
 from typing import BinaryIO
 
 from ..ports.hash import HashPort
 
+# hashlib releases the GIL and runs its optimised inner loop per update() call;
+# feeding it 1 MiB at a time keeps Python call overhead negligible.
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def sha256_mapped(f: BinaryIO) -> str:
+    """Hash an open regular file through a read-only memory map.
+
+    The digest runs directly over page-cache pages, so warm cached references
+    are hashed without first copying the whole file into a Python bytes object.
+    """
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+    except ValueError:
+        # Empty files cannot be mapped
+        return hashlib.sha256(f.read()).hexdigest()
+
 
 class Sha256Adapter(HashPort):
     """SHA256 implementation of HashPort."""
 
     def sha256(self, path_or_stream: Path | BinaryIO) -> str:
         """Compute SHA256 hash."""
+        if isinstance(path_or_stream, Path):
+            # file_digest runs the whole read/update loop in C
+            with open(path_or_stream, "rb", buffering=0) as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+        # Arbitrary streams (e.g. S3 bodies) may lack readinto(), which file_digest needs
         hasher = hashlib.sha256()
+        # Reset position if possible
+        if hasattr(path_or_stream, "seek"):
+            path_or_stream.seek(0)
 
-        if isinstance(path_or_stream, Path):
-            with open(path_or_stream, "rb") as f:
-                while chunk := f.read(8192):
-                    hasher.update(chunk)
-        else:
-            # Reset position if possible
-            if hasattr(path_or_stream, "seek"):
-                path_or_stream.seek(0)
-
-            while chunk := path_or_stream.read(8192):
-                hasher.update(chunk)
+        while chunk := path_or_stream.read(HASH_CHUNK_SIZE):
+            hasher.update(chunk)
 
         return hasher.hexdigest()
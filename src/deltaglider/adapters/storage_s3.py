@@ -1,12 +1,21 @@
 """S3 storage adapter."""
 
+import functools
 import logging
+import mmap
 import os
-from collections.abc import Iterator
+import queue
+import sys
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Optional, cast
 
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -17,10 +26,156 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from mypy_boto3_s3.client import S3Client
 
+# Connection pool sized for concurrent multipart parts and parallel HEAD probes;
+# botocore's default of 10 would serialize them. S3 speaks HTTP/1.1, one request
+# per connection, so this is also the cap on the adapter's shared request pool.
+MAX_POOL_CONNECTIONS = 64
+
+# Opt-in: raise the socket write block size of the client's connections from
+# botocore's 128 KiB to 1 MiB, for fewer send() calls per upload on fast links.
+BIG_HTTP_BUFFER_ENV = "DG_BIG_HTTP_BUFFER"
+BIG_HTTP_BUFFER_SIZE = 1024 * 1024
+
+
+def _set_http_blocksize(client: Any, blocksize: int) -> None:
+    """Set the urllib3 ``blocksize`` of one boto3 client's connections.
+
+    botocore passes ``blocksize`` explicitly when it builds its pool managers,
+    so http.client's default is never consulted; the value has to be given to
+    the client's own managers (pools and proxy managers created later included).
+    """
+    session = client._endpoint.http_session
+    session._manager.connection_pool_kw["blocksize"] = blocksize
+    session._get_pool_manager_kwargs = functools.partial(
+        session._get_pool_manager_kwargs, blocksize=blocksize
+    )
+
+
+# Files larger than this are uploaded with concurrent multipart parts instead of
+# a single-stream PUT; one TCP connection caps throughput on large references.
+MULTIPART_THRESHOLD = 100 * 1024 * 1024
+MULTIPART_PART_SIZE = 16 * 1024 * 1024
+MULTIPART_CONCURRENCY = 8
+
+# S3 DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+
+# LIST pages each list_sharded() walker may buffer ahead of the consumer
+LIST_SHARD_QUEUE_PAGES = 2
+
+# exists_any() asks for this many keys first: the answer is almost always on
+# the first small page, and only an uninformative page pays for a full one
+EXISTS_PROBE_KEYS = 10
+
+# Large downloads are fetched as concurrent ranged GETs of this size, with up to
+# DOWNLOAD_CONCURRENCY ranges in flight (bounding buffered memory to their product)
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+DOWNLOAD_CONCURRENCY = 8
+
+
+def _check_stored_metadata(object_key: str, sent: dict[str, str], stored: dict[str, str]) -> None:
+    """Log when S3 kept fewer metadata keys than a PUT sent."""
+    if not stored:
+        logger.error(
+            f"PUT {object_key}: CRITICAL - Metadata was sent but NOT STORED! "
+            f"Sent {len(sent)} keys, received 0 keys back."
+        )
+    elif len(stored) < len(sent):
+        missing_keys = set(sent.keys()) - set(stored.keys())
+        logger.warning(
+            f"PUT {object_key}: Metadata partially stored. "
+            f"Sent {len(sent)} keys, stored {len(stored)} keys. "
+            f"Missing keys: {missing_keys}"
+        )
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"PUT {object_key}: Metadata verified - all {len(sent)} keys stored")
+
+
+class _RangedReader:
+    """Readable stream over an S3 object fetched as concurrent ranged GETs.
+
+    Ranges are requested ahead of the reader but returned strictly in order, so
+    callers can still hash or tee the bytes as they stream. Every range after
+    the first is pinned to the first response's ETag. Ranges run on the
+    adapter's shared request pool; close the reader (or use it as a context
+    manager) to cancel ranges a consumer will never read.
+    """
+
+    def __init__(
+        self,
+        requests: ThreadPoolExecutor,
+        client: Any,
+        bucket: str,
+        key: str,
+        first_part: bytes,
+        size: int,
+        etag: str,
+    ) -> None:
+        self._requests = requests
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._etag = etag
+        self._buffer = memoryview(first_part)
+        self._next_start = len(first_part)
+        self._size = size
+        self.closed = False
+        self._pending: deque[Future[bytes]] = deque()
+        for _ in range(DOWNLOAD_CONCURRENCY):
+            self._submit_next()
+
+    def _submit_next(self) -> None:
+        if self.closed or self._next_start >= self._size:
+            return
+        end = min(self._next_start + DOWNLOAD_PART_SIZE, self._size) - 1
+        self._pending.append(self._requests.submit(self._fetch, self._next_start, end))
+        self._next_start = end + 1
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        response = self._client.get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={start}-{end}", IfMatch=self._etag
+        )
+        return response["Body"].read()  # type: ignore[no-any-return]
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            # Drain the rest of the object, not just the part in hand
+            parts = [self._buffer.tobytes()]
+            self._buffer = memoryview(b"")
+            while self._pending:
+                parts.append(self._pending.popleft().result())
+                self._submit_next()
+            self.close()
+            return b"".join(parts)
+        while not self._buffer and self._pending:
+            self._buffer = memoryview(self._pending.popleft().result())
+            self._submit_next()
+        if not self._buffer:
+            self.close()
+            return b""
+        chunk = self._buffer[:size].tobytes()
+        self._buffer = self._buffer[size:]
+        return chunk
+
+    def close(self) -> None:
+        self.closed = True
+        self._buffer = memoryview(b"")
+        while self._pending:
+            self._pending.popleft().cancel()
+
+    def __enter__(self) -> "_RangedReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
 
 class S3StorageAdapter(StoragePort):
     """S3 implementation of StoragePort."""
 
+    # Bucket-level operations (create/delete/list/ACL) can go straight to boto3
+    supports_native_bucket_ops: ClassVar[bool] = True
+
     def __init__(
         self,
         client: Optional["S3Client"] = None,
@@ -49,6 +204,9 @@ class S3StorageAdapter(StoragePort):
                 "config": Config(
                     request_checksum_calculation="when_required",
                     response_checksum_validation="when_required",
+                    max_pool_connections=MAX_POOL_CONNECTIONS,
+                    tcp_keepalive=True,
+                    retries={"mode": "adaptive", "max_attempts": 5},
                 ),
             }
 
@@ -57,9 +215,29 @@ class S3StorageAdapter(StoragePort):
                 client_params.update(boto3_kwargs)
 
             self.client = boto3.client(**client_params)
+            if os.environ.get(BIG_HTTP_BUFFER_ENV) == "1":
+                _set_http_blocksize(self.client, BIG_HTTP_BUFFER_SIZE)
         else:
             self.client = client
 
+        # One request pool per adapter, sized to the HTTP connection pool: every
+        # caller's concurrent HEADs share it, so together they never open more
+        # connections than the client keeps alive (threads start on demand)
+        self._requests = ThreadPoolExecutor(
+            max_workers=self.max_pool_connections, thread_name_prefix="deltaglider-s3"
+        )
+
+    @property
+    def boto_client(self) -> Any:
+        """Underlying boto3 S3 client, for operations outside StoragePort."""
+        return self.client
+
+    @property
+    def max_pool_connections(self) -> int:
+        """Size of the client's HTTP connection pool (useful request concurrency)."""
+        pool_size = getattr(self.client.meta.config, "max_pool_connections", None)
+        return pool_size if isinstance(pool_size, int) else MAX_POOL_CONNECTIONS
+
     def head(self, key: str) -> ObjectHead | None:
         """Get object metadata."""
         bucket, object_key = self._parse_key(key)
@@ -87,6 +265,13 @@ class S3StorageAdapter(StoragePort):
                 return None
             raise
 
+    def head_many(self, keys: Iterable[str]) -> dict[str, ObjectHead | None]:
+        """Get metadata for several objects with concurrent HEAD requests."""
+        keys = list(dict.fromkeys(keys))
+        if len(keys) <= 1:
+            return {key: self.head(key) for key in keys}
+        return dict(zip(keys, self._requests.map(self.head, keys), strict=True))
+
     def list(self, prefix: str) -> Iterator[ObjectHead]:
         """List objects by prefix (implements StoragePort interface).
 
@@ -100,15 +285,165 @@ class S3StorageAdapter(StoragePort):
         else:
             bucket, prefix_key = self._parse_key(prefix)
 
+        for page in self._prefetched_pages(bucket, prefix_key):
+            yield from self._head_listed(
+                [f"{bucket}/{obj['Key']}" for obj in page.get("Contents", [])]
+            )
+
+    def _prefetched_pages(self, bucket: str, prefix_key: str) -> Iterator[dict[str, Any]]:
+        """list_objects_v2 pages, fetching page N+1 in the background while N is consumed."""
         paginator = self.client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=bucket, Prefix=prefix_key)
+        pages = iter(paginator.paginate(Bucket=bucket, Prefix=prefix_key))
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_page = prefetcher.submit(next, pages, None)
+            while (page := next_page.result()) is not None:
+                next_page = prefetcher.submit(next, pages, None)
+                yield page
+
+    def list_shallow(self, prefix: str) -> Iterator[ObjectHead]:
+        """List objects by prefix without per-object HEADs; metadata is left empty."""
+        if "/" not in prefix:
+            bucket = prefix
+            prefix_key = ""
+        else:
+            bucket, prefix_key = self._parse_key(prefix)
 
-        for page in pages:
-            for obj in page.get("Contents", []):
-                # Get full metadata
-                head = self.head(f"{bucket}/{obj['Key']}")
-                if head:
-                    yield head
+        for page in self._prefetched_pages(bucket, prefix_key):
+            yield from map(self._listed_head, page.get("Contents", []))
+
+    def list_sharded(
+        self, prefix: str, shards: int = 16, metadata: bool = True
+    ) -> Iterator[ObjectHead]:
+        """List objects by prefix, paginating each immediate sub-folder concurrently.
+
+        One delimited LIST discovers the sub-folders (and the objects directly
+        under prefix); up to ``shards`` paginators then walk the sub-folders in
+        parallel. Objects are yielded in no particular order. With
+        ``metadata=False`` nothing is HEADed and metadata is left empty.
+        """
+        if "/" not in prefix:
+            bucket = prefix
+            prefix_key = ""
+        else:
+            bucket, prefix_key = self._parse_key(prefix)
+
+        def heads(entries: list[dict[str, Any]]) -> Iterator[ObjectHead]:
+            if not metadata:
+                return map(self._listed_head, entries)
+            return self._head_listed([f"{bucket}/{obj['Key']}" for obj in entries])
+
+        paginator = self.client.get_paginator("list_objects_v2")
+        direct: list[dict[str, Any]] = []
+        folders: list[str] = []
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix_key, Delimiter="/"):
+            direct.extend(page.get("Contents", []))
+            folders.extend(common["Prefix"] for common in page.get("CommonPrefixes", []))
+
+        if not folders:
+            yield from heads(direct)
+            return
+
+        # Shard workers only LIST; the consumer HEADs their pages in pool-sized
+        # batches, so sharding never multiplies the HEAD concurrency. The page
+        # queue is bounded so walkers cannot run far ahead of the consumer, and
+        # they give up on it once the consumer stops.
+        workers = min(shards, len(folders))
+        pages: queue.Queue[list[dict[str, Any]] | None] = queue.Queue(
+            maxsize=workers * LIST_SHARD_QUEUE_PAGES
+        )
+        stop = threading.Event()
+
+        def offer(entries: list[dict[str, Any]] | None) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(entries, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def walk(folder: str) -> None:
+            try:
+                for page in paginator.paginate(Bucket=bucket, Prefix=folder):
+                    if stop.is_set():
+                        return
+                    offer(page.get("Contents", []))
+            finally:
+                offer(None)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            walkers = [pool.submit(walk, folder) for folder in folders]
+            try:
+                yield from heads(direct)
+                running = len(walkers)
+                while running:
+                    entries = pages.get()
+                    if entries is None:
+                        running -= 1
+                    else:
+                        yield from heads(entries)
+                for walker in walkers:
+                    walker.result()
+            finally:
+                stop.set()
+
+    @staticmethod
+    def _listed_head(obj: dict[str, Any]) -> ObjectHead:
+        """ObjectHead built from a list_objects_v2 entry alone (no metadata)."""
+        return ObjectHead(
+            key=obj["Key"],
+            size=obj["Size"],
+            etag=obj.get("ETag", "").strip('"'),
+            last_modified=obj["LastModified"],
+            metadata={},
+        )
+
+    def _head_listed(self, keys: Sequence[str]) -> Iterator[ObjectHead]:
+        """HEAD listed keys in pool-sized concurrent batches, skipping vanished ones.
+
+        Batching keeps a caller that stops early (e.g. any()) to at most one
+        wasted batch.
+        """
+        batch_size = self.max_pool_connections
+        for start in range(0, len(keys), batch_size):
+            heads = self.head_many(keys[start : start + batch_size])
+            yield from (head for head in heads.values() if head)
+
+    def exists_any(self, prefix: str, exclude_key: str = "", within: str = "") -> bool:
+        """Probe for an object outside within with key-only LIST pages (no HEADs)."""
+        if "/" not in prefix:
+            bucket, prefix_key = prefix, ""
+        else:
+            bucket, prefix_key = self._parse_key(prefix)
+
+        params: dict[str, Any] = {
+            "Bucket": bucket,
+            "Prefix": prefix_key,
+            "MaxKeys": EXISTS_PROBE_KEYS,
+        }
+        # Keys under within sort contiguously; once a page ends inside that range,
+        # StartAfter jumps past it instead of paging through it
+        skip_within = f"{within}\U0010ffff" if within else None
+        while True:
+            response = self.client.list_objects_v2(**params)
+            contents = response.get("Contents", [])
+            for obj in contents:
+                key = obj["Key"]
+                if key != exclude_key and not (within and key.startswith(within)):
+                    return True
+            if not response.get("IsTruncated"):
+                return False
+            params["MaxKeys"] = 1000
+            if (
+                skip_within
+                and params.get("StartAfter") != skip_within
+                and contents
+                and contents[-1]["Key"].startswith(within)
+            ):
+                params.pop("ContinuationToken", None)
+                params["StartAfter"] = skip_within
+            else:
+                params.pop("StartAfter", None)
+                params["ContinuationToken"] = response["NextContinuationToken"]
 
     def list_objects(
         self,
@@ -162,7 +497,9 @@ class S3StorageAdapter(StoragePort):
                         if hasattr(obj["LastModified"], "isoformat")
                         else str(obj["LastModified"]),
                         "etag": obj.get("ETag", "").strip('"'),
-                        "storage_class": obj.get("StorageClass", "STANDARD"),
+                        # A handful of distinct values repeated across every listed
+                        # object: share one string each instead of one per object
+                        "storage_class": sys.intern(obj.get("StorageClass", "STANDARD")),
                     }
                 )
 
@@ -195,6 +532,45 @@ class S3StorageAdapter(StoragePort):
                 raise FileNotFoundError(f"Object not found: {key}") from e
             raise
 
+    def get_concurrent(self, key: str) -> BinaryIO:
+        """Get object content as a stream, fetching large objects in parallel ranges.
+
+        The first ranged GET reveals the object size; objects that fit in one
+        part are returned as that response's stream, larger ones continue as
+        concurrent ranged GETs read back in order.
+        """
+        bucket, object_key = self._parse_key(key)
+
+        try:
+            response = self.client.get_object(
+                Bucket=bucket, Key=object_key, Range=f"bytes=0-{DOWNLOAD_PART_SIZE - 1}"
+            )
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code == "InvalidRange":  # empty object
+                return self.get(key)
+            if code == "NoSuchKey":
+                raise FileNotFoundError(f"Object not found: {key}") from e
+            raise
+
+        content_range = response.get("ContentRange", "")
+        total = content_range.rpartition("/")[2]
+        if not total.isdigit() or int(total) <= DOWNLOAD_PART_SIZE:
+            return response["Body"]  # type: ignore[no-any-return]
+
+        return cast(
+            BinaryIO,
+            _RangedReader(
+                self._requests,
+                self.client,
+                bucket,
+                object_key,
+                response["Body"].read(),
+                int(total),
+                response["ETag"],
+            ),
+        )
+
     def put(
         self,
         key: str,
@@ -205,10 +581,23 @@ class S3StorageAdapter(StoragePort):
         """Put object with metadata."""
         bucket, object_key = self._parse_key(key)
 
-        # Prepare body
+        if isinstance(body, Path) and body.stat().st_size > MULTIPART_THRESHOLD:
+            return self.upload_multipart(
+                body, bucket, object_key, metadata=metadata, content_type=content_type
+            )
+
+        # Prepare body. Files are mapped rather than read into a bytes object: the
+        # pages a preceding hash pass just touched are sent straight from the page
+        # cache, without a second full-size copy in Python memory.
+        mapped: mmap.mmap | None = None
+        body_data: bytes | mmap.mmap
         if isinstance(body, Path):
             with open(body, "rb") as f:
-                body_data = f.read()
+                try:
+                    body_data = mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped
+                    body_data = b""
         elif isinstance(body, bytes):
             body_data = body
         else:
@@ -238,89 +627,188 @@ class S3StorageAdapter(StoragePort):
         max_retries = 3
         last_error: ClientError | None = None
 
-        for attempt in range(max_retries):
-            try:
-                response = self.client.put_object(
-                    Bucket=bucket,
-                    Key=object_key,
-                    Body=body_data,
-                    ContentType=content_type,
-                    Metadata=clean_metadata,
-                )
+        try:
+            for attempt in range(max_retries):
+                if mapped is not None:
+                    mapped.seek(0)  # a failed attempt may have consumed the mapping
+                try:
+                    response = self.client.put_object(
+                        Bucket=bucket,
+                        Key=object_key,
+                        Body=body_data,
+                        ContentType=content_type,
+                        Metadata=clean_metadata,
+                    )
 
-                # VERIFICATION: Check if metadata was actually stored (especially for delta files)
-                if object_key.endswith(".delta") and clean_metadata:
-                    try:
-                        # Verify metadata was stored by doing a HEAD immediately
-                        verify_response = self.client.head_object(Bucket=bucket, Key=object_key)
-                        stored_metadata = verify_response.get("Metadata", {})
-
-                        if not stored_metadata:
-                            logger.error(
-                                f"PUT {object_key}: CRITICAL - Metadata was sent but NOT STORED! "
-                                f"Sent {len(clean_metadata)} keys, received 0 keys back."
-                            )
-                        elif len(stored_metadata) < len(clean_metadata):
-                            missing_keys = set(clean_metadata.keys()) - set(stored_metadata.keys())
-                            logger.warning(
-                                f"PUT {object_key}: Metadata partially stored. "
-                                f"Sent {len(clean_metadata)} keys, stored {len(stored_metadata)} keys. "
-                                f"Missing keys: {missing_keys}"
-                            )
-                        elif logger.isEnabledFor(logging.DEBUG):
-                            logger.debug(
-                                f"PUT {object_key}: Metadata verified - "
-                                f"all {len(clean_metadata)} keys stored"
+                    # VERIFICATION: Check if metadata was actually stored (especially for delta files)
+                    if object_key.endswith(".delta") and clean_metadata:
+                        try:
+                            # Verify metadata was stored by doing a HEAD immediately
+                            verify_response = self.client.head_object(Bucket=bucket, Key=object_key)
+                            _check_stored_metadata(
+                                object_key, clean_metadata, verify_response.get("Metadata", {})
                             )
-                    except Exception as e:
-                        logger.warning(f"PUT {object_key}: Could not verify metadata: {e}")
+                        except Exception as e:
+                            logger.warning(f"PUT {object_key}: Could not verify metadata: {e}")
 
-                return PutResult(
-                    etag=response["ETag"].strip('"'),
-                    version_id=response.get("VersionId"),
-                )
-            except ClientError as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    delay = 2**attempt  # 1s, 2s
-                    # Log full error details
-                    error_response = e.response if hasattr(e, "response") else {}
-                    http_headers = error_response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
-                    logger.warning(
-                        f"PUT {object_key}: Attempt {attempt + 1}/{max_retries} failed: {e}. "
-                        f"Retrying in {delay}s... "
-                        f"Details: bucket={bucket}, key={object_key}, "
-                        f"body_size={len(body_data)}, content_type={content_type}, "
-                        f"metadata_keys={list(clean_metadata.keys())}, "
-                        f"endpoint={self.client.meta.endpoint_url}, "
-                        f"http_status={error_response.get('ResponseMetadata', {}).get('HTTPStatusCode')}, "
-                        f"error_code={error_response.get('Error', {}).get('Code')}, "
-                        f"error_message={error_response.get('Error', {}).get('Message')}, "
-                        f"request_id={error_response.get('ResponseMetadata', {}).get('RequestId')}, "
-                        f"http_headers={dict(http_headers)}"
-                    )
-                    # Enable botocore wire-level logging for the retry
-                    logging.getLogger("botocore").setLevel(logging.DEBUG)
-                    time.sleep(delay)
-                else:
-                    # Final attempt failed — log everything
-                    error_response = e.response if hasattr(e, "response") else {}
-                    http_headers = error_response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
-                    logger.error(
-                        f"PUT {object_key}: All {max_retries} attempts failed. "
-                        f"Last error: {e}. "
-                        f"Details: bucket={bucket}, key={object_key}, "
-                        f"body_size={len(body_data)}, content_type={content_type}, "
-                        f"metadata={clean_metadata}, "
-                        f"endpoint={self.client.meta.endpoint_url}, "
-                        f"http_status={error_response.get('ResponseMetadata', {}).get('HTTPStatusCode')}, "
-                        f"error_code={error_response.get('Error', {}).get('Code')}, "
-                        f"error_message={error_response.get('Error', {}).get('Message')}, "
-                        f"request_id={error_response.get('ResponseMetadata', {}).get('RequestId')}, "
-                        f"http_headers={dict(http_headers)}"
+                    return PutResult(
+                        etag=response["ETag"].strip('"'),
+                        version_id=response.get("VersionId"),
                     )
+                except ClientError as e:
+                    last_error = e
+                    if attempt < max_retries - 1:
+                        delay = 2**attempt  # 1s, 2s
+                        # Log full error details
+                        error_response = e.response if hasattr(e, "response") else {}
+                        http_headers = error_response.get("ResponseMetadata", {}).get(
+                            "HTTPHeaders", {}
+                        )
+                        logger.warning(
+                            f"PUT {object_key}: Attempt {attempt + 1}/{max_retries} failed: {e}. "
+                            f"Retrying in {delay}s... "
+                            f"Details: bucket={bucket}, key={object_key}, "
+                            f"body_size={len(body_data)}, content_type={content_type}, "
+                            f"metadata_keys={list(clean_metadata.keys())}, "
+                            f"endpoint={self.client.meta.endpoint_url}, "
+                            f"http_status={error_response.get('ResponseMetadata', {}).get('HTTPStatusCode')}, "
+                            f"error_code={error_response.get('Error', {}).get('Code')}, "
+                            f"error_message={error_response.get('Error', {}).get('Message')}, "
+                            f"request_id={error_response.get('ResponseMetadata', {}).get('RequestId')}, "
+                            f"http_headers={dict(http_headers)}"
+                        )
+                        # Enable botocore wire-level logging for the retry
+                        logging.getLogger("botocore").setLevel(logging.DEBUG)
+                        time.sleep(delay)
+                    else:
+                        # Final attempt failed — log everything
+                        error_response = e.response if hasattr(e, "response") else {}
+                        http_headers = error_response.get("ResponseMetadata", {}).get(
+                            "HTTPHeaders", {}
+                        )
+                        logger.error(
+                            f"PUT {object_key}: All {max_retries} attempts failed. "
+                            f"Last error: {e}. "
+                            f"Details: bucket={bucket}, key={object_key}, "
+                            f"body_size={len(body_data)}, content_type={content_type}, "
+                            f"metadata={clean_metadata}, "
+                            f"endpoint={self.client.meta.endpoint_url}, "
+                            f"http_status={error_response.get('ResponseMetadata', {}).get('HTTPStatusCode')}, "
+                            f"error_code={error_response.get('Error', {}).get('Code')}, "
+                            f"error_message={error_response.get('Error', {}).get('Message')}, "
+                            f"request_id={error_response.get('ResponseMetadata', {}).get('RequestId')}, "
+                            f"http_headers={dict(http_headers)}"
+                        )
+
+            raise RuntimeError(f"Failed to put object: {last_error}") from last_error
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+    def upload_multipart(
+        self,
+        local_path: Path,
+        bucket: str,
+        key: str,
+        metadata: dict[str, str] | None = None,
+        content_type: str = "application/octet-stream",
+        part_size: int = MULTIPART_PART_SIZE,
+        concurrency: int = MULTIPART_CONCURRENCY,
+    ) -> PutResult:
+        """Upload a local file as a multipart upload with concurrent parts.
+
+        The file is streamed from disk in ``part_size`` chunks and up to
+        ``concurrency`` parts are in flight at once, so a slow part does not
+        stall the ones behind it.
 
-        raise RuntimeError(f"Failed to put object: {last_error}") from last_error
+        Args:
+            local_path: File to upload
+            bucket: S3 bucket name
+            key: Object key within the bucket
+            metadata: User metadata to store on the object
+            content_type: Content type of the object
+            part_size: Size of each multipart part in bytes
+            concurrency: Maximum number of parts uploaded in parallel
+
+        Returns:
+            PutResult for the completed object
+        """
+        transfer_config = TransferConfig(
+            multipart_threshold=min(part_size, MULTIPART_THRESHOLD),
+            multipart_chunksize=part_size,
+            max_concurrency=concurrency,
+            use_threads=True,
+        )
+        extra_args: dict[str, Any] = {"ContentType": content_type}
+        if metadata:
+            extra_args["Metadata"] = {k.lower(): v for k, v in metadata.items()}
+
+        logger.debug(
+            f"PUT {key}: multipart upload of {local_path.stat().st_size} bytes "
+            f"(part_size={part_size}, concurrency={concurrency})"
+        )
+        # The transfer manager retries each part itself; a failure that still
+        # escapes it is reported the same way put() reports exhausted retries
+        try:
+            self.client.upload_file(
+                str(local_path), bucket, key, ExtraArgs=extra_args, Config=transfer_config
+            )
+        except (S3UploadFailedError, ClientError) as e:
+            logger.error(f"PUT {key}: multipart upload failed: {e}")
+            raise RuntimeError(f"Failed to put object: {e}") from e
+
+        # upload_file does not surface the completion response; the HEAD that
+        # fetches the ETag also verifies that .delta metadata was stored
+        response = self.client.head_object(Bucket=bucket, Key=key)
+        if key.endswith(".delta") and metadata:
+            _check_stored_metadata(key, extra_args["Metadata"], response.get("Metadata", {}))
+        return PutResult(
+            etag=response["ETag"].strip('"'),
+            version_id=response.get("VersionId"),
+        )
+
+    def copy(
+        self,
+        src_key: str,
+        dst_key: str,
+        metadata: dict[str, str],
+        content_type: str = "application/octet-stream",
+    ) -> PutResult:
+        """Copy an object server-side, replacing its metadata; no bytes pass through us."""
+        src_bucket, src_object_key = self._parse_key(src_key)
+        bucket, object_key = self._parse_key(dst_key)
+        extra_args: dict[str, Any] = {
+            "ContentType": content_type,
+            "Metadata": {k.lower(): v for k, v in metadata.items()},
+            "MetadataDirective": "REPLACE",
+        }
+        copy_source = {"Bucket": src_bucket, "Key": src_object_key}
+
+        try:
+            response = self.client.copy_object(
+                CopySource=copy_source, Bucket=bucket, Key=object_key, **extra_args
+            )
+            return PutResult(
+                etag=response["CopyObjectResult"]["ETag"].strip('"'),
+                version_id=response.get("VersionId"),
+            )
+        except ClientError as e:
+            # A single CopyObject is capped at 5 GiB; larger sources need the
+            # managed (multipart UploadPartCopy) transfer
+            if e.response["Error"]["Code"] != "InvalidRequest":
+                raise
+
+        self.client.copy(
+            copy_source,
+            bucket,
+            object_key,
+            ExtraArgs=extra_args,
+            Config=TransferConfig(
+                multipart_chunksize=MULTIPART_PART_SIZE, max_concurrency=MULTIPART_CONCURRENCY
+            ),
+        )
+        head = self.client.head_object(Bucket=bucket, Key=object_key)
+        return PutResult(etag=head["ETag"].strip('"'), version_id=head.get("VersionId"))
 
     def delete(self, key: str) -> None:
         """Delete object."""
@@ -332,6 +820,36 @@ class S3StorageAdapter(StoragePort):
             if e.response["Error"]["Code"] != "NoSuchKey":
                 raise
 
+    def delete_many(self, keys: Iterable[str]) -> Sequence[tuple[str, Exception | None]]:
+        """Delete objects with batched DeleteObjects requests (one per 1000 keys)."""
+        keys = list(keys)
+        by_bucket: dict[str, list[str]] = {}
+        for key in keys:
+            bucket, object_key = self._parse_key(key)
+            by_bucket.setdefault(bucket, []).append(object_key)
+
+        errors: dict[str, Exception] = {}
+        for bucket, object_keys in by_bucket.items():
+            for start in range(0, len(object_keys), DELETE_BATCH_SIZE):
+                batch = object_keys[start : start + DELETE_BATCH_SIZE]
+                try:
+                    response = self.client.delete_objects(
+                        Bucket=bucket,
+                        Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
+                    )
+                except ClientError as e:
+                    errors.update((f"{bucket}/{k}", e) for k in batch)
+                    continue
+                for error in response.get("Errors", []):
+                    if error.get("Code") == "NoSuchKey":
+                        continue
+                    errors[f"{bucket}/{error['Key']}"] = ClientError(
+                        {"Error": {"Code": error.get("Code"), "Message": error.get("Message")}},
+                        "DeleteObjects",
+                    )
+
+        return [(key, errors.get(key)) for key in keys]
+
     def _parse_key(self, key: str) -> tuple[str, str]:
         """Parse bucket/key from combined key."""
         parts = key.split("/", 1)
@@ -1,10 +1,11 @@
 """AWS S3 CLI compatible commands."""
 
-import shutil
+import posixpath
 import sys
 from pathlib import Path
 
 import click
+from botocore.exceptions import ClientError
 
 from ...core import (
     DeltaService,
@@ -14,6 +15,7 @@ from ...core import (
     is_s3_url,
 )
 from ...core import parse_s3_url as core_parse_s3_url
+from ...ports.storage import ObjectHead
 from .sync import fetch_s3_object_heads
 
 __all__ = [
@@ -21,6 +23,7 @@ __all__ = [
     "parse_s3_url",
     "determine_operation",
     "upload_file",
+    "put_local_file",
     "download_file",
     "copy_s3_to_s3",
     "migrate_s3_to_s3",
@@ -141,46 +144,95 @@ def upload_file(
     quiet: bool = False,
 ) -> None:
     """Upload a file to S3 with delta compression."""
+    try:
+        message = put_local_file(service, local_path, s3_url, max_ratio, no_delta)
+    except Exception as e:
+        click.echo(f"upload failed: {e}", err=True)
+        sys.exit(1)
+
+    if not quiet:
+        click.echo(message)
+
+
+def put_local_file(
+    service: DeltaService,
+    local_path: Path,
+    s3_url: str,
+    max_ratio: float | None = None,
+    no_delta: bool = False,
+) -> str:
+    """Upload a file to S3 and return the aws-cli style ``upload:`` line.
+
+    Errors propagate to the caller, which decides how to report them.
+    """
     bucket, key = parse_s3_url(s3_url)
 
     # If key is empty or ends with /, append filename
     if not key or key.endswith("/"):
         key = (key + local_path.name).lstrip("/")
 
+    dest_url = build_s3_url(bucket, key)
+
+    # Check if delta should be disabled
+    if no_delta:
+        # Direct upload without delta compression (large files go multipart)
+        service.storage.put(f"{bucket}/{key}", local_path, {})
+        file_size = local_path.stat().st_size
+        return f"upload: '{local_path}' to '{dest_url}' ({file_size} bytes)"
+
+    # Use delta compression
     delta_space = DeltaSpace(bucket=bucket, prefix="/".join(key.split("/")[:-1]))
+    summary = service.put(local_path, delta_space, max_ratio)
 
-    dest_url = build_s3_url(bucket, key)
+    if summary.delta_size:
+        ratio = round((summary.delta_size / summary.file_size) * 100, 1)
+        return (
+            f"upload: '{local_path}' to '{build_s3_url(bucket, summary.key)}' "
+            f"(delta: {ratio}% of original)"
+        )
+    return (
+        f"upload: '{local_path}' to '{build_s3_url(bucket, summary.key)}' "
+        f"(reference: {summary.file_size} bytes)"
+    )
 
-    try:
-        # Check if delta should be disabled
-        if no_delta:
-            # Direct upload without delta compression
-            with open(local_path, "rb") as f:
-                service.storage.put(f"{bucket}/{key}", f, {})
 
-            if not quiet:
-                file_size = local_path.stat().st_size
-                click.echo(f"upload: '{local_path}' to '{dest_url}' ({file_size} bytes)")
-        else:
-            # Use delta compression
-            summary = service.put(local_path, delta_space, max_ratio)
+def _resolve_download_key(
+    service: DeltaService, bucket: str, key: str
+) -> tuple[str, ObjectHead | None]:
+    """Return the stored key to download, ``key`` itself or its ``.delta`` twin,
+    together with its HEAD result (None if the object was not found).
 
-            if not quiet:
-                if summary.delta_size:
-                    ratio = round((summary.delta_size / summary.file_size) * 100, 1)
-                    click.echo(
-                        f"upload: '{local_path}' to '{build_s3_url(bucket, summary.key)}' "
-                        f"(delta: {ratio}% of original)"
-                    )
-                else:
-                    click.echo(
-                        f"upload: '{local_path}' to '{build_s3_url(bucket, summary.key)}' "
-                        f"(reference: {summary.file_size} bytes)"
-                    )
+    In DeltaGlider-managed buckets the ``.delta`` object is the common case, so
+    it is preferred; storage that batches HEADs probes both keys concurrently on
+    its shared request pool. The HEAD result is handed on to
+    ``DeltaService.get`` so the object is not HEADed a second time.
+    """
+    if key.endswith(".delta"):
+        return key, service.storage.head(f"{bucket}/{key}")
+
+    storage = service.storage
+    delta_key = f"{key}.delta"
+    full_delta_key = f"{bucket}/{delta_key}"
+    full_key = f"{bucket}/{key}"
+    if getattr(type(storage), "head_many", None) is not None:
+        try:
+            heads = storage.head_many([full_delta_key, full_key])
+        except ClientError:
+            pass  # one probe was refused; settle them one at a time below
+        else:
+            if heads[full_delta_key] is not None:
+                return delta_key, heads[full_delta_key]
+            return key, heads[full_key]
 
-    except Exception as e:
-        click.echo(f"upload failed: {e}", err=True)
-        sys.exit(1)
+    try:
+        delta_head = storage.head(full_delta_key)
+    except ClientError:
+        # Without s3:ListBucket a missing key is a 403, not a 404: treat the
+        # speculative .delta probe as a miss and fall back to the bare key
+        delta_head = None
+    if delta_head is not None:
+        return delta_key, delta_head
+    return key, storage.head(full_key)
 
 
 def download_file(
@@ -198,15 +250,12 @@ def download_file(
 
     try:
         # Check if file exists, try adding .delta if not found
-        obj_head = service.storage.head(f"{bucket}/{key}")
-        if obj_head is None and not key.endswith(".delta"):
-            delta_key = f"{key}.delta"
-            delta_head = service.storage.head(f"{bucket}/{delta_key}")
-            if delta_head is not None:
-                actual_key = delta_key
-                obj_key = ObjectKey(bucket=bucket, key=delta_key)
-                if not quiet:
-                    click.echo(f"Auto-detected delta: {build_s3_url(bucket, delta_key)}")
+        resolved_key, obj_head = _resolve_download_key(service, bucket, key)
+        if resolved_key != key:
+            actual_key = f"{key}.delta"
+            obj_key = ObjectKey(bucket=bucket, key=actual_key)
+            if not quiet:
+                click.echo(f"Auto-detected delta: {build_s3_url(bucket, actual_key)}")
 
         # Determine output path
         if local_path is None:
@@ -215,17 +264,15 @@ def download_file(
                 click.echo("Error: Cannot download bucket root, specify a key", err=True)
                 sys.exit(1)
 
-            # Use filename from S3 key
-            if actual_key.endswith(".delta"):
-                local_path = Path(Path(actual_key).stem)
-            else:
-                local_path = Path(Path(actual_key).name)
+            # Use filename from S3 key (keys are always POSIX-style)
+            base = posixpath.basename(actual_key)
+            local_path = Path(base.removesuffix(".delta") or base)
 
         # Create parent directories if needed
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Download and reconstruct
-        service.get(obj_key, local_path)
+        service.get(obj_key, local_path, obj_head)
 
         if not quiet:
             file_size = local_path.stat().st_size
@@ -284,19 +331,22 @@ def copy_s3_to_s3(
             import tempfile
 
             # Extract original filename from source
-            original_filename = Path(source_key).name
+            original_filename = posixpath.basename(source_key)
 
             with tempfile.NamedTemporaryFile(delete=False, suffix=Path(source_key).suffix) as tmp:
                 tmp_path = Path(tmp.name)
 
-                # Write stream to temp file
-                with open(tmp_path, "wb") as f:
-                    shutil.copyfileobj(source_stream, f)
-
             try:
+                # Write stream to temp file, hashing it on the way so put() needn't
+                source_sha256 = service.write_and_hash(source_stream, tmp_path)
+
                 # Use DeltaService.put() with override_name to preserve original filename
                 summary = service.put(
-                    tmp_path, dest_deltaspace, max_ratio, override_name=original_filename
+                    tmp_path,
+                    dest_deltaspace,
+                    max_ratio,
+                    override_name=original_filename,
+                    precomputed_sha256=source_sha256,
                 )
 
                 if not quiet:
@@ -1,11 +1,18 @@
 """CLI main entry point."""
 
 import atexit
+import functools
 import json
+import multiprocessing
+import multiprocessing.util
 import os
 import shutil
 import sys
 import tempfile
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
 from datetime import UTC
 from pathlib import Path
 from typing import Any
@@ -32,10 +39,41 @@ from .aws_compat import (
     handle_recursive,
     is_s3_path,
     parse_s3_url,
+    put_local_file,
     upload_file,
 )
 from .sync import sync_from_s3, sync_to_s3
 
+# orjson is an optional speedup for JSON output in scripted use; the CLI emits
+# the same indented, non-ASCII-escaped document through the stdlib encoder when
+# it is missing. Only float spelling can differ (orjson writes 1e16, the stdlib
+# 1e+16); both parse to the same value.
+_orjson: Any
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    _orjson = None
+
+
+def _dumps_json(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize CLI output as two-space indented JSON."""
+    if _orjson is not None:
+        try:
+            dumped: bytes = _orjson.dumps(
+                obj,
+                default=default,
+                option=_orjson.OPT_INDENT_2 | _orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+            return dumped.decode()
+        except TypeError:
+            pass  # e.g. non-str dict keys; the stdlib encoder handles those
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False)
+
+
+def _make_cache_dir() -> Path:
+    """Create a private, process-local cache directory."""
+    return Path(tempfile.mkdtemp(prefix="deltaglider-", dir="/tmp"))
+
 
 def create_service(
     log_level: str = "INFO",
@@ -44,6 +82,7 @@ def create_service(
     profile: str | None = None,
     *,
     config: DeltaGliderConfig | None = None,
+    cache_dir: Path | None = None,
 ) -> DeltaService:
     """Create service with wired adapters.
 
@@ -53,6 +92,8 @@ def create_service(
         region: AWS region (overridden by config if provided).
         profile: AWS profile (overridden by config if provided).
         config: Optional pre-built config. If None, built from env vars + explicit params.
+        cache_dir: Optional cache directory owned (and cleaned up) by the caller. If None,
+            a private temporary directory is created and removed at interpreter exit.
     """
     if config is None:
         config = DeltaGliderConfig.from_env(
@@ -63,9 +104,10 @@ def create_service(
         )
 
     # SECURITY: Always use ephemeral process-isolated cache
-    cache_dir = Path(tempfile.mkdtemp(prefix="deltaglider-", dir="/tmp"))
-    # Register cleanup handler to remove cache on exit
-    atexit.register(lambda: shutil.rmtree(cache_dir, ignore_errors=True))
+    if cache_dir is None:
+        cache_dir = _make_cache_dir()
+        # Register cleanup handler to remove cache on exit
+        atexit.register(shutil.rmtree, cache_dir, ignore_errors=True)
 
     # Set AWS environment variables if provided (for compatibility with other AWS tools)
     if config.endpoint_url:
@@ -132,9 +174,39 @@ def create_service(
         logger=logger,
         metrics=metrics,
         max_ratio=config.max_ratio,
+        verify_ttl=config.verify_ttl_seconds,
     )
 
 
+def get_service(ctx: click.Context) -> DeltaService:
+    """Return the command's DeltaService, creating it on first use.
+
+    Building the service sets up boto3 (loading its service models), which is
+    wasted work for ``--help`` or argument errors, so the group only records
+    the log level and the service is built when a command actually runs.
+    """
+    import logging
+
+    state = ctx.find_root().ensure_object(dict)
+    service: DeltaService | None = state.get("_service")
+    if service is None:
+        log_level = state.get("log_level") or os.environ.get("DG_LOG_LEVEL", "INFO")
+        service = create_service(log_level)
+        state["_service"] = service
+        logging.getLogger("deltaglider").info("deltaglider %s", __version__)
+    return service
+
+
+def pass_service(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Like ``click.pass_obj`` but passes the lazily created DeltaService."""
+
+    @click.pass_context
+    def new_func(ctx: click.Context, /, *args: Any, **kwargs: Any) -> Any:
+        return ctx.invoke(f, get_service(ctx), *args, **kwargs)
+
+    return functools.update_wrapper(new_func, f)
+
+
 def _version_callback(ctx: click.Context, param: click.Parameter, value: bool) -> None:
     """Callback for --version option."""
     if value:
@@ -155,11 +227,8 @@ def _version_callback(ctx: click.Context, param: click.Parameter, value: bool) -
 @click.pass_context
 def cli(ctx: click.Context, debug: bool) -> None:
     """DeltaGlider - Delta-aware S3 file storage wrapper."""
-    import logging
-
     log_level = "DEBUG" if debug else os.environ.get("DG_LOG_LEVEL", "INFO")
-    ctx.obj = create_service(log_level)
-    logging.getLogger("deltaglider").info("deltaglider %s", __version__)
+    ctx.obj = {"log_level": log_level, "_service": None}
 
 
 @cli.command()
@@ -174,7 +243,7 @@ def cli(ctx: click.Context, debug: bool) -> None:
 @click.option("--endpoint-url", help="Override S3 endpoint URL")
 @click.option("--region", help="AWS region")
 @click.option("--profile", help="AWS profile to use")
-@click.pass_obj
+@pass_service
 def cp(
     service: DeltaService,
     source: str,
@@ -243,6 +312,156 @@ def cp(
         sys.exit(1)
 
 
+# DeltaService of a put-many worker process, built once by _init_put_worker
+_worker_service: DeltaService | None = None
+
+
+def _init_put_worker(
+    log_level: str, endpoint_url: str | None, region: str | None, profile: str | None
+) -> None:
+    """Build the worker's own service; boto3 connections must not cross a fork."""
+    global _worker_service
+
+    # Pool workers leave through os._exit(), which skips atexit handlers, so the
+    # cache directory is removed by a multiprocessing finalizer instead.
+    cache_dir = _make_cache_dir()
+    multiprocessing.util.Finalize(
+        None, shutil.rmtree, args=(cache_dir,), kwargs={"ignore_errors": True}, exitpriority=10
+    )
+    _worker_service = create_service(log_level, endpoint_url, region, profile, cache_dir=cache_dir)
+
+
+def _put_worker(local_path: str, dest: str, max_ratio: float | None, no_delta: bool) -> str:
+    """Upload one file in a put-many worker process."""
+    assert _worker_service is not None, "put-many worker was not initialized"
+    return put_local_file(_worker_service, Path(local_path), dest, max_ratio, no_delta)
+
+
+@cli.command("put-many")
+@click.argument("dest")
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--jobs", "-j", type=click.IntRange(min=1), help="Worker processes (default: CPU count)"
+)
+@click.option("--quiet", "-q", is_flag=True, help="Suppress output")
+@click.option("--no-delta", is_flag=True, help="Disable delta compression")
+@click.option("--max-ratio", type=float, help="Max delta/file ratio (default: 0.5)")
+@click.option("--endpoint-url", help="Override S3 endpoint URL")
+@click.option("--region", help="AWS region")
+@click.option("--profile", help="AWS profile to use")
+@click.pass_context
+def put_many(
+    ctx: click.Context,
+    dest: str,
+    files: tuple[str, ...],
+    jobs: int | None,
+    quiet: bool,
+    no_delta: bool,
+    max_ratio: float | None,
+    endpoint_url: str | None,
+    region: str | None,
+    profile: str | None,
+) -> None:
+    """Upload many files to one S3 prefix using a pool of worker processes.
+
+    Replaces per-file invocations (xargs, GNU parallel) that pay interpreter
+    and boto3 startup for every file. Each worker builds one service and
+    reuses it, and xdelta3 encoding runs in parallel across files.
+
+    The first file is uploaded before the workers get any files so that the
+    deltaspace reference exists and workers never race to create it. Files
+    land at the prefix under their base name, so base names must be unique.
+
+    Examples:
+        deltaglider put-many s3://bucket/releases/ build/*.zip
+        deltaglider put-many -j 4 s3://bucket/releases/ a.zip b.zip c.zip
+    """
+    if not is_s3_path(dest):
+        click.echo(f"Error: Destination must be an S3 URL: {dest}", err=True)
+        sys.exit(1)
+    if not dest.endswith("/"):
+        dest += "/"
+
+    names = Counter(Path(path).name for path in files)
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    if duplicates:
+        click.echo(
+            f"Error: Files would overwrite each other at {dest}: {', '.join(duplicates)}",
+            err=True,
+        )
+        sys.exit(1)
+
+    log_level = ctx.find_root().ensure_object(dict).get("log_level") or os.environ.get(
+        "DG_LOG_LEVEL", "INFO"
+    )
+    if endpoint_url or region or profile:
+        service = create_service(log_level, endpoint_url, region, profile)
+    else:
+        service = get_service(ctx)
+
+    failures = 0
+
+    def report(path: str, put: Callable[[], str]) -> None:
+        nonlocal failures
+        try:
+            message = put()
+        except Exception as e:
+            failures += 1
+            click.echo(f"upload failed: '{path}': {e}", err=True)
+            return
+        if not quiet:
+            click.echo(message)
+
+    def target(path: str) -> str:
+        return dest + Path(path).name
+
+    first, rest = files[0], files[1:]
+    workers = min(jobs or os.cpu_count() or 1, len(rest))
+
+    with ExitStack() as stack:
+        pool: ProcessPoolExecutor | None = None
+        if workers > 1:
+            # fork lets workers inherit the already imported adapters copy-on-write
+            mp_context = multiprocessing.get_context("fork") if sys.platform == "linux" else None
+            pool = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=mp_context,
+                    initializer=_init_put_worker,
+                    initargs=(log_level, endpoint_url, region, profile),
+                )
+            )
+            # Fork every worker now, while this process is still single-threaded:
+            # the first upload starts the service's and the S3 adapter's thread
+            # pools, and forking a multi-threaded process can deadlock. With
+            # fork, the first task submitted launches all workers.
+            pool.submit(int).result()
+
+        report(
+            first, lambda: put_local_file(service, Path(first), target(first), max_ratio, no_delta)
+        )
+
+        if pool is None:
+            for path in rest:
+                report(
+                    path,
+                    functools.partial(
+                        put_local_file, service, Path(path), target(path), max_ratio, no_delta
+                    ),
+                )
+        else:
+            futures = {
+                pool.submit(_put_worker, path, target(path), max_ratio, no_delta): path
+                for path in rest
+            }
+            for future in as_completed(futures):
+                report(futures[future], future.result)
+
+    if failures:
+        click.echo(f"{failures} of {len(files)} uploads failed", err=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("s3_url", required=False)
 @click.option("--recursive", "-r", is_flag=True, help="List recursively")
@@ -251,7 +470,7 @@ def cp(
 @click.option("--endpoint-url", help="Override S3 endpoint URL")
 @click.option("--region", help="AWS region")
 @click.option("--profile", help="AWS profile to use")
-@click.pass_obj
+@pass_service
 def ls(
     service: DeltaService,
     s3_url: str | None,
@@ -399,7 +618,7 @@ def ls(
 @click.option("--endpoint-url", help="Override S3 endpoint URL")
 @click.option("--region", help="AWS region")
 @click.option("--profile", help="AWS profile to use")
-@click.pass_obj
+@pass_service
 def rm(
     service: DeltaService,
     s3_url: str,
@@ -545,7 +764,7 @@ def rm(
 @click.option("--endpoint-url", help="Override S3 endpoint URL")
 @click.option("--region", help="AWS region")
 @click.option("--profile", help="AWS profile to use")
-@click.pass_obj
+@pass_service
 def sync(
     service: DeltaService,
     source: str,
@@ -638,7 +857,7 @@ def sync(
 
 @cli.command()
 @click.argument("s3_url")
-@click.pass_obj
+@pass_service
 def verify(service: DeltaService, s3_url: str) -> None:
     """Verify integrity of delta file."""
     try:
@@ -661,7 +880,7 @@ def verify(service: DeltaService, s3_url: str) -> None:
             "message": result.message,
         }
 
-        click.echo(json.dumps(output, indent=2))
+        click.echo(_dumps_json(output))
 
         if not result.valid:
             sys.exit(1)
@@ -687,7 +906,7 @@ def verify(service: DeltaService, s3_url: str) -> None:
 @click.option("--endpoint-url", help="Override S3 endpoint URL")
 @click.option("--region", help="AWS region")
 @click.option("--profile", help="AWS profile to use")
-@click.pass_obj
+@pass_service
 def migrate(
     service: DeltaService,
     source: str,
@@ -774,7 +993,7 @@ def migrate(
 @click.option("--refresh", is_flag=True, help="Force cache refresh even if valid")
 @click.option("--no-cache", is_flag=True, help="Skip caching entirely (both read and write)")
 @click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
-@click.pass_obj
+@pass_service
 def stats(
     service: DeltaService,
     bucket: str,
@@ -875,7 +1094,7 @@ def stats(
                 "delta_objects": bucket_stats.delta_objects,
                 "direct_objects": bucket_stats.direct_objects,
             }
-            click.echo(json.dumps(output, indent=2))
+            click.echo(_dumps_json(output))
         else:
             # Human-readable output
             def format_bytes(size: float) -> str:
@@ -915,7 +1134,7 @@ def stats(
 @click.option("--endpoint-url", help="Override S3 endpoint URL")
 @click.option("--region", help="AWS region")
 @click.option("--profile", help="AWS profile to use")
-@click.pass_obj
+@pass_service
 def purge(
     service: DeltaService,
     bucket: str,
@@ -985,11 +1204,15 @@ def purge(
 
             for page in page_iterator:
                 for obj in page.get("Contents", []):
-                    # Get object metadata
-                    head_response = s3_client.head_object(Bucket=bucket, Key=obj["Key"])
-                    metadata = head_response.get("Metadata", {})
-
-                    expires_at_str = metadata.get("dg-expires-at")
+                    # Rehydrated keys lead with their expiry epoch; only older
+                    # flat keys need a HEAD to read dg-expires-at
+                    expires_at_str: str | None
+                    epoch, sep, _ = obj["Key"][len(prefix) :].partition("/")
+                    if sep and epoch.isdigit():
+                        expires_at_str = datetime.fromtimestamp(int(epoch), UTC).isoformat()
+                    else:
+                        head_response = s3_client.head_object(Bucket=bucket, Key=obj["Key"])
+                        expires_at_str = head_response.get("Metadata", {}).get("dg-expires-at")
                     if expires_at_str:
                         try:
                             expires_at = datetime.fromisoformat(
@@ -1019,7 +1242,7 @@ def purge(
                     "total_size_to_free": total_size,
                     "expired_files": expired_files[:10],  # Show first 10
                 }
-                click.echo(json.dumps(output, indent=2))
+                click.echo(_dumps_json(output))
             else:
                 click.echo(f"Dry run: Would delete {len(expired_files)} expired file(s)")
                 click.echo(f"Total space to free: {total_size:,} bytes")
@@ -1035,7 +1258,7 @@ def purge(
 
             if output_json:
                 # JSON output
-                click.echo(json.dumps(result, indent=2))
+                click.echo(_dumps_json(result))
             else:
                 # Human-readable output
                 click.echo(f"Purge Statistics for bucket: {bucket}")
@@ -1074,7 +1297,7 @@ def purge(
 @click.option("--endpoint-url", help="Override S3 endpoint URL")
 @click.option("--region", help="AWS region")
 @click.option("--profile", help="AWS profile to use")
-@click.pass_obj
+@pass_service
 def put_bucket_acl(
     service: DeltaService,
     bucket: str,
@@ -1154,7 +1377,7 @@ def put_bucket_acl(
 @click.option("--endpoint-url", help="Override S3 endpoint URL")
 @click.option("--region", help="AWS region")
 @click.option("--profile", help="AWS profile to use")
-@click.pass_obj
+@pass_service
 def get_bucket_acl(
     service: DeltaService,
     bucket: str,
@@ -1196,7 +1419,7 @@ def get_bucket_acl(
         response = client.get_bucket_acl(Bucket=bucket)
 
         # Output as JSON like aws s3api get-bucket-acl
-        click.echo(json.dumps(response, indent=2, default=str))
+        click.echo(_dumps_json(response, default=str))
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -2,9 +2,11 @@
 
 # ruff: noqa: I001
 import atexit
+import io
 import os
 import shutil
 import tempfile
+import time
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
@@ -66,12 +68,27 @@ class DeltaGliderClient:
     See BOTO3_COMPATIBILITY.md for complete compatibility matrix.
     """
 
-    def __init__(self, service: DeltaService, endpoint_url: str | None = None):
-        """Initialize client with service."""
+    def __init__(
+        self,
+        service: DeltaService,
+        endpoint_url: str | None = None,
+        stats_cache_ttl: float = 0.0,
+    ):
+        """Initialize client with service.
+
+        Args:
+            service: Core DeltaService
+            endpoint_url: Optional S3 endpoint URL
+            stats_cache_ttl: Seconds ``get_bucket_stats`` results are served from memory
+                without re-listing the bucket (0 disables)
+        """
         self.service = service
         self.endpoint_url = endpoint_url
+        self._stats_cache_ttl = stats_cache_ttl
         # Session-scoped bucket statistics cache (cleared with the client lifecycle)
         self._bucket_stats_cache: dict[str, dict[str, BucketStats]] = {}
+        # bucket -> mode -> monotonic time the entry was stored
+        self._bucket_stats_cached_at: dict[str, dict[str, float]] = {}
 
     # -------------------------------------------------------------------------
     # Internal helpers
@@ -81,8 +98,10 @@ class DeltaGliderClient:
         """Invalidate cached bucket statistics."""
         if bucket is None:
             self._bucket_stats_cache.clear()
+            self._bucket_stats_cached_at.clear()
         else:
             self._bucket_stats_cache.pop(bucket, None)
+            self._bucket_stats_cached_at.pop(bucket, None)
 
     def _store_bucket_stats_cache(
         self,
@@ -92,12 +111,17 @@ class DeltaGliderClient:
     ) -> None:
         """Store bucket statistics in the session cache."""
         bucket_cache = self._bucket_stats_cache.setdefault(bucket, {})
+        cached_at = self._bucket_stats_cached_at.setdefault(bucket, {})
+        now = time.monotonic()
         bucket_cache[mode] = stats
+        cached_at[mode] = now
         if mode == "detailed":
             bucket_cache["sampled"] = stats
             bucket_cache["quick"] = stats
-        elif mode == "sampled":
-            bucket_cache.setdefault("quick", stats)
+            cached_at["sampled"] = cached_at["quick"] = now
+        elif mode == "sampled" and "quick" not in bucket_cache:
+            bucket_cache["quick"] = stats
+            cached_at["quick"] = now
 
     def _get_cached_bucket_stats(self, bucket: str, mode: StatsMode) -> BucketStats | None:
         """Retrieve cached stats for a bucket, preferring more detailed metrics when available."""
@@ -112,20 +136,34 @@ class DeltaGliderClient:
             bucket_cache.get("quick") or bucket_cache.get("sampled") or bucket_cache.get("detailed")
         )
 
-    def _get_cached_bucket_stats_for_listing(
-        self, bucket: str
-    ) -> tuple[BucketStats | None, StatsMode | None]:
-        """Return best cached stats for bucket listings."""
-        bucket_cache = self._bucket_stats_cache.get(bucket)
-        if not bucket_cache:
-            return (None, None)
-        if "detailed" in bucket_cache:
-            return (bucket_cache["detailed"], "detailed")
-        if "sampled" in bucket_cache:
-            return (bucket_cache["sampled"], "sampled")
-        if "quick" in bucket_cache:
-            return (bucket_cache["quick"], "quick")
-        return (None, None)
+    def _get_fresh_bucket_stats(self, bucket: str, mode: StatsMode) -> BucketStats | None:
+        """Return session-cached stats for ``mode`` stored less than the stats TTL ago."""
+        if self._stats_cache_ttl <= 0:
+            return None
+        cached_at = self._bucket_stats_cached_at.get(bucket)
+        stats = self._get_cached_bucket_stats(bucket, mode)
+        if stats is None or not cached_at:
+            return None
+        stored = cached_at.get(mode)
+        if stored is None or time.monotonic() - stored >= self._stats_cache_ttl:
+            return None
+        return stats
+
+    def _get_cached_bucket_stats_bulk(
+        self, names: list[str]
+    ) -> dict[str, tuple[BucketStats, StatsMode]]:
+        """Return best cached stats for many buckets at once, omitting misses."""
+        hits: dict[str, tuple[BucketStats, StatsMode]] = {}
+        for name in names:
+            bucket_cache = self._bucket_stats_cache.get(name)
+            if not bucket_cache:
+                continue
+            for mode in ("detailed", "sampled", "quick"):
+                stats = bucket_cache.get(mode)
+                if stats is not None:
+                    hits[name] = (stats, mode)
+                    break
+        return hits
 
     # ============================================================================
     # Boto3-compatible APIs (matches S3 client interface)
@@ -165,26 +203,24 @@ class DeltaGliderClient:
         if Body is None:
             raise ValueError("Body parameter is required")
 
-        # Write body to a temporary file for DeltaService.put()
+        # Write body to a temporary file for DeltaService.put(), hashing it on
+        # the way so put() doesn't have to read the file back
         with tempfile.NamedTemporaryFile(delete=False, suffix=Path(Key).suffix) as tmp_file:
             tmp_path = Path(tmp_file.name)
 
-            # Write Body to temp file
-            if isinstance(Body, bytes):
-                tmp_file.write(Body)
-            elif isinstance(Body, str):
-                tmp_file.write(Body.encode("utf-8"))
-            elif isinstance(Body, Path):
-                tmp_file.write(Body.read_bytes())
-            else:
-                # Handle any other type by converting to string path
-                path_str = str(Body)
-                try:
-                    tmp_file.write(Path(path_str).read_bytes())
-                except Exception as e:
-                    raise ValueError(
-                        f"Invalid Body parameter: cannot read from {path_str}: {e}"
-                    ) from e
+        if isinstance(Body, bytes):
+            file_sha256 = self.service.write_and_hash(io.BytesIO(Body), tmp_path)
+        elif isinstance(Body, str):
+            file_sha256 = self.service.write_and_hash(io.BytesIO(Body.encode("utf-8")), tmp_path)
+        else:
+            # Path, or any other type converted to a string path
+            path_str = str(Body)
+            try:
+                with open(path_str, "rb") as body_file:
+                    file_sha256 = self.service.write_and_hash(body_file, tmp_path)
+            except Exception as e:
+                tmp_path.unlink(missing_ok=True)
+                raise ValueError(f"Invalid Body parameter: cannot read from {path_str}: {e}") from e
 
         try:
             # Extract deltaspace prefix from Key
@@ -209,10 +245,12 @@ class DeltaGliderClient:
             delta_space = DeltaSpace(bucket=Bucket, prefix=prefix)
 
             # Use the service to put the file (handles delta compression automatically)
-            summary = self.service.put(tmp_path, delta_space, max_ratio=0.5)
+            summary = self.service.put(
+                tmp_path, delta_space, max_ratio=0.5, precomputed_sha256=file_sha256
+            )
 
-            # Calculate ETag from file content
-            sha256_hash = self.service.hasher.sha256(tmp_path)
+            # ETag is the content SHA256, already computed by the service during put
+            sha256_hash = summary.file_sha256
 
             # Build DeltaGlider compression info
             deltaglider_info: dict[str, Any] = {
@@ -972,6 +1010,9 @@ class DeltaGliderClient:
             - ``detailed``: Fetch metadata for every delta object (slowest, most accurate).
 
         Caching:
+            - With a stats TTL (``stats_cache_ttl`` / ``DG_STATS_CACHE_TTL``), results are
+              served from memory for that many seconds without listing the bucket;
+              writes through this client invalidate them
             - Stats are cached in S3 at ``.deltaglider/stats_{mode}.json``
             - Cache is automatically validated on every call (uses LIST operation)
             - If bucket changed, cache is recomputed automatically
@@ -1009,10 +1050,17 @@ class DeltaGliderClient:
         if mode not in {"quick", "sampled", "detailed"}:
             raise ValueError(f"Unknown stats mode: {mode}")
 
-        # Use S3-based caching from stats.py (replaces old in-memory cache)
+        if use_cache and not refresh_cache:
+            fresh = self._get_fresh_bucket_stats(bucket, mode)
+            if fresh is not None:
+                return fresh
+
+        # Use S3-based caching from stats.py
         result: BucketStats = _get_bucket_stats(
             self, bucket, mode=mode, use_cache=use_cache, refresh_cache=refresh_cache
         )
+        if self._stats_cache_ttl > 0:
+            self._store_bucket_stats_cache(bucket, mode, result)
         return result
 
     def generate_presigned_url(
@@ -1440,6 +1488,7 @@ def create_client(
         >>> print(f"Expected compression: {estimate.estimated_ratio:.1%}")
     """
     # Import here to avoid circular dependency
+    from .core.config import DeltaGliderConfig
     from .adapters import (
         ContentAddressedCache,
         EncryptedCache,
@@ -1496,6 +1545,9 @@ def create_client(
     # Get default values (use real package version)
     tool_version = kwargs.pop("tool_version", f"deltaglider/{__version__}")
     max_ratio = kwargs.pop("max_ratio", 0.5)
+    config = DeltaGliderConfig.from_env()
+    verify_ttl = kwargs.pop("verify_ttl", config.verify_ttl_seconds)
+    stats_cache_ttl = kwargs.pop("stats_cache_ttl", config.stats_cache_ttl_seconds)
 
     # Create service
     service = DeltaService(
@@ -1508,7 +1560,8 @@ def create_client(
         metrics=metrics,
         tool_version=tool_version,
         max_ratio=max_ratio,
+        verify_ttl=verify_ttl,
         **kwargs,
     )
 
-    return DeltaGliderClient(service, endpoint_url)
+    return DeltaGliderClient(service, endpoint_url, stats_cache_ttl=stats_cache_ttl)
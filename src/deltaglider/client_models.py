@@ -45,7 +45,7 @@ class CompressionEstimate:
     should_use_delta: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectInfo:
     """Detailed object information with compression stats."""
 
@@ -8,11 +8,68 @@ This module contains boto3-compatible bucket operations:
 - get_bucket_acl
 """
 
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Protocol
+
+from botocore.exceptions import ClientError
+
+from ..client_models import BucketStats
+from ..core import DeltaService
+
+
+class BucketOpsClient(Protocol):
+    """The part of DeltaGliderClient that bucket operations rely on.
+
+    Typing against this instead of ``Any`` avoids the circular import with
+    ``client.py`` while keeping attribute access checked.
+    """
+
+    service: DeltaService
+
+    def _get_cached_bucket_stats_bulk(
+        self, names: list[str]
+    ) -> Mapping[str, tuple[BucketStats, str]]: ...
+
+
+_BUCKET_EXISTS_CODES = frozenset({"BucketAlreadyExists", "BucketAlreadyOwnedByYou"})
+
+
+def _native_client(client: BucketOpsClient) -> Any | None:
+    """Return the boto3 client behind the storage adapter, or None if unsupported.
+
+    Adapters advertising ``supports_native_bucket_ops`` expose it via
+    ``boto_client``; anything else falls back to a plain ``client`` attribute.
+    """
+    storage_adapter = client.service.storage
+    if getattr(type(storage_adapter), "supports_native_bucket_ops", False):
+        return getattr(storage_adapter, "boto_client", None)
+    return getattr(storage_adapter, "client", None)
+
+
+def _with_cached_stats(
+    bucket_entry: dict[str, Any], cached: tuple[BucketStats, str] | None
+) -> dict[str, Any]:
+    """Annotate a list_buckets entry in place with cached DeltaGlider stats, if any."""
+    if cached is None:
+        return bucket_entry
+    cached_stats, cached_mode = cached
+    bucket_entry["DeltaGliderStats"] = {
+        "Cached": True,
+        "Mode": cached_mode,
+        "Detailed": cached_mode == "detailed",
+        "ObjectCount": cached_stats.object_count,
+        "TotalSize": cached_stats.total_size,
+        "CompressedSize": cached_stats.compressed_size,
+        "SpaceSaved": cached_stats.space_saved,
+        "AverageCompressionRatio": cached_stats.average_compression_ratio,
+        "DeltaObjects": cached_stats.delta_objects,
+        "DirectObjects": cached_stats.direct_objects,
+    }
+    return bucket_entry
 
 
 def create_bucket(
-    client: Any,  # DeltaGliderClient (avoiding circular import)
+    client: BucketOpsClient,
     Bucket: str,
     CreateBucketConfiguration: dict[str, str] | None = None,
     **kwargs: Any,
@@ -37,25 +94,22 @@ def create_bucket(
         ...     CreateBucketConfiguration={'LocationConstraint': 'us-west-2'}
         ... )
     """
-    storage_adapter = client.service.storage
-
-    # Check if storage adapter has boto3 client
-    if hasattr(storage_adapter, "client"):
+    boto = _native_client(client)
+    if boto is not None:
         try:
             params: dict[str, Any] = {"Bucket": Bucket}
             if CreateBucketConfiguration:
                 params["CreateBucketConfiguration"] = CreateBucketConfiguration
 
-            response = storage_adapter.client.create_bucket(**params)
+            response = boto.create_bucket(**params)
             return {
                 "Location": response.get("Location", f"/{Bucket}"),
                 "ResponseMetadata": {
                     "HTTPStatusCode": 200,
                 },
             }
-        except Exception as e:
-            error_msg = str(e)
-            if "BucketAlreadyExists" in error_msg or "BucketAlreadyOwnedByYou" in error_msg:
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") in _BUCKET_EXISTS_CODES:
                 # Bucket already exists - return success
                 client.service.logger.debug(f"Bucket {Bucket} already exists")
                 return {
@@ -65,12 +119,14 @@ def create_bucket(
                     },
                 }
             raise RuntimeError(f"Failed to create bucket: {e}") from e
+        except Exception as e:
+            raise RuntimeError(f"Failed to create bucket: {e}") from e
     else:
         raise NotImplementedError("Storage adapter does not support bucket creation")
 
 
 def delete_bucket(
-    client: Any,  # DeltaGliderClient
+    client: BucketOpsClient,
     Bucket: str,
     **kwargs: Any,
 ) -> dict[str, Any]:
@@ -90,20 +146,17 @@ def delete_bucket(
         >>> client = create_client()
         >>> client.delete_bucket(Bucket='my-bucket')
     """
-    storage_adapter = client.service.storage
-
-    # Check if storage adapter has boto3 client
-    if hasattr(storage_adapter, "client"):
+    boto = _native_client(client)
+    if boto is not None:
         try:
-            storage_adapter.client.delete_bucket(Bucket=Bucket)
+            boto.delete_bucket(Bucket=Bucket)
             return {
                 "ResponseMetadata": {
                     "HTTPStatusCode": 204,
                 },
             }
-        except Exception as e:
-            error_msg = str(e)
-            if "NoSuchBucket" in error_msg:
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") == "NoSuchBucket":
                 # Bucket doesn't exist - return success
                 client.service.logger.debug(f"Bucket {Bucket} does not exist")
                 return {
@@ -112,12 +165,14 @@ def delete_bucket(
                     },
                 }
             raise RuntimeError(f"Failed to delete bucket: {e}") from e
+        except Exception as e:
+            raise RuntimeError(f"Failed to delete bucket: {e}") from e
     else:
         raise NotImplementedError("Storage adapter does not support bucket deletion")
 
 
 def list_buckets(
-    client: Any,  # DeltaGliderClient
+    client: BucketOpsClient,
     **kwargs: Any,
 ) -> dict[str, Any]:
     """List all S3 buckets (boto3-compatible).
@@ -135,34 +190,18 @@ def list_buckets(
         >>> for bucket in response['Buckets']:
         ...     print(bucket['Name'])
     """
-    storage_adapter = client.service.storage
-
-    # Check if storage adapter has boto3 client
-    if hasattr(storage_adapter, "client"):
+    boto = _native_client(client)
+    if boto is not None:
         try:
-            raw_response = storage_adapter.client.list_buckets()
-
-            buckets: list[dict[str, Any]] = []
-            for bucket_entry in raw_response.get("Buckets", []):
-                bucket_data = dict(bucket_entry)
-                name = bucket_data.get("Name")
-                if isinstance(name, str) and name:
-                    cached_stats, cached_mode = client._get_cached_bucket_stats_for_listing(name)
-                    if cached_stats is not None and cached_mode is not None:
-                        bucket_data["DeltaGliderStats"] = {
-                            "Cached": True,
-                            "Mode": cached_mode,
-                            "Detailed": cached_mode == "detailed",
-                            "ObjectCount": cached_stats.object_count,
-                            "TotalSize": cached_stats.total_size,
-                            "CompressedSize": cached_stats.compressed_size,
-                            "SpaceSaved": cached_stats.space_saved,
-                            "AverageCompressionRatio": cached_stats.average_compression_ratio,
-                            "DeltaObjects": cached_stats.delta_objects,
-                            "DirectObjects": cached_stats.direct_objects,
-                        }
-
-                buckets.append(bucket_data)
+            raw_response = boto.list_buckets()
+
+            raw_buckets = raw_response.get("Buckets", [])
+            names = [name for b in raw_buckets if isinstance(name := b.get("Name"), str) and name]
+            cached = client._get_cached_bucket_stats_bulk(names)
+
+            buckets: list[dict[str, Any]] = [
+                _with_cached_stats(entry, cached.get(entry.get("Name"))) for entry in raw_buckets
+            ]
 
             return {
                 "Buckets": buckets,
@@ -178,7 +217,7 @@ def list_buckets(
 
 
 def put_bucket_acl(
-    client: Any,  # DeltaGliderClient (avoiding circular import)
+    client: BucketOpsClient,
     Bucket: str,
     ACL: str | None = None,
     AccessControlPolicy: dict[str, Any] | None = None,
@@ -210,9 +249,8 @@ def put_bucket_acl(
         >>> client = create_client()
         >>> client.put_bucket_acl(Bucket='my-bucket', ACL='public-read')
     """
-    storage_adapter = client.service.storage
-
-    if hasattr(storage_adapter, "client"):
+    boto = _native_client(client)
+    if boto is not None:
         try:
             params: dict[str, Any] = {"Bucket": Bucket}
             if ACL is not None:
@@ -230,7 +268,7 @@ def put_bucket_acl(
             if GrantWriteACP is not None:
                 params["GrantWriteACP"] = GrantWriteACP
 
-            storage_adapter.client.put_bucket_acl(**params)
+            boto.put_bucket_acl(**params)
             return {
                 "ResponseMetadata": {
                     "HTTPStatusCode": 200,
@@ -243,7 +281,7 @@ def put_bucket_acl(
 
 
 def get_bucket_acl(
-    client: Any,  # DeltaGliderClient (avoiding circular import)
+    client: BucketOpsClient,
     Bucket: str,
     **kwargs: Any,
 ) -> dict[str, Any]:
@@ -263,11 +301,10 @@ def get_bucket_acl(
         >>> print(response['Owner'])
         >>> print(response['Grants'])
     """
-    storage_adapter = client.service.storage
-
-    if hasattr(storage_adapter, "client"):
+    boto = _native_client(client)
+    if boto is not None:
         try:
-            response: dict[str, Any] = storage_adapter.client.get_bucket_acl(Bucket=Bucket)
+            response: dict[str, Any] = boto.get_bucket_acl(Bucket=Bucket)
             return response
         except Exception as e:
             raise RuntimeError(f"Failed to get bucket ACL: {e}") from e
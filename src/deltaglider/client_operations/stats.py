@@ -8,9 +8,14 @@ This module contains DeltaGlider-specific statistics operations:
 """
 
 import concurrent.futures
+import heapq
 import json
+import operator
+import posixpath
 import re
-from dataclasses import asdict
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -18,7 +23,7 @@ from typing import Any, Literal
 from ..client_models import BucketStats, CompressionEstimate, ObjectInfo
 from ..core.delta_extensions import is_delta_candidate
 from ..core.models import resolve_metadata
-from ..core.object_listing import list_all_objects
+from ..core.object_listing import ObjectListing, iter_all_objects
 from ..core.s3_uri import parse_s3_url
 
 StatsMode = Literal["quick", "sampled", "detailed"]
@@ -26,11 +31,33 @@ StatsMode = Literal["quick", "sampled", "detailed"]
 # Cache configuration
 CACHE_VERSION = "1.0"
 CACHE_PREFIX = ".deltaglider"
+_INTERNAL_PREFIX = f"{CACHE_PREFIX}/"
+_INTERNAL_PREFIX_LEN = len(_INTERNAL_PREFIX)
 
 # Listing limits (prevent runaway scans on gigantic buckets)
 QUICK_LIST_LIMIT = 60_000
 SAMPLED_LIST_LIMIT = 30_000
 
+# HEAD concurrency when the storage adapter does not report its connection pool size
+DEFAULT_METADATA_WORKERS = 10
+# Stop waiting for delta metadata once more than half of at least this many HEADs failed
+METADATA_FAIL_FAST_MIN_RESPONSES = 100
+# Concurrent prefix listings for large buckets (see iter_all_objects)
+MAX_LIST_CONCURRENCY = 8
+
+# Object classes used by the stats passes (see _classify)
+_OBJ_DIRECT = 0
+_OBJ_DELTA = 1
+_OBJ_REFERENCE = 2
+# DeltaGlider's own bookkeeping under CACHE_PREFIX (this stats cache, rehydrated
+# temp files): neither user data nor part of the cache validation
+_OBJ_INTERNAL = 3
+
+# Version-looking token in a file name (find_similar_files scoring)
+_VERSION_RE = re.compile(r"v?\d+[.\d]*")
+# Keys that can never serve as a reference: deltas, references and folder markers
+_NON_CANDIDATE_SUFFIXES = (".delta", "reference.bin", "/")
+
 # ============================================================================
 # Internal Helper Functions
 # ============================================================================
@@ -45,75 +72,231 @@ def _first_metadata_value(metadata: dict[str, Any], *keys: str) -> str | None:
     return None
 
 
-def _fetch_delta_metadata(
-    client: Any,
-    bucket: str,
-    delta_keys: list[str],
-    max_timeout: int = 600,
-) -> dict[str, dict[str, Any]]:
-    """Fetch metadata for delta files in parallel with timeout.
-
-    Args:
-        client: DeltaGliderClient instance
-        bucket: S3 bucket name
-        delta_keys: List of delta file keys
-        max_timeout: Maximum total timeout in seconds (default: 600 = 10 min)
+def _metadata_fetch_workers(storage: Any) -> int:
+    """Number of concurrent HEADs: as many as the storage connection pool can serve.
 
-    Returns:
-        Dict mapping delta key -> metadata dict
+    More threads than pooled connections would only queue for a connection (or
+    open throwaway ones, with a fresh TLS handshake each).
     """
-    metadata_map: dict[str, dict[str, Any]] = {}
+    pool_size = getattr(storage, "max_pool_connections", None)
+    if isinstance(pool_size, int) and pool_size > 0:
+        return pool_size
+    return DEFAULT_METADATA_WORKERS
+
 
-    if not delta_keys:
-        return metadata_map
+@dataclass(frozen=True, slots=True)
+class _DeltaMeta:
+    """Delta metadata parsed once into the fields stats needs (None if unknown)."""
 
-    client.service.logger.info(
-        f"Fetching metadata for {len(delta_keys)} delta files in parallel..."
+    file_size: int | None
+    ratio: float | None
+    ref_key: str | None
+
+
+def _parse_delta_meta(key: str, metadata: dict[str, Any], logger: Any) -> _DeltaMeta:
+    """Parse raw HEAD metadata (or a stored index entry) into a ``_DeltaMeta``.
+
+    Parse failures are logged here, once per record, so the aggregation loop
+    only reads typed fields.
+    """
+    file_size: int | None = None
+    original_size_raw = _first_metadata_value(
+        metadata,
+        "dg-file-size",
+        "dg_file_size",
+        "file_size",
+        "file-size",
+        "deltaglider-original-size",
     )
+    if original_size_raw is None:
+        logger.warning(
+            f"Delta {key}: metadata missing file size. Available keys: {list(metadata.keys())}. Using None as original_size (unknown)"
+        )
+    else:
+        try:
+            file_size = int(original_size_raw)
+            logger.debug(f"Delta {key}: using original_size={file_size} from metadata")
+        except (ValueError, TypeError) as e:
+            logger.warning(
+                f"Delta {key}: failed to parse file size from metadata: {e}. Using None as original_size (unknown)"
+            )
 
-    def fetch_single_metadata(key: str) -> tuple[str, dict[str, Any] | None]:
+    ratio: float | None = None
+    ratio_raw = metadata.get("compression_ratio")
+    if ratio_raw not in (None, ""):
         try:
-            obj_head = client.service.storage.head(f"{bucket}/{key}")
-            if obj_head and obj_head.metadata:
-                return key, obj_head.metadata
-        except Exception as e:
-            client.service.logger.debug(f"Failed to fetch metadata for {key}: {e}")
-        return key, None
+            ratio = float(ratio_raw)
+        except (ValueError, TypeError):
+            logger.debug(f"Delta {key}: ignoring unparsable compression_ratio {ratio_raw!r}")
+
+    ref_key = _first_metadata_value(metadata, "dg-ref-key", "dg_ref_key", "ref_key", "ref-key")
+    return _DeltaMeta(file_size=file_size, ratio=ratio, ref_key=ref_key)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=min(10, len(delta_keys))) as executor:
-        futures = [executor.submit(fetch_single_metadata, key) for key in delta_keys]
 
-        # Calculate timeout: 60s per file, capped at max_timeout
+def _head_metadata(client: Any, bucket: str, key: str) -> _DeltaMeta | None:
+    """HEAD one delta and parse its metadata (None if it has none; HEAD errors propagate).
+
+    Runs on the metadata worker threads, so parsing happens off the listing loop.
+    """
+    obj_head = client.service.storage.head(f"{bucket}/{key}")
+    if obj_head and obj_head.metadata:
+        return _parse_delta_meta(key, obj_head.metadata, client.service.logger)
+    return None
+
+
+def _index_entry(etag: str, meta: _DeltaMeta) -> dict[str, Any]:
+    """Serialize parsed delta metadata for the stored index, tagged with the object's ETag."""
+    return {
+        "etag": etag,
+        "file_size": meta.file_size,
+        "ref_key": meta.ref_key,
+        "compression_ratio": meta.ratio,
+    }
+
+
+class _DeltaMetadataPrefetcher:
+    """Resolve delta metadata while the bucket listing is still streaming.
+
+    Deltas are fed in as LIST pages arrive. S3 LIST does not return user
+    metadata, so a previous run's HEAD results are kept in the stats cache keyed
+    by ETag (see ``_index_entry``); deltas whose ETag still matches are served
+    from that index. The rest are HEADed right away on a thread pool, so HEAD
+    latency overlaps the remaining LIST pages instead of following them.
+
+    In sampled mode only the first delta of each deltaspace is resolved.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        index: dict[str, dict[str, Any]] | None = None,
+        sampled: bool = False,
+    ) -> None:
+        self._client = client
+        self._bucket = bucket
+        self._index = index or {}
+        self._sampled = sampled
+        self._seen_spaces: set[str] = set()
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._futures: dict[concurrent.futures.Future[Any], tuple[str, str]] = {}  # -> key, etag
+        self.keys: list[str] = []  # deltas resolved, in listing order
+        self.metadata_map: dict[str, _DeltaMeta] = {}
+        self.index_entries: dict[str, dict[str, Any]] = {}
+
+    def add(self, obj: dict[str, Any]) -> None:
+        """Start resolving metadata for one listed delta."""
+        key = obj["key"]
+        if self._sampled:
+            space = _extract_deltaspace(key)
+            if space in self._seen_spaces:
+                return
+            self._seen_spaces.add(space)
+        self.keys.append(key)
+
+        etag = obj.get("etag") or ""
+        entry = self._index.get(key)
+        if etag and entry is not None and entry.get("etag") == etag:
+            self.index_entries[key] = entry
+            self.metadata_map[key] = _parse_delta_meta(key, entry, self._client.service.logger)
+            return
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_metadata_fetch_workers(self._client.service.storage)
+            )
+        future = self._executor.submit(_head_metadata, self._client, self._bucket, key)
+        self._futures[future] = (key, etag)
+
+    def cancel(self) -> None:
+        """Drop HEADs that are no longer needed (e.g. cached stats were valid)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def results(
+        self, max_timeout: float = 600
+    ) -> tuple[dict[str, _DeltaMeta], dict[str, dict[str, Any]]]:
+        """Wait for outstanding HEADs.
+
+        Gives up early, keeping what it has, once at least
+        ``METADATA_FAIL_FAST_MIN_RESPONSES`` HEADs have completed and more than
+        half of them failed (e.g. S3 throttling), instead of waiting out the
+        full timeout.
+
+        Args:
+            max_timeout: Maximum total timeout in seconds (default: 600 = 10 min)
+
+        Returns:
+            Tuple of (key -> parsed metadata, index entries for the resolved deltas)
+        """
+        if not self._futures:
+            return self.metadata_map, self.index_entries
+
+        if len(self.metadata_map):
+            self._client.service.logger.info(
+                f"Reusing cached metadata for {len(self.metadata_map)} unchanged delta files"
+            )
+        self._client.service.logger.info(
+            f"Fetching metadata for {len(self._futures)} delta files in parallel..."
+        )
+
+        # One deadline for the whole wait: 60s per file, capped at max_timeout.
+        # as_completed enforces it and only yields finished futures, so result()
+        # never blocks; a HEAD error it re-raises is counted as a failure below.
         timeout_per_file = 60
-        total_timeout = min(len(delta_keys) * timeout_per_file, max_timeout)
+        total_timeout = min(len(self._futures) * timeout_per_file, max_timeout)
+        fetched = done = failed = 0
+        logger = self._client.service.logger
 
         try:
-            for future in concurrent.futures.as_completed(futures, timeout=total_timeout):
+            for future in concurrent.futures.as_completed(self._futures, timeout=total_timeout):
+                done += 1
+                key, etag = self._futures[future]
                 try:
-                    key, metadata = future.result(timeout=5)  # 5s per result
-                    if metadata:
-                        metadata_map[key] = metadata
-                except concurrent.futures.TimeoutError:
-                    client.service.logger.warning("Timeout fetching metadata for a delta file")
+                    meta = future.result()
+                except Exception as e:
+                    failed += 1
+                    logger.debug(f"Failed to fetch metadata for {key}: {e}")
+                    if done >= METADATA_FAIL_FAST_MIN_RESPONSES and failed * 2 > done:
+                        logger.warning(
+                            f"Delta metadata fetch: {failed}/{done} HEAD requests failed. "
+                            f"Storage looks degraded; skipping the remaining "
+                            f"{len(self._futures) - done} and continuing with partial metadata..."
+                        )
+                        break
                     continue
+                if meta is not None:
+                    fetched += 1
+                    self.metadata_map[key] = meta
+                    if etag:
+                        self.index_entries[key] = _index_entry(etag, meta)
         except concurrent.futures.TimeoutError:
-            client.service.logger.warning(
-                f"_fetch_delta_metadata: Timeout after {total_timeout}s. "
-                f"Fetched {len(metadata_map)}/{len(delta_keys)} metadata entries. "
+            self._client.service.logger.warning(
+                f"Delta metadata fetch: Timeout after {total_timeout}s. "
+                f"Fetched {fetched}/{len(self._futures)} metadata entries. "
                 f"Continuing with partial metadata..."
             )
+        finally:
             # Cancel remaining futures
-            for future in futures:
-                future.cancel()
+            self.cancel()
 
-    return metadata_map
+        return self.metadata_map, self.index_entries
 
 
 def _extract_deltaspace(key: str) -> str:
     """Return the delta space (prefix) for a given object key."""
-    if "/" in key:
-        return key.rsplit("/", 1)[0]
-    return ""
+    slash = key.rfind("/")
+    return key[:slash] if slash >= 0 else ""
+
+
+def _classify(key: str) -> int:
+    """Classify a key as ``_OBJ_DELTA``, ``_OBJ_REFERENCE`` or ``_OBJ_DIRECT``."""
+    if key.endswith(".delta"):
+        return _OBJ_DELTA
+    # Slice compares avoid a method call per object; references are rare
+    if key[-14:] == "/reference.bin" or key == "reference.bin":
+        return _OBJ_REFERENCE
+    return _OBJ_DIRECT
 
 
 def _get_cache_key(mode: StatsMode) -> str:
@@ -128,12 +311,12 @@ def _get_cache_key(mode: StatsMode) -> str:
     return f"{CACHE_PREFIX}/stats_{mode}.json"
 
 
-def _read_stats_cache(
+def _load_stats_cache(
     client: Any,
     bucket: str,
     mode: StatsMode,
-) -> tuple[BucketStats | None, dict[str, Any] | None]:
-    """Read cached stats from S3 if available.
+) -> dict[str, Any] | None:
+    """Fetch and parse the cache file for ``mode``, once per stats run.
 
     Args:
         client: DeltaGliderClient instance
@@ -141,63 +324,116 @@ def _read_stats_cache(
         mode: Stats mode to read cache for
 
     Returns:
-        Tuple of (BucketStats | None, validation_data | None)
-        Returns (None, None) if cache doesn't exist or is invalid
+        The parsed cache document, or None if it doesn't exist, can't be parsed
+        or was written for another cache version or mode
     """
     cache_key = _get_cache_key(mode)
 
     try:
         # Try to read cache file from S3
-        obj = client.service.storage.get(f"{bucket}/{cache_key}")
-        if not obj or not obj.data:
-            return None, None
+        with closing(client.service.storage.get(f"{bucket}/{cache_key}")) as body:
+            raw = body.read()
+        if not raw:
+            return None
 
         # Parse JSON
-        cache_data = json.loads(obj.data.decode("utf-8"))
+        cache_data: dict[str, Any] = json.loads(raw.decode("utf-8"))
+    except FileNotFoundError:
+        # Cache doesn't exist yet - this is normal
+        client.service.logger.debug(f"No cache found for {bucket} (mode={mode})")
+        return None
+    except json.JSONDecodeError as e:
+        client.service.logger.warning(f"Invalid JSON in cache file: {e}")
+        return None
+    except Exception as e:
+        client.service.logger.warning(f"Error reading cache: {e}")
+        return None
 
-        # Validate version
-        if cache_data.get("version") != CACHE_VERSION:
-            client.service.logger.warning(
-                f"Cache version mismatch: expected {CACHE_VERSION}, got {cache_data.get('version')}"
-            )
-            return None, None
+    # Validate version
+    if cache_data.get("version") != CACHE_VERSION:
+        client.service.logger.warning(
+            f"Cache version mismatch: expected {CACHE_VERSION}, got {cache_data.get('version')}"
+        )
+        return None
 
-        # Validate mode
-        if cache_data.get("mode") != mode:
-            client.service.logger.warning(
-                f"Cache mode mismatch: expected {mode}, got {cache_data.get('mode')}"
-            )
-            return None, None
+    # Validate mode
+    if cache_data.get("mode") != mode:
+        client.service.logger.warning(
+            f"Cache mode mismatch: expected {mode}, got {cache_data.get('mode')}"
+        )
+        return None
 
-        # Extract stats and validation data
-        stats_dict = cache_data.get("stats")
-        validation_data = cache_data.get("validation")
+    return cache_data
 
-        if not stats_dict or not validation_data:
-            client.service.logger.warning("Cache missing stats or validation data")
-            return None, None
 
-        # Reconstruct BucketStats from dict
-        stats = BucketStats(**stats_dict)
+def _stats_from_cache(
+    client: Any,
+    bucket: str,
+    mode: StatsMode,
+    cache_data: dict[str, Any] | None,
+) -> tuple[BucketStats | None, dict[str, Any] | None]:
+    """Extract cached stats and their validation data from a loaded cache document.
 
-        client.service.logger.debug(
-            f"Successfully read cache for {bucket} (mode={mode}, "
-            f"computed_at={cache_data.get('computed_at')})"
-        )
+    Returns:
+        Tuple of (BucketStats | None, validation_data | None)
+        Returns (None, None) if there is no cache or it is invalid
+    """
+    if cache_data is None:
+        return None, None
 
-        return stats, validation_data
+    # Extract stats and validation data
+    stats_dict = cache_data.get("stats")
+    validation_data = cache_data.get("validation")
 
-    except FileNotFoundError:
-        # Cache doesn't exist yet - this is normal
-        client.service.logger.debug(f"No cache found for {bucket} (mode={mode})")
-        return None, None
-    except json.JSONDecodeError as e:
-        client.service.logger.warning(f"Invalid JSON in cache file: {e}")
+    if not stats_dict or not validation_data:
+        client.service.logger.warning("Cache missing stats or validation data")
         return None, None
+
+    try:
+        # Reconstruct BucketStats from dict
+        stats = BucketStats(**stats_dict)
     except Exception as e:
         client.service.logger.warning(f"Error reading cache: {e}")
         return None, None
 
+    client.service.logger.debug(
+        f"Successfully read cache for {bucket} (mode={mode}, "
+        f"computed_at={cache_data.get('computed_at')})"
+    )
+
+    return stats, validation_data
+
+
+def _delta_metadata_index_from_cache(
+    cache_data: dict[str, Any] | None,
+) -> dict[str, dict[str, Any]]:
+    """Extract the per-delta metadata index from a loaded cache document.
+
+    Returns:
+        Dict of delta key -> index entry, empty if there is no usable cache
+    """
+    index = cache_data.get("delta_metadata") if cache_data is not None else None
+    return index if isinstance(index, dict) else {}
+
+
+def _read_stats_cache(
+    client: Any,
+    bucket: str,
+    mode: StatsMode,
+) -> tuple[BucketStats | None, dict[str, Any] | None]:
+    """Read cached stats from S3 if available.
+
+    Args:
+        client: DeltaGliderClient instance
+        bucket: S3 bucket name
+        mode: Stats mode to read cache for
+
+    Returns:
+        Tuple of (BucketStats | None, validation_data | None)
+        Returns (None, None) if cache doesn't exist or is invalid
+    """
+    return _stats_from_cache(client, bucket, mode, _load_stats_cache(client, bucket, mode))
+
 
 def _write_stats_cache(
     client: Any,
@@ -206,6 +442,7 @@ def _write_stats_cache(
     stats: BucketStats,
     object_count: int,
     compressed_size: int,
+    delta_metadata: dict[str, dict[str, Any]] | None = None,
 ) -> None:
     """Write computed stats to S3 cache.
 
@@ -216,6 +453,7 @@ def _write_stats_cache(
         stats: Computed BucketStats to cache
         object_count: Current object count (for validation)
         compressed_size: Current compressed size (for validation)
+        delta_metadata: Optional per-delta metadata index (see ``_index_entry``)
     """
     cache_key = _get_cache_key(mode)
 
@@ -231,18 +469,18 @@ def _write_stats_cache(
             },
             "stats": asdict(stats),
         }
+        if delta_metadata:
+            cache_data["delta_metadata"] = delta_metadata
 
         # Serialize to JSON
         cache_json = json.dumps(cache_data, indent=2)
 
         # Write to S3
         client.service.storage.put(
-            address=f"{bucket}/{cache_key}",
-            data=cache_json.encode("utf-8"),
-            metadata={
-                "content-type": "application/json",
-                "x-deltaglider-cache": "true",
-            },
+            f"{bucket}/{cache_key}",
+            cache_json.encode("utf-8"),
+            {"x-deltaglider-cache": "true"},
+            content_type="application/json",
         )
 
         client.service.logger.info(
@@ -284,159 +522,111 @@ def _is_cache_valid(
     return True
 
 
-def _build_object_info_list(
-    raw_objects: list[dict[str, Any]],
-    metadata_map: dict[str, dict[str, Any]],
-    logger: Any,
-    sampled_space_metadata: dict[str, dict[str, Any]] | None = None,
-) -> list[ObjectInfo]:
-    """Build ObjectInfo list from raw objects and metadata.
+class _ListingTotals:
+    """Running totals of a bucket listing, fed one LIST entry at a time.
 
-    Args:
-        raw_objects: List of raw object dicts from S3 LIST
-        metadata_map: Dict of key -> metadata for delta files
-        logger: Logger instance
-
-    Returns:
-        List of ObjectInfo objects
+    Every object is folded into counters as it streams past. Delta keys are
+    only kept with ``keep_delta_keys``, for the sampled/detailed modes that
+    look up each delta's original size in metadata fetched during listing;
+    quick mode stays O(1) in memory.
     """
-    all_objects = []
-
-    for obj_dict in raw_objects:
-        key = obj_dict["key"]
-        size = obj_dict["size"]
-        is_delta = key.endswith(".delta")
-
-        deltaspace = _extract_deltaspace(key)
-
-        # Get metadata from map (empty dict if not present)
-        metadata = metadata_map.get(key)
-        if metadata is None and sampled_space_metadata and deltaspace in sampled_space_metadata:
-            metadata = sampled_space_metadata[deltaspace]
-        if metadata is None:
-            metadata = {}
-
-        # Parse compression ratio and original size
-        compression_ratio = 0.0
-        # For delta files without metadata, set original_size to None to indicate unknown
-        # This prevents nonsensical stats like "693 bytes compressed to 82MB"
-        original_size = None if is_delta else size
-
-        if is_delta and metadata:
-            try:
-                ratio_str = metadata.get("compression_ratio", "0.0")
-                compression_ratio = float(ratio_str) if ratio_str != "unknown" else 0.0
-            except (ValueError, TypeError):
-                compression_ratio = 0.0
-
-            try:
-                original_size_raw = _first_metadata_value(
-                    metadata,
-                    "dg-file-size",
-                    "dg_file_size",
-                    "file_size",
-                    "file-size",
-                    "deltaglider-original-size",
-                )
-                if original_size_raw is not None:
-                    original_size = int(original_size_raw)
-                    logger.debug(f"Delta {key}: using original_size={original_size} from metadata")
-                else:
-                    logger.warning(
-                        f"Delta {key}: metadata missing file size. Available keys: {list(metadata.keys())}. Using None as original_size (unknown)"
-                    )
-                    original_size = None
-            except (ValueError, TypeError) as e:
-                logger.warning(
-                    f"Delta {key}: failed to parse file size from metadata: {e}. Using None as original_size (unknown)"
-                )
-                original_size = None
-
-        all_objects.append(
-            ObjectInfo(
-                key=key,
-                size=size,
-                last_modified=obj_dict.get("last_modified", ""),
-                etag=obj_dict.get("etag"),
-                storage_class=obj_dict.get("storage_class", "STANDARD"),
-                original_size=original_size,
-                compressed_size=size,
-                is_delta=is_delta,
-                compression_ratio=compression_ratio,
-                reference_key=_first_metadata_value(
-                    metadata,
-                    "dg-ref-key",
-                    "dg_ref_key",
-                    "ref_key",
-                    "ref-key",
-                ),
-            )
-        )
 
-    return all_objects
+    __slots__ = (
+        "object_count",
+        "listed_size",
+        "direct_count",
+        "direct_size",
+        "delta_count",
+        "delta_size",
+        "reference_files",
+        "delta_keys",
+    )
+
+    def __init__(self, keep_delta_keys: bool = False) -> None:
+        self.object_count = 0  # all listed objects (cache validation)
+        self.listed_size = 0  # bytes of all listed objects (cache validation)
+        self.direct_count = 0
+        self.direct_size = 0
+        self.delta_count = 0
+        self.delta_size = 0
+        self.reference_files: dict[str, int] = {}  # deltaspace -> size
+        self.delta_keys: list[str] | None = [] if keep_delta_keys else None
+
+    def add(self, obj: dict[str, Any]) -> int:
+        """Account for one raw LIST entry and return its ``_classify`` class."""
+        if obj["key"][:_INTERNAL_PREFIX_LEN] == _INTERNAL_PREFIX:
+            return _OBJ_INTERNAL
+        size = obj["size"]
+        self.object_count += 1
+        self.listed_size += size
+
+        kind = _classify(obj["key"])
+        if kind == _OBJ_DIRECT:
+            self.direct_count += 1
+            self.direct_size += size
+        elif kind == _OBJ_REFERENCE:
+            self.reference_files[_extract_deltaspace(obj["key"])] = size
+        else:
+            self.delta_count += 1
+            self.delta_size += size
+            if self.delta_keys is not None:
+                self.delta_keys.append(obj["key"])
+        return kind
 
 
 def _calculate_bucket_statistics(
-    all_objects: list[ObjectInfo],
+    totals: _ListingTotals,
+    metadata_map: dict[str, _DeltaMeta],
     bucket: str,
     logger: Any,
     mode: StatsMode = "quick",
+    sampled_space_metadata: dict[str, _DeltaMeta] | None = None,
 ) -> BucketStats:
-    """Calculate statistics from ObjectInfo list.
+    """Calculate statistics from streamed listing totals.
 
     Args:
-        all_objects: List of ObjectInfo objects
+        totals: Listing totals (with delta keys retained outside quick mode)
+        metadata_map: Dict of key -> parsed metadata for delta files
         bucket: Bucket name for stats
         logger: Logger instance
         mode: Stats mode (quick, sampled, or detailed) - controls warning behavior
+        sampled_space_metadata: Dict of deltaspace -> metadata of its sampled delta,
+            used for deltas without their own entry in ``metadata_map``
 
     Returns:
         BucketStats object
     """
-    total_original_size = 0
-    total_compressed_size = 0
-    delta_count = 0
-    direct_count = 0
-    reference_files = {}  # deltaspace -> size
-
-    # First pass: identify object types and reference files
-    for obj in all_objects:
-        if obj.key.endswith("/reference.bin") or obj.key == "reference.bin":
-            deltaspace = obj.key.rsplit("/reference.bin", 1)[0] if "/" in obj.key else ""
-            reference_files[deltaspace] = obj.size
-        elif obj.is_delta:
-            delta_count += 1
-        else:
-            direct_count += 1
-
-    # Second pass: calculate sizes
-    for obj in all_objects:
-        # Skip reference.bin (handled separately)
-        if obj.key.endswith("/reference.bin") or obj.key == "reference.bin":
-            continue
-
-        if obj.is_delta:
-            # Delta: use original_size if available
-            if obj.original_size is not None:
-                logger.debug(f"Delta {obj.key}: using original_size={obj.original_size}")
-                total_original_size += obj.original_size
-            else:
-                # original_size is None - metadata not available
-                # In quick mode, this is expected (no HEAD requests)
-                # In sampled/detailed mode, this means metadata is genuinely missing
-                if mode != "quick":
-                    logger.warning(
-                        f"Delta {obj.key}: no original_size metadata available. "
-                        f"Cannot calculate original size without metadata. "
-                        f"Use --detailed mode for accurate stats."
-                    )
-                # Don't add anything to total_original_size for deltas without metadata
-                # This prevents nonsensical stats
-            total_compressed_size += obj.size
+    # Direct files: original = compressed
+    direct_count = totals.direct_count
+    total_original_size = totals.direct_size
+    total_compressed_size = totals.direct_size + totals.delta_size
+    delta_count = totals.delta_count
+    reference_files = totals.reference_files
+
+    # Metadata arrives parsed; in sampled mode every delta of a deltaspace
+    # shares its sample's original size.
+    original_sizes = {key: meta.file_size for key, meta in metadata_map.items()}
+    space_original_sizes = {
+        space: meta.file_size for space, meta in (sampled_space_metadata or {}).items()
+    }
+
+    for key in totals.delta_keys or ():
+        # For delta files without metadata the original size is unknown; it is left
+        # out of the total to avoid nonsensical stats like "693 bytes compressed to 82MB"
+        if key in original_sizes:
+            original_size = original_sizes[key]
         else:
-            # Direct files: original = compressed
-            total_original_size += obj.size
-            total_compressed_size += obj.size
+            original_size = space_original_sizes.get(_extract_deltaspace(key))
+        if original_size is not None:
+            total_original_size += original_size
+        elif mode != "quick":
+            # In quick mode this is expected (no HEAD requests); in sampled/detailed
+            # mode it means the metadata is genuinely missing
+            logger.warning(
+                f"Delta {key}: no original_size metadata available. "
+                f"Cannot calculate original size without metadata. "
+                f"Use --detailed mode for accurate stats."
+            )
 
     # Handle reference.bin files
     total_reference_size = sum(reference_files.values())
@@ -500,29 +690,33 @@ def _log_orphaned_references(
         logger: Logger instance
     """
     waste_mb = total_reference_size / 1024 / 1024
-    logger.warning(
-        f"\n{'=' * 60}\n"
-        f"WARNING: ORPHANED REFERENCE FILE(S) DETECTED!\n"
-        f"{'=' * 60}\n"
+    paths = [
+        f"{deltaspace}/reference.bin" if deltaspace else "reference.bin"
+        for deltaspace in reference_files
+    ]
+
+    # One message so handlers format and lock once, however many orphans there are
+    lines = [
+        "",
+        "=" * 60,
+        "WARNING: ORPHANED REFERENCE FILE(S) DETECTED!",
+        "=" * 60,
         f"Found {len(reference_files)} reference.bin file(s) totaling "
-        f"{total_reference_size:,} bytes ({waste_mb:.2f} MB)\n"
-        f"but NO delta files are using them.\n"
-        f"\n"
-        f"This wastes {waste_mb:.2f} MB of storage!\n"
-        f"\n"
-        f"Orphaned reference files:\n"
+        f"{total_reference_size:,} bytes ({waste_mb:.2f} MB)",
+        "but NO delta files are using them.",
+        "",
+        f"This wastes {waste_mb:.2f} MB of storage!",
+        "",
+        "Orphaned reference files:",
+    ]
+    lines.extend(
+        f"  - s3://{bucket}/{path} ({size:,} bytes)"
+        for path, size in zip(paths, reference_files.values(), strict=True)
     )
-
-    for deltaspace, size in reference_files.items():
-        path = f"{deltaspace}/reference.bin" if deltaspace else "reference.bin"
-        logger.warning(f"  - s3://{bucket}/{path} ({size:,} bytes)")
-
-    logger.warning("\nConsider removing these orphaned files:\n")
-    for deltaspace in reference_files:
-        path = f"{deltaspace}/reference.bin" if deltaspace else "reference.bin"
-        logger.warning(f"  aws s3 rm s3://{bucket}/{path}")
-
-    logger.warning(f"{'=' * 60}")
+    lines.append("\nConsider removing these orphaned files:")
+    lines.extend(f"  aws s3 rm s3://{bucket}/{path}" for path in paths)
+    lines.append("=" * 60)
+    logger.warning("\n".join(lines))
 
 
 def get_object_info(
@@ -587,6 +781,8 @@ def get_bucket_stats(
 
     Caching:
     - Stats are cached per mode in ``.deltaglider/stats_{mode}.json``
+    - Sampled/detailed caches also keep each delta's HEAD metadata keyed by ETag, so a
+      recomputation after the bucket changed only HEADs new or rewritten deltas
     - Cache is validated using object count and compressed size from LIST
     - If bucket changed, cache is recomputed automatically
     - Use ``refresh_cache=True`` to force recomputation
@@ -647,18 +843,41 @@ def get_bucket_stats(
         )
 
         list_cap = QUICK_LIST_LIMIT if mode == "quick" else SAMPLED_LIST_LIMIT
-        listing = list_all_objects(
+
+        # Sampled/detailed: HEAD deltas while LIST pages are still arriving. Deltas the
+        # stored index already covers need no HEAD, so when the cached stats turn out
+        # to be valid (bucket unchanged) next to nothing has been requested in vain.
+        # The cache file is fetched once: it carries both the stats validated in
+        # phase 2 and the delta metadata index the prefetcher starts from.
+        cache_data = (
+            _load_stats_cache(client, bucket, mode) if use_cache and not refresh_cache else None
+        )
+        prefetcher: _DeltaMetadataPrefetcher | None = None
+        if mode != "quick":
+            prefetcher = _DeltaMetadataPrefetcher(
+                client,
+                bucket,
+                _delta_metadata_index_from_cache(cache_data),
+                sampled=mode == "sampled",
+            )
+
+        listing = ObjectListing()
+        totals = _ListingTotals(keep_delta_keys=mode != "quick")
+        for obj in iter_all_objects(
             client.service.storage,
             bucket=bucket,
             max_keys=1000,
             logger=client.service.logger,
             max_objects=list_cap,
-        )
-        raw_objects = listing.objects
+            summary=listing,
+            concurrency=min(MAX_LIST_CONCURRENCY, _metadata_fetch_workers(client.service.storage)),
+        ):
+            if totals.add(obj) == _OBJ_DELTA and prefetcher is not None:
+                prefetcher.add(obj)
 
         # Calculate validation metrics from LIST
-        current_object_count = len(raw_objects)
-        current_compressed_size = sum(obj["size"] for obj in raw_objects)
+        current_object_count = totals.object_count
+        current_compressed_size = totals.listed_size
         limit_reached = listing.limit_reached or listing.is_truncated
         if limit_reached:
             client.service.logger.info(
@@ -677,7 +896,7 @@ def get_bucket_stats(
             client.service.logger.info(
                 f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 2: Checking cache for mode '{mode}'"
             )
-            cached_stats, cached_validation = _read_stats_cache(client, bucket, mode)
+            cached_stats, cached_validation = _stats_from_cache(client, bucket, mode, cache_data)
 
             if cached_stats and cached_validation:
                 # Validate cache against current bucket state
@@ -689,6 +908,8 @@ def get_bucket_stats(
                         f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 2: Cache HIT in {phase2_duration:.2f}s - "
                         f"Using cached stats for {bucket} (mode={mode}, bucket unchanged)"
                     )
+                    if prefetcher is not None:
+                        prefetcher.cancel()
                     return cached_stats
                 else:
                     phase2_duration = time.time() - phase2_start
@@ -718,58 +939,48 @@ def get_bucket_stats(
             f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 3: Computing stats (mode={mode})"
         )
 
-        # Phase 4: Extract delta keys for metadata fetching
+        # Phase 4: Delta objects were counted while streaming the listing
         phase4_start = time.time()
-        delta_keys = [obj["key"] for obj in raw_objects if obj["key"].endswith(".delta")]
+        delta_count = totals.delta_count
         phase4_duration = time.time() - phase4_start
 
         client.service.logger.info(
             f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 4: Delta extraction completed in {phase4_duration:.3f}s - "
-            f"Found {len(delta_keys)} delta files"
+            f"Found {delta_count} delta files"
         )
 
         # Phase 5: Fetch metadata for delta files based on mode
         phase5_start = time.time()
-        metadata_map: dict[str, dict[str, Any]] = {}
-        sampled_space_metadata: dict[str, dict[str, Any]] | None = None
+        metadata_map: dict[str, _DeltaMeta] = {}
+        metadata_index: dict[str, dict[str, Any]] = {}
+        sampled_space_metadata: dict[str, _DeltaMeta] | None = None
 
-        if delta_keys:
-            if mode == "detailed":
+        if prefetcher is not None and delta_count:
+            if mode == "sampled":
+                sampled_keys = prefetcher.keys
                 client.service.logger.info(
-                    f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 5: Fetching metadata for ALL {len(delta_keys)} delta files"
+                    f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 5: Sampling {len(sampled_keys)} delta files "
+                    f"(one per deltaspace) out of {delta_count} total delta files"
                 )
-                metadata_map = _fetch_delta_metadata(client, bucket, delta_keys)
 
-            elif mode == "sampled":
-                # Sample one delta per deltaspace
-                seen_spaces: set[str] = set()
-                sampled_keys: list[str] = []
-                for key in delta_keys:
+                # Log which files are being sampled
+                for idx, key in enumerate(sampled_keys[:10], 1):  # Show first 10
                     space = _extract_deltaspace(key)
-                    if space not in seen_spaces:
-                        seen_spaces.add(space)
-                        sampled_keys.append(key)
-
+                    client.service.logger.info(
+                        f"  [{idx}] Sampling: {key} (deltaspace: '{space or '(root)'}')"
+                    )
+                if len(sampled_keys) > 10:
+                    client.service.logger.info(f"  ... and {len(sampled_keys) - 10} more")
+            else:
                 client.service.logger.info(
-                    f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 5: Sampling {len(sampled_keys)} delta files "
-                    f"(one per deltaspace) out of {len(delta_keys)} total delta files"
+                    f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 5: Fetching metadata for ALL {delta_count} delta files"
                 )
 
-                # Log which files are being sampled
-                if sampled_keys:
-                    for idx, key in enumerate(sampled_keys[:10], 1):  # Show first 10
-                        space = _extract_deltaspace(key)
-                        client.service.logger.info(
-                            f"  [{idx}] Sampling: {key} (deltaspace: '{space or '(root)'}')"
-                        )
-                    if len(sampled_keys) > 10:
-                        client.service.logger.info(f"  ... and {len(sampled_keys) - 10} more")
-
-                if sampled_keys:
-                    metadata_map = _fetch_delta_metadata(client, bucket, sampled_keys)
-                    sampled_space_metadata = {
-                        _extract_deltaspace(k): metadata for k, metadata in metadata_map.items()
-                    }
+            metadata_map, metadata_index = prefetcher.results()
+            if mode == "sampled":
+                sampled_space_metadata = {
+                    _extract_deltaspace(k): meta for k, meta in metadata_map.items()
+                }
 
         phase5_duration = time.time() - phase5_start
         if mode == "quick":
@@ -782,31 +993,24 @@ def get_bucket_stats(
                 f"Fetched {len(metadata_map)} metadata records"
             )
 
-        # Phase 6: Build ObjectInfo list
+        # Phase 6: Calculate final statistics from the streamed totals
         phase6_start = time.time()
-        all_objects = _build_object_info_list(
-            raw_objects,
+        stats = _calculate_bucket_statistics(
+            totals,
             metadata_map,
+            bucket,
             client.service.logger,
+            mode,
             sampled_space_metadata,
         )
         phase6_duration = time.time() - phase6_start
         client.service.logger.info(
-            f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 6: ObjectInfo list built in {phase6_duration:.3f}s - "
-            f"{len(all_objects)} objects processed"
-        )
-
-        # Phase 7: Calculate final statistics
-        phase7_start = time.time()
-        stats = _calculate_bucket_statistics(all_objects, bucket, client.service.logger, mode)
-        phase7_duration = time.time() - phase7_start
-        client.service.logger.info(
-            f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 7: Statistics calculated in {phase7_duration:.3f}s - "
+            f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 6: Statistics calculated in {phase6_duration:.3f}s - "
             f"{stats.delta_objects} delta, {stats.direct_objects} direct objects"
         )
 
-        # Phase 8: Write cache if enabled
-        phase8_start = time.time()
+        # Phase 7: Write cache if enabled
+        phase7_start = time.time()
         if use_cache:
             _write_stats_cache(
                 client=client,
@@ -815,14 +1019,15 @@ def get_bucket_stats(
                 stats=stats,
                 object_count=current_object_count,
                 compressed_size=current_compressed_size,
+                delta_metadata=metadata_index,
             )
-            phase8_duration = time.time() - phase8_start
+            phase7_duration = time.time() - phase7_start
             client.service.logger.info(
-                f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 8: Cache written in {phase8_duration:.3f}s"
+                f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 7: Cache written in {phase7_duration:.3f}s"
             )
         else:
             client.service.logger.info(
-                f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 8: Cache write skipped (caching disabled)"
+                f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}] Phase 7: Cache write skipped (caching disabled)"
             )
 
         # Summary
@@ -950,52 +1155,64 @@ def find_similar_files(
     Returns:
         List of similar files with scores
     """
-    # List objects in the prefix (no metadata needed for similarity check)
-    response = client.list_objects(
-        Bucket=bucket,
-        Prefix=prefix,
-        MaxKeys=1000,
-        FetchMetadata=False,  # Don't need metadata for similarity
-    )
-
-    similar: list[dict[str, Any]] = []
     base_name = Path(filename).stem
     ext = Path(filename).suffix
+    version = _VERSION_RE.search(base_name)
+    base_has_version = version is not None
+
+    # Versioned names ("app-v1.2.3") first LIST only their family ("<prefix>/app-"),
+    # letting S3 filter server-side; the whole prefix is listed if that finds nothing.
+    search_prefixes = [prefix]
+    if version is not None and version.start() > 0:
+        space = prefix.rstrip("/")
+        search_prefixes.insert(
+            0, f"{space}/{base_name[: version.start()]}" if space else base_name[: version.start()]
+        )
+
+    def candidates(contents: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for obj in contents:
+            obj_key = obj["Key"]
 
-    for obj in response["Contents"]:
-        obj_key = obj["Key"]
-        obj_base = Path(obj_key).stem
-        obj_ext = Path(obj_key).suffix
+            # Skip delta files and references
+            if obj_key.endswith(_NON_CANDIDATE_SUFFIXES):
+                continue
 
-        # Skip delta files and references
-        if obj_key.endswith(".delta") or obj_key.endswith("reference.bin"):
-            continue
+            obj_base, obj_ext = posixpath.splitext(obj_key[obj_key.rfind("/") + 1 :])
 
-        score = 0.0
+            score = 0.0
 
-        # Extension match
-        if ext == obj_ext:
-            score += 0.5
+            # Extension match
+            if ext == obj_ext:
+                score += 0.5
 
-        # Base name similarity
-        if base_name in obj_base or obj_base in base_name:
-            score += 0.3
+            # Base name similarity
+            if base_name in obj_base or obj_base in base_name:
+                score += 0.3
 
-        # Version pattern match
-        if re.search(r"v?\d+[\.\d]*", base_name) and re.search(r"v?\d+[\.\d]*", obj_base):
-            score += 0.2
+            # Version pattern match
+            if base_has_version and _VERSION_RE.search(obj_base):
+                score += 0.2
 
-        if score > 0.5:
-            similar.append(
-                {
+            if score > 0.5:
+                yield {
                     "Key": obj_key,
                     "Size": obj["Size"],
                     "Similarity": score,
                     "LastModified": obj["LastModified"],
                 }
-            )
-
-    # Sort by similarity
-    similar.sort(key=lambda x: x["Similarity"], reverse=True)  # type: ignore
 
-    return similar[:limit]
+    for search_prefix in search_prefixes:
+        # No metadata needed for the similarity check
+        response = client.list_objects(
+            Bucket=bucket,
+            Prefix=search_prefix,
+            MaxKeys=1000,
+            FetchMetadata=False,
+        )
+        # Top matches by similarity via a bounded heap (ties keep listing order, like a stable sort)
+        top = heapq.nlargest(
+            limit, candidates(response["Contents"]), key=operator.itemgetter("Similarity")
+        )
+        if top:
+            return top
+    return []
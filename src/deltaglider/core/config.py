@@ -1,7 +1,9 @@
 """Centralized configuration for DeltaGlider."""
 
+import functools
 import os
 from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass(slots=True)
@@ -16,6 +18,15 @@ class DeltaGliderConfig:
         DG_CACHE_MEMORY_SIZE_MB: Memory cache size in MB. Default 100.
         DG_METRICS:             Metrics backend: "noop", "logging" (default), "cloudwatch".
         DG_METRICS_NAMESPACE:   CloudWatch namespace. Default "DeltaGlider".
+        DG_VERIFY_TTL:          Seconds a successful verify of an unchanged object (same
+                                ETag) is remembered and reused. Default 0 (disabled).
+                                Kept in process memory only: it helps long-lived SDK
+                                clients, not separate ``deltaglider verify`` runs.
+        DG_STATS_CACHE_TTL:     Seconds bucket stats are served from client memory without
+                                re-listing the bucket. Default 0 (disabled).
+
+    Environment variables are read and parsed once per process; call
+    ``reset_cache()`` after changing them (e.g. in tests).
     """
 
     max_ratio: float = 0.5
@@ -24,6 +35,8 @@ class DeltaGliderConfig:
     cache_memory_size_mb: int = 100
     metrics_type: str = "logging"
     metrics_namespace: str = "DeltaGlider"
+    verify_ttl_seconds: float = 0.0
+    stats_cache_ttl_seconds: float = 0.0
 
     # Connection params (typically passed by CLI, not env vars)
     endpoint_url: str | None = field(default=None, repr=False)
@@ -39,15 +52,38 @@ class DeltaGliderConfig:
         region: str | None = None,
         profile: str | None = None,
     ) -> "DeltaGliderConfig":
-        """Build config from environment variables + explicit overrides."""
+        """Build config from environment variables + explicit overrides.
+
+        Each call returns a fresh instance, so callers may modify it freely.
+        """
+        env = _env_settings()
         return cls(
-            max_ratio=float(os.environ.get("DG_MAX_RATIO", "0.5")),
-            log_level=os.environ.get("DG_LOG_LEVEL", log_level),
-            cache_backend=os.environ.get("DG_CACHE_BACKEND", "filesystem"),
-            cache_memory_size_mb=int(os.environ.get("DG_CACHE_MEMORY_SIZE_MB", "100")),
-            metrics_type=os.environ.get("DG_METRICS", "logging"),
-            metrics_namespace=os.environ.get("DG_METRICS_NAMESPACE", "DeltaGlider"),
+            log_level=env.get("log_level", log_level),
             endpoint_url=endpoint_url,
             region=region,
             profile=profile,
+            **{k: v for k, v in env.items() if k != "log_level"},
         )
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """Forget the parsed environment so the next ``from_env`` re-reads it."""
+        _env_settings.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _env_settings() -> dict[str, Any]:
+    """Read and parse the DG_* environment variables (memoized for the process)."""
+    env = {
+        "max_ratio": float(os.environ.get("DG_MAX_RATIO", "0.5")),
+        "cache_backend": os.environ.get("DG_CACHE_BACKEND", "filesystem"),
+        "cache_memory_size_mb": int(os.environ.get("DG_CACHE_MEMORY_SIZE_MB", "100")),
+        "metrics_type": os.environ.get("DG_METRICS", "logging"),
+        "metrics_namespace": os.environ.get("DG_METRICS_NAMESPACE", "DeltaGlider"),
+        "verify_ttl_seconds": float(os.environ.get("DG_VERIFY_TTL", "0")),
+        "stats_cache_ttl_seconds": float(os.environ.get("DG_STATS_CACHE_TTL", "0")),
+    }
+    # DG_LOG_LEVEL only wins over the caller's log_level when it is actually set
+    if "DG_LOG_LEVEL" in os.environ:
+        env["log_level"] = os.environ["DG_LOG_LEVEL"]
+    return env
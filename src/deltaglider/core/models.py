@@ -87,6 +87,22 @@ def resolve_metadata(metadata: dict[str, str], field: str) -> str | None:
     return None
 
 
+def resolve_all(metadata: dict[str, str]) -> dict[str, str]:
+    """Resolve every known metadata field in one pass, keyed by canonical field name.
+
+    Fields without a non-empty value under any alias are omitted, so
+    ``resolve_all(meta).get(field)`` matches ``resolve_metadata(meta, field)``.
+    """
+    resolved: dict[str, str] = {}
+    for name, aliases in METADATA_KEY_ALIASES.items():
+        for key in aliases:
+            value = metadata.get(key)
+            if value:
+                resolved[name] = value
+                break
+    return resolved
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -184,8 +200,10 @@ class DeltaMeta:
     def from_dict(cls, data: dict[str, str]) -> "DeltaMeta":
         """Create from S3 metadata dict with DeltaGlider namespace prefix."""
 
+        resolved = resolve_all(data)
+
         def _require(field: str) -> str:
-            value = resolve_metadata(data, field)
+            value = resolved.get(field)
             if value is None:
                 raise KeyError(METADATA_KEY_ALIASES[field][0])
             return value
@@ -198,8 +216,8 @@ class DeltaMeta:
         ref_key = _require("ref_key")
         ref_sha = _require("ref_sha256")
         delta_size_raw = _require("delta_size")
-        delta_cmd_value = resolve_metadata(data, "delta_cmd") or ""
-        note_value = resolve_metadata(data, "note") or ""
+        delta_cmd_value = resolved.get("delta_cmd", "")
+        note_value = resolved.get("note", "")
 
         try:
             file_size = int(file_size_raw)
@@ -2,12 +2,40 @@
 
 from __future__ import annotations
 
+import queue
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
 from ..ports.storage import ObjectHead
 
+# Sequential LIST pages seen before a concurrent listing tries to fan out
+PARALLEL_LIST_AFTER_PAGES = 3
+# LIST pages a prefix worker may hold before the consumer catches up
+_PREFIX_QUEUE_PAGES = 4
+_PREFIX_DONE = object()
+# Offered by a prefix worker that ran out of pages before its prefix did
+_PREFIX_CAPPED = object()
+
+
+class _PageBudget:
+    """LIST pages left to a fan-out, shared by all of its prefix workers."""
+
+    def __init__(self, pages: int) -> None:
+        self._pages = pages
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Claim one page; False once the budget is spent."""
+        with self._lock:
+            if self._pages <= 0:
+                return False
+            self._pages -= 1
+            return True
+
 
 @dataclass(slots=True)
 class ObjectListing:
@@ -53,7 +81,166 @@ def list_objects_page(
     )
 
 
-def list_all_objects(
+def _plan_prefix_fanout(
+    storage: Any,
+    *,
+    bucket: str,
+    prefix: str,
+    max_keys: int,
+    start_after: str,
+) -> list[tuple[str, dict[str, Any] | None]] | None:
+    """Split the rest of a listing (keys after ``start_after``) into top-level entries.
+
+    Returns the top-level objects and ``/``-delimited prefixes in key order, as
+    ``(key, object)`` and ``(prefix, None)`` pairs, or None when a fan-out would
+    not pay off (fewer than two prefixes, or a top level too big for one page).
+    """
+    try:
+        page = list_objects_page(
+            storage,
+            bucket=bucket,
+            prefix=prefix,
+            delimiter="/",
+            max_keys=max_keys,
+            start_after=start_after,
+        )
+    except Exception:
+        return None
+    if page.is_truncated or len(page.common_prefixes) < 2:
+        return None
+
+    entries: list[tuple[str, dict[str, Any] | None]] = [(obj["key"], obj) for obj in page.objects]
+    entries.extend((common_prefix, None) for common_prefix in page.common_prefixes)
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def _offer(out: queue.Queue[Any], item: Any, stop: threading.Event) -> None:
+    """Put ``item`` on a bounded queue unless the consumer has gone away."""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _list_prefix_into(
+    storage: Any,
+    bucket: str,
+    prefix: str,
+    start_after: str,
+    max_keys: int,
+    budget: _PageBudget,
+    out: queue.Queue[Any],
+    stop: threading.Event,
+) -> None:
+    """Worker: page through one prefix, handing each page's objects to ``out``.
+
+    Every page is claimed from the shared ``budget``; a prefix still unfinished
+    when it runs out is cut short with ``_PREFIX_CAPPED``.
+    """
+    continuation_token: str | None = None
+    try:
+        while not stop.is_set():
+            if not budget.take():
+                _offer(out, _PREFIX_CAPPED, stop)
+                break
+            page = list_objects_page(
+                storage,
+                bucket=bucket,
+                prefix=prefix,
+                max_keys=max_keys,
+                start_after=start_after,
+                continuation_token=continuation_token,
+            )
+            _offer(out, page.objects, stop)
+            continuation_token = page.next_continuation_token
+            if not page.is_truncated or not continuation_token:
+                break
+    except Exception as exc:
+        _offer(out, exc, stop)
+    _offer(out, _PREFIX_DONE, stop)
+
+
+def _iter_prefix_fanout(
+    storage: Any,
+    *,
+    bucket: str,
+    entries: list[tuple[str, dict[str, Any] | None]],
+    start_after: str,
+    max_keys: int,
+    max_pages: int,
+    concurrency: int,
+    max_objects: int | None,
+    summary: ObjectListing,
+    logger: Any | None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the entries' objects in key order while their prefixes are listed concurrently.
+
+    Every prefix gets its own worker and bounded page queue; prefixes are
+    drained in key order, so the result (and a ``max_objects`` cap) matches a
+    sequential listing exactly. All workers together request at most
+    ``max_pages`` pages, the listing's remaining iteration budget.
+    """
+    budget = _PageBudget(max_pages)
+    stop = threading.Event()
+    queues: dict[str, queue.Queue[Any]] = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    count = 0
+    summary.is_truncated = False
+    try:
+        for key, obj in entries:
+            if obj is None:
+                queues[key] = queue.Queue(maxsize=_PREFIX_QUEUE_PAGES)
+                executor.submit(
+                    _list_prefix_into,
+                    storage,
+                    bucket,
+                    key,
+                    start_after,
+                    max_keys,
+                    budget,
+                    queues[key],
+                    stop,
+                )
+
+        for key, obj in entries:
+            if obj is not None:
+                pages: Iterator[Any] = iter(([obj],))
+            else:
+                pages = iter(queues[key].get, _PREFIX_DONE)
+            for page_objects in pages:
+                if page_objects is _PREFIX_CAPPED:
+                    if logger:
+                        logger.warning(
+                            "list_all_objects: reached max iterations listing prefix %s. Returning partial results.",
+                            key,
+                        )
+                    summary.is_truncated = True
+                    return
+                if isinstance(page_objects, Exception):
+                    if logger:
+                        logger.warning(
+                            "list_all_objects: listing prefix %s failed: %s. Returning partial results.",
+                            key,
+                            page_objects,
+                        )
+                    summary.is_truncated = True
+                    return
+                if max_objects is not None and count + len(page_objects) >= max_objects:
+                    yield from page_objects[: max_objects - count]
+                    summary.is_truncated = True
+                    summary.limit_reached = True
+                    return
+                count += len(page_objects)
+                yield from page_objects
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_all_objects(
     storage: Any,
     *,
     bucket: str,
@@ -63,14 +250,28 @@ def list_all_objects(
     logger: Any | None = None,
     max_iterations: int = 10_000,
     max_objects: int | None = None,
-) -> ObjectListing:
-    """Fetch all objects under the given bucket/prefix with pagination safety."""
+    summary: ObjectListing | None = None,
+    concurrency: int = 1,
+) -> Iterator[dict[str, Any]]:
+    """Yield all objects under the given bucket/prefix, one LIST page at a time.
+
+    Only the current page is held in memory. Pagination outcome (truncation,
+    limit, continuation token, common prefixes, key count) is recorded on
+    ``summary`` once iteration finishes; its ``objects`` list is left untouched.
+
+    With ``concurrency > 1``, a listing still truncated after
+    ``PARALLEL_LIST_AFTER_PAGES`` pages lists the remaining top-level ``/``
+    prefixes concurrently instead of following one continuation-token chain.
+    Objects are still yielded in key order.
+    """
     import time
     from datetime import UTC, datetime
 
-    aggregated = ObjectListing()
+    if summary is None:
+        summary = ObjectListing()
     continuation_token: str | None = None
     iteration_count = 0
+    object_count = 0
     list_start_time = time.time()
     limit_reached = False
 
@@ -82,29 +283,29 @@ def list_all_objects(
                     "list_all_objects: reached max iterations (%s). Returning partial results.",
                     max_iterations,
                 )
-            aggregated.is_truncated = True
-            aggregated.next_continuation_token = continuation_token
+            summary.is_truncated = True
+            summary.next_continuation_token = continuation_token
             break
 
         # Log progress every 10 pages or on first page
         if logger and (iteration_count == 1 or iteration_count % 10 == 0):
             elapsed = time.time() - list_start_time
-            objects_per_sec = len(aggregated.objects) / elapsed if elapsed > 0 else 0
+            objects_per_sec = object_count / elapsed if elapsed > 0 else 0
             token_info = f", token={continuation_token[:20]}..." if continuation_token else ""
             logger.info(
                 f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}]   LIST pagination: "
-                f"page {iteration_count}, {len(aggregated.objects)} objects so far "
+                f"page {iteration_count}, {object_count} objects so far "
                 f"({objects_per_sec:.0f} obj/s, {elapsed:.1f}s elapsed{token_info})"
             )
 
             # Warn if taking very long (>60s)
             if elapsed > 60 and iteration_count % 50 == 0:
-                estimated_total = (len(aggregated.objects) / iteration_count) * max_iterations
+                estimated_total = (object_count / iteration_count) * max_iterations
                 logger.warning(
                     f"LIST operation is slow ({elapsed:.0f}s elapsed). "
-                    f"This bucket has MANY objects ({len(aggregated.objects)} so far). "
+                    f"This bucket has MANY objects ({object_count} so far). "
                     f"Consider using a smaller prefix or enabling caching. "
-                    f"Estimated remaining: {estimated_total - len(aggregated.objects):.0f} objects"
+                    f"Estimated remaining: {estimated_total - object_count:.0f} objects"
                 )
 
         try:
@@ -117,42 +318,90 @@ def list_all_objects(
                 continuation_token=continuation_token,
             )
         except Exception as exc:
-            if not aggregated.objects:
+            if not object_count:
                 raise RuntimeError(f"Failed to list objects for bucket '{bucket}': {exc}") from exc
             if logger:
                 logger.warning(
                     "list_all_objects: pagination error after %s objects: %s. Returning partial results.",
-                    len(aggregated.objects),
+                    object_count,
                     exc,
                 )
-            aggregated.is_truncated = True
-            aggregated.next_continuation_token = continuation_token
+            summary.is_truncated = True
+            summary.next_continuation_token = continuation_token
             break
 
-        aggregated.objects.extend(page.objects)
-        aggregated.common_prefixes.extend(page.common_prefixes)
-        aggregated.key_count += page.key_count
+        summary.common_prefixes.extend(page.common_prefixes)
 
-        if max_objects is not None and len(aggregated.objects) >= max_objects:
+        page_objects = page.objects
+        if max_objects is not None and object_count + len(page_objects) >= max_objects:
+            page_objects = page_objects[: max_objects - object_count]
+            object_count += len(page_objects)
+            yield from page_objects
             if logger:
                 logger.info(
                     f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}]   LIST capped at {max_objects} objects."
                 )
-            aggregated.objects = aggregated.objects[:max_objects]
-            aggregated.key_count = len(aggregated.objects)
-            aggregated.is_truncated = True
-            aggregated.next_continuation_token = page.next_continuation_token
+            summary.is_truncated = True
+            summary.next_continuation_token = page.next_continuation_token
             limit_reached = True
             break
 
+        object_count += len(page_objects)
+        yield from page_objects
+
+        if (
+            concurrency > 1
+            and not delimiter
+            and page.is_truncated
+            and page_objects
+            and iteration_count == PARALLEL_LIST_AFTER_PAGES
+        ):
+            last_key = page_objects[-1]["key"]
+            entries = _plan_prefix_fanout(
+                storage, bucket=bucket, prefix=prefix, max_keys=max_keys, start_after=last_key
+            )
+            if entries is not None:
+                if logger:
+                    logger.info(
+                        f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}]   LIST fan-out: "
+                        f"{sum(1 for _, obj in entries if obj is None)} prefixes, "
+                        f"{concurrency} concurrent listings"
+                    )
+                fanout = ObjectListing()
+                for obj in _iter_prefix_fanout(
+                    storage,
+                    bucket=bucket,
+                    entries=entries,
+                    start_after=last_key,
+                    max_keys=max_keys,
+                    # The fan-out planning LIST used one more page
+                    max_pages=max_iterations - iteration_count - 1,
+                    concurrency=concurrency,
+                    max_objects=None if max_objects is None else max_objects - object_count,
+                    summary=fanout,
+                    logger=logger,
+                ):
+                    object_count += 1
+                    yield obj
+                summary.is_truncated = fanout.is_truncated
+                summary.next_continuation_token = None
+                limit_reached = fanout.limit_reached
+                if logger:
+                    elapsed = time.time() - list_start_time
+                    logger.info(
+                        f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}]   LIST complete: "
+                        f"{object_count} objects total in {elapsed:.2f}s"
+                    )
+                break
+
         if not page.is_truncated:
-            aggregated.is_truncated = False
-            aggregated.next_continuation_token = None
+            summary.is_truncated = False
+            summary.next_continuation_token = None
             if logger:
                 elapsed = time.time() - list_start_time
                 logger.info(
                     f"[{datetime.now(UTC).strftime('%H:%M:%S.%f')[:-3]}]   LIST complete: "
-                    f"{iteration_count} pages, {len(aggregated.objects)} objects total in {elapsed:.2f}s"
+                    f"{iteration_count} pages, {object_count} objects total in {elapsed:.2f}s"
                 )
             break
 
@@ -161,22 +410,44 @@ def list_all_objects(
             if logger:
                 logger.warning(
                     "list_all_objects: truncated response without continuation token after %s objects.",
-                    len(aggregated.objects),
+                    object_count,
                 )
-            aggregated.is_truncated = True
-            aggregated.next_continuation_token = None
+            summary.is_truncated = True
+            summary.next_continuation_token = None
             break
 
-    if aggregated.common_prefixes:
-        seen: set[str] = set()
-        unique_prefixes: list[str] = []
-        for prefix in aggregated.common_prefixes:
-            if prefix not in seen:
-                seen.add(prefix)
-                unique_prefixes.append(prefix)
-        aggregated.common_prefixes = unique_prefixes
-    aggregated.key_count = len(aggregated.objects)
-    aggregated.limit_reached = limit_reached
+    if summary.common_prefixes:
+        summary.common_prefixes = list(dict.fromkeys(summary.common_prefixes))
+    summary.key_count = object_count
+    summary.limit_reached = limit_reached
+
+
+def list_all_objects(
+    storage: Any,
+    *,
+    bucket: str,
+    prefix: str = "",
+    delimiter: str = "",
+    max_keys: int = 1000,
+    logger: Any | None = None,
+    max_iterations: int = 10_000,
+    max_objects: int | None = None,
+) -> ObjectListing:
+    """Fetch all objects under the given bucket/prefix with pagination safety."""
+    aggregated = ObjectListing()
+    aggregated.objects = list(
+        iter_all_objects(
+            storage,
+            bucket=bucket,
+            prefix=prefix,
+            delimiter=delimiter,
+            max_keys=max_keys,
+            logger=logger,
+            max_iterations=max_iterations,
+            max_objects=max_objects,
+            summary=aggregated,
+        )
+    )
     return aggregated
 
 
@@ -217,6 +488,7 @@ def object_dict_to_head(obj: dict[str, Any]) -> ObjectHead:
 __all__ = [
     "ObjectListing",
     "list_objects_page",
+    "iter_all_objects",
     "list_all_objects",
     "object_dict_to_head",
 ]
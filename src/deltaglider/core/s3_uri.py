@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import re
 from typing import NamedTuple
 
 S3_SCHEME = "s3://"
 
+# Single compiled matcher shared by every CLI/SDK entry point: bucket, then any
+# run of separating slashes, then the (possibly empty) key.
+_S3_URL_RE = re.compile(r"s3://([^/]*)/*(.*)", re.DOTALL)
+
 
 class S3Url(NamedTuple):
     """Normalized representation of an S3 URL."""
@@ -45,21 +50,16 @@ def parse_s3_url(
     strip_trailing_slash: bool = False,
 ) -> S3Url:
     """Parse an S3 URL into bucket and key components."""
-    if not is_s3_url(url):
+    match = _S3_URL_RE.fullmatch(url)
+    if match is None:
         raise ValueError(f"Invalid S3 URL: {url}")
 
-    path = url[len(S3_SCHEME) :]
-    if strip_trailing_slash:
-        path = path.rstrip("/")
-
-    bucket, sep, key = path.partition("/")
+    bucket, key = match.groups()
     if not bucket:
         raise ValueError(f"S3 URL missing bucket: {url}")
 
-    if not sep:
-        key = ""
-
-    key = key.lstrip("/")
+    if strip_trailing_slash:
+        key = key.rstrip("/")
     if not key and not allow_empty_key:
         raise ValueError(f"S3 URL must include a key: {url}")
 
@@ -1,10 +1,24 @@
 """Core DeltaService orchestration."""
 
+import atexit
+import bisect
+import functools
+import io
+import itertools
+import math
+import os
+import shutil
 import tempfile
+import threading
+import time
 import warnings
-from datetime import UTC, timedelta
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, cast
 
 from .. import __version__
 from ..ports import (
@@ -39,9 +53,174 @@ from .models import (
     RecursiveDeleteResult,
     ReferenceMeta,
     VerifyResult,
+    resolve_all,
     resolve_metadata,
 )
 
+# Upper bound on remembered verify results (see DeltaService.verify_ttl)
+_VERIFIED_CACHE_MAX = 4096
+
+# Read size for streaming copies: large enough that per-chunk Python and syscall
+# overhead vanishes next to the copy itself
+_IO_CHUNK = 1 << 20
+
+# Keys per bulk delete issued by purge_temp_files (the S3 DeleteObjects limit),
+# and how many such batches may be in flight at once
+_PURGE_BATCH = 1000
+_PURGE_IN_FLIGHT = 4
+
+
+# Scratch space for download intermediates: one directory per thread under a
+# process-wide root, reused by every call instead of creating and removing a
+# TemporaryDirectory per download. Keyed by PID so forked children don't share.
+_scratch_lock = threading.Lock()
+_scratch_roots: dict[int, Path] = {}
+_scratch_local = threading.local()
+
+
+def _scratch_path(name: str) -> Path:
+    """Path named ``name`` in the calling thread's private scratch directory."""
+    pid = os.getpid()
+    scratch = getattr(_scratch_local, "dir", None)
+    if scratch is None or scratch[0] != pid:
+        with _scratch_lock:
+            root = _scratch_roots.get(pid)
+            if root is None:
+                root = _scratch_roots[pid] = Path(tempfile.mkdtemp(prefix="dg-scratch-"))
+                atexit.register(shutil.rmtree, root, ignore_errors=True)
+        scratch = (pid, Path(tempfile.mkdtemp(dir=root)))
+        _scratch_local.dir = scratch
+    return scratch[1] / name
+
+
+def _utc_epoch(moment: datetime) -> int:
+    """Seconds since the epoch, rounded up; naive datetimes are taken as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return math.ceil(moment.timestamp())
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_expiry(value: str) -> int | None:
+    """Epoch of an ISO-8601 ``dg-expires-at`` stamp, or None if it is malformed.
+
+    Cached because repeated purges keep meeting the same unexpired stamps.
+    """
+    try:
+        return _utc_epoch(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+
+def _advise_sequential(f: BinaryIO) -> None:
+    """Tell the kernel ``f`` will be read front to back (larger read-ahead)."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except (OSError, ValueError):
+            pass
+
+
+def _copy_file_to_stream(src: BinaryIO, out: BinaryIO) -> None:
+    """Copy the regular file ``src`` (from its start) into ``out``.
+
+    When ``out`` is backed by a file descriptor the bytes move in-kernel with
+    ``os.sendfile``; otherwise (or if the kernel refuses) ``shutil.copyfileobj``
+    runs the loop in C.
+    """
+    try:
+        out_fd = out.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        out_fd = None
+
+    if out_fd is not None and hasattr(os, "sendfile"):
+        out.flush()
+        in_fd = src.fileno()
+        size = os.fstat(in_fd).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # Unsupported fd pairing: fall back, unless bytes already went out
+            if offset:
+                raise
+        else:
+            if offset == size:
+                return
+            src.seek(offset)
+
+    shutil.copyfileobj(src, out, _IO_CHUNK)
+
+
+class _ExtensionSet(set[str]):
+    """Set of extensions that calls ``on_change`` after every in-place change.
+
+    Lets ``service.delta_extensions.add(".foo")`` keep working while the
+    service memoizes per-filename policy decisions.
+    """
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, extensions: Iterable[str], on_change: Callable[[], None]) -> None:
+        super().__init__(extensions)
+        self._on_change = on_change
+
+
+def _notify_after(name: str) -> Callable[..., Any]:
+    method = getattr(set, name)
+
+    @functools.wraps(method)
+    def mutator(self: _ExtensionSet, *args: Any) -> Any:
+        result = method(self, *args)
+        self._on_change()
+        return result
+
+    return mutator
+
+
+for _name in (
+    "add",
+    "clear",
+    "difference_update",
+    "discard",
+    "intersection_update",
+    "pop",
+    "remove",
+    "symmetric_difference_update",
+    "update",
+    "__iand__",
+    "__ior__",
+    "__isub__",
+    "__ixor__",
+):
+    setattr(_ExtensionSet, _name, _notify_after(_name))
+
+
+class _TeeReader:
+    """Readable stream that copies every chunk read from ``source`` into ``sink``.
+
+    Handing one to ``HashPort.sha256`` hashes a download while it is being
+    written out, instead of writing it first and reading it back to verify.
+    """
+
+    def __init__(self, source: BinaryIO, sink: BinaryIO) -> None:
+        self._source = source
+        self._sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._source.read(size)
+        if chunk:
+            self._sink.write(chunk)
+        return chunk
+
+    def copy_and_hash(self, hasher: HashPort) -> str:
+        """Drain ``source`` into ``sink`` and return the SHA256 of the copied bytes."""
+        return hasher.sha256(cast(BinaryIO, self))
+
 
 class DeltaService:
     """Core service for delta operations."""
@@ -57,11 +236,16 @@ class DeltaService:
         metrics: MetricsPort,
         tool_version: str | None = None,
         max_ratio: float = 0.5,
+        verify_ttl: float = 0.0,
     ):
         """Initialize service with ports.
 
         Args:
             tool_version: Version string for metadata. If None, uses package __version__.
+            verify_ttl: Seconds a passed verify of an object with an unchanged ETag is
+                reused without re-downloading. 0 disables the shortcut. Results live
+                in this service's memory only, so they never carry over between
+                processes (e.g. separate CLI invocations).
         """
         # Use real package version if not explicitly provided
         if tool_version is None:
@@ -75,26 +259,73 @@ class DeltaService:
         self.metrics = metrics
         self.tool_version = tool_version
         self.max_ratio = max_ratio
+        self.verify_ttl = verify_ttl
 
-        # File extensions that should use delta compression. Keep mutable copies
-        # so advanced callers can customize the policy if needed.
-        self.delta_extensions = set(DEFAULT_DELTA_EXTENSIONS)
-        self.compound_delta_extensions = DEFAULT_COMPOUND_DELTA_EXTENSIONS
+        # Background transfers that overlap with the calling thread's (e.g. the
+        # reference download during a cache-miss get)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="deltaglider")
 
-    def should_use_delta(self, filename: str) -> bool:
-        """Check if file should use delta compression based on extension."""
+        # (bucket/key, etag) -> (verified sha256, monotonic timestamp), LRU ordered
+        self._verified: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+
+        # File extensions that should use delta compression. Advanced callers
+        # customize the policy by assigning new collections or by changing
+        # delta_extensions in place; either clears the per-filename decision cache.
+        self._should_use_delta_cached = functools.lru_cache(maxsize=4096)(self._is_delta_candidate)
+        self._delta_extensions = _ExtensionSet(
+            DEFAULT_DELTA_EXTENSIONS, self._should_use_delta_cached.cache_clear
+        )
+        self._compound_delta_extensions: tuple[str, ...] = DEFAULT_COMPOUND_DELTA_EXTENSIONS
+
+    @property
+    def delta_extensions(self) -> set[str]:
+        """Simple extensions (e.g. ``.zip``) that use delta compression."""
+        return self._delta_extensions
+
+    @delta_extensions.setter
+    def delta_extensions(self, extensions: Iterable[str]) -> None:
+        self._delta_extensions = _ExtensionSet(
+            extensions, self._should_use_delta_cached.cache_clear
+        )
+        self._should_use_delta_cached.cache_clear()
+
+    @property
+    def compound_delta_extensions(self) -> tuple[str, ...]:
+        """Multi-part extensions (e.g. ``.tar.gz``) that use delta compression."""
+        return self._compound_delta_extensions
+
+    @compound_delta_extensions.setter
+    def compound_delta_extensions(self, extensions: Iterable[str]) -> None:
+        self._compound_delta_extensions = tuple(extensions)
+        self._should_use_delta_cached.cache_clear()
+
+    def _is_delta_candidate(self, filename: str) -> bool:
         return is_delta_candidate(
             filename,
-            simple_extensions=self.delta_extensions,
-            compound_extensions=self.compound_delta_extensions,
+            simple_extensions=self._delta_extensions,
+            compound_extensions=self._compound_delta_extensions,
         )
 
+    def should_use_delta(self, filename: str) -> bool:
+        """Check if file should use delta compression based on extension."""
+        return self._should_use_delta_cached(filename)
+
+    def write_and_hash(self, source: BinaryIO, path: Path) -> str:
+        """Write ``source`` to ``path`` and return its SHA256, computed while writing.
+
+        Pass the result to ``put(precomputed_sha256=...)`` to upload the file
+        without reading it back just to hash it.
+        """
+        with open(path, "wb") as f:
+            return _TeeReader(source, f).copy_and_hash(self.hasher)
+
     def put(
         self,
         local_file: Path,
         delta_space: DeltaSpace,
         max_ratio: float | None = None,
         override_name: str | None = None,
+        precomputed_sha256: str | None = None,
     ) -> PutSummary:
         """Upload file as reference or delta (for archive files) or directly (for other files).
 
@@ -103,13 +334,15 @@ class DeltaService:
             delta_space: DeltaSpace (bucket + prefix) for the upload
             max_ratio: Maximum acceptable delta/file ratio (default: service max_ratio)
             override_name: Optional name to use instead of local_file.name (useful for S3-to-S3 copies)
+            precomputed_sha256: SHA256 of local_file if the caller already has it
+                (e.g. from ``write_and_hash``); skips rehashing the file
         """
         if max_ratio is None:
             max_ratio = self.max_ratio
 
         start_time = self.clock.now()
         file_size = local_file.stat().st_size
-        file_sha256 = self.hasher.sha256(local_file)
+        file_sha256 = precomputed_sha256 or self.hasher.sha256(local_file)
         original_name = override_name if override_name else local_file.name
 
         self.logger.info(
@@ -167,14 +400,27 @@ class DeltaService:
 
         return summary
 
-    def get(self, object_key: ObjectKey, out: BinaryIO | Path) -> None:
-        """Download and hydrate file (delta or direct)."""
+    def get(
+        self,
+        object_key: ObjectKey,
+        out: BinaryIO | Path,
+        obj_head: ObjectHead | None = None,
+    ) -> None:
+        """Download and hydrate file (delta or direct).
+
+        Args:
+            object_key: Object to download.
+            out: Destination path or writable binary stream.
+            obj_head: HEAD result for ``object_key`` when the caller already has
+                it (e.g. from an existence probe); saves a round-trip.
+        """
         start_time = self.clock.now()
 
         self.logger.info("Starting get operation", key=object_key.key)
 
         # Get object metadata
-        obj_head = self.storage.head(object_key.full_key)
+        if obj_head is None:
+            obj_head = self.storage.head(object_key.full_key)
         if obj_head is None:
             raise NotFoundError(f"Object not found: {object_key.key}")
 
@@ -186,13 +432,14 @@ class DeltaService:
         # `resolve_metadata` so both schemes route to the
         # DeltaGlider-managed download branches instead of the
         # "regular S3 object" passthrough.
-        if resolve_metadata(obj_head.metadata, "file_sha256") is None:
+        resolved = resolve_all(obj_head.metadata)
+        if "file_sha256" not in resolved:
             # This is a regular S3 object, download it directly
             self.logger.info(
                 "Downloading regular S3 object (no DeltaGlider metadata)",
                 key=object_key.key,
             )
-            self._get_direct(object_key, obj_head, out)
+            self._get_direct(object_key, obj_head, out, resolved)
             duration = (self.clock.now() - start_time).total_seconds()
             self.logger.log_operation(
                 op="get",
@@ -209,11 +456,11 @@ class DeltaService:
         # DeltaGlider. Use `resolve_metadata` so we recognise both the
         # legacy bare `compression` key and the new dashed
         # `dg-compression` key.
-        if resolve_metadata(obj_head.metadata, "compression") == "none":
+        if resolved.get("compression") == "none":
             # Direct download without delta processing
-            self._get_direct(object_key, obj_head, out)
+            self._get_direct(object_key, obj_head, out, resolved)
             duration = (self.clock.now() - start_time).total_seconds()
-            file_size_meta = resolve_metadata(obj_head.metadata, "file_size")
+            file_size_meta = resolved.get("file_size")
             file_size_value = int(file_size_meta) if file_size_meta else obj_head.size
             self.logger.log_operation(
                 op="get",
@@ -242,45 +489,79 @@ class DeltaService:
         cache_hit = self.cache.has_ref(
             delta_space.bucket, delta_space.prefix, delta_meta.ref_sha256
         )
+        zero_diff = delta_meta.file_sha256 == delta_meta.ref_sha256
+        ref_future: Future[None] | None = None
         if not cache_hit:
-            self._cache_reference(delta_space, delta_meta.ref_sha256)
-
-        # Download delta and decode
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            delta_path = tmp_path / "delta"
-            # SECURITY: Use validated ref to prevent TOCTOU attacks
-            ref_path = self.cache.get_validated_ref(
-                delta_space.bucket, delta_space.prefix, delta_meta.ref_sha256
-            )
-            out_path = tmp_path / "output"
+            if zero_diff:
+                self._cache_reference(delta_space, delta_meta.ref_sha256)
+            else:
+                # Decoding needs both transfers, but neither depends on the
+                # other: fetch the reference while the delta downloads below
+                ref_future = self._executor.submit(
+                    self._cache_reference, delta_space, delta_meta.ref_sha256
+                )
 
-            # Download delta
-            with open(delta_path, "wb") as f:
-                delta_stream = self.storage.get(object_key.full_key)
-                for chunk in iter(lambda: delta_stream.read(8192), b""):
-                    f.write(chunk)
+        # Download delta and decode. When the target is a path, decode into a
+        # sibling directory so the final ``os.replace`` is an atomic
+        # same-filesystem rename; the output is created fresh there (not by
+        # mkstemp, which forces 0600) so it keeps the umask's default mode.
+        # Otherwise decode into this thread's scratch directory.
+        delta_path = _scratch_path("delta")
+        out_dir: Path | None = None
+        if isinstance(out, Path):
+            out_dir = Path(tempfile.mkdtemp(dir=out.parent, prefix=".deltaglider-"))
+            out_path = out_dir / out.name
+        else:
+            out_path = _scratch_path("output")
+        try:
+            if zero_diff:
+                # Zero-diff delta: the reference, validated against this very
+                # SHA, is the file, so skip the delta download and decode
+                # SECURITY: Use validated ref to prevent TOCTOU attacks
+                source = self.cache.get_validated_ref(
+                    delta_space.bucket, delta_space.prefix, delta_meta.ref_sha256
+                )
+            else:
+                # Download delta
+                with open(delta_path, "wb") as f:
+                    shutil.copyfileobj(self.storage.get(object_key.full_key), f, _IO_CHUNK)
 
-            # Decode
-            try:
-                self.diff.decode(ref_path, delta_path, out_path)
-            except Exception as e:
-                raise DiffDecodeError(f"Failed to decode delta: {e}") from e
+                if ref_future is not None:
+                    ref_future.result()
 
-            # Verify integrity
-            actual_sha = self.hasher.sha256(out_path)
-            if actual_sha != delta_meta.file_sha256:
-                raise IntegrityMismatchError(
-                    f"SHA256 mismatch: expected {delta_meta.file_sha256}, got {actual_sha}"
+                # SECURITY: Use validated ref to prevent TOCTOU attacks
+                ref_path = self.cache.get_validated_ref(
+                    delta_space.bucket, delta_space.prefix, delta_meta.ref_sha256
                 )
 
+                # Decode
+                try:
+                    self.diff.decode(ref_path, delta_path, out_path)
+                except Exception as e:
+                    raise DiffDecodeError(f"Failed to decode delta: {e}") from e
+
+                # Verify integrity
+                actual_sha = self.hasher.sha256(out_path)
+                if actual_sha != delta_meta.file_sha256:
+                    raise IntegrityMismatchError(
+                        f"SHA256 mismatch: expected {delta_meta.file_sha256}, got {actual_sha}"
+                    )
+                source = out_path
+
             # Write output
             if isinstance(out, Path):
-                out_path.rename(out)
+                if source is not out_path:
+                    shutil.copyfile(source, out_path)
+                os.replace(out_path, out)
             else:
-                with open(out_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(8192), b""):
-                        out.write(chunk)
+                with open(source, "rb") as f:
+                    _advise_sequential(f)
+                    _copy_file_to_stream(f, out)
+        finally:
+            delta_path.unlink(missing_ok=True)
+            out_path.unlink(missing_ok=True)
+            if out_dir is not None:
+                shutil.rmtree(out_dir, ignore_errors=True)
 
         duration = (self.clock.now() - start_time).total_seconds()
         self.logger.log_operation(
@@ -294,22 +575,36 @@ class DeltaService:
         self.metrics.timing("deltaglider.get.duration", duration)
 
     def verify(self, delta_key: ObjectKey) -> VerifyResult:
-        """Verify delta file integrity."""
+        """Verify delta file integrity.
+
+        With ``verify_ttl`` enabled, an object whose ETag has not changed since
+        it last verified successfully within the TTL is reported valid from
+        memory instead of being downloaded and rehashed again. The memory is
+        per service instance, so only long-lived clients benefit.
+        """
         start_time = self.clock.now()
 
         self.logger.info("Starting verify operation", key=delta_key.key)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = Path(tmpdir) / "output"
-            self.get(delta_key, out_path)
+        # One HEAD serves the cache check, the download and the expected SHA
+        delta_head = self.storage.head(delta_key.full_key)
+        if delta_head is None:
+            raise NotFoundError(f"Delta not found: {delta_key.key}")
+
+        cached = self._cached_verify(delta_key, delta_head)
+        if cached is not None:
+            self.metrics.increment("deltaglider.verify.cache_hit")
+            return cached
 
-            delta_head = self.storage.head(f"{delta_key.bucket}/{delta_key.key}")
-            if delta_head is None:
-                raise NotFoundError(f"Delta not found: {delta_key.key}")
+        out_path = _scratch_path("verify")
+        try:
+            self.get(delta_key, out_path, delta_head)
 
             delta_meta = DeltaMeta.from_dict(delta_head.metadata)
             actual_sha = self.hasher.sha256(out_path)
             valid = actual_sha == delta_meta.file_sha256
+        finally:
+            out_path.unlink(missing_ok=True)
 
         duration = (self.clock.now() - start_time).total_seconds()
         self.logger.info(
@@ -320,6 +615,9 @@ class DeltaService:
         )
         self.metrics.timing("deltaglider.verify.duration", duration)
 
+        if valid and self.verify_ttl > 0:
+            self._remember_verified(delta_key, delta_head.etag, actual_sha)
+
         return VerifyResult(
             valid=valid,
             expected_sha256=delta_meta.file_sha256,
@@ -327,6 +625,39 @@ class DeltaService:
             message="Integrity verified" if valid else "Integrity check failed",
         )
 
+    def _cached_verify(self, delta_key: ObjectKey, head: ObjectHead) -> VerifyResult | None:
+        """Return a remembered passing verify for an unchanged object, if still fresh."""
+        if self.verify_ttl <= 0 or not self._verified:
+            return None
+
+        cache_key = (delta_key.full_key, head.etag)
+        entry = self._verified.get(cache_key)
+        if entry is None:
+            return None
+
+        sha, verified_at = entry
+        expected_sha = resolve_metadata(head.metadata, "file_sha256")
+        if expected_sha != sha or time.monotonic() - verified_at >= self.verify_ttl:
+            del self._verified[cache_key]
+            return None
+
+        self._verified.move_to_end(cache_key)
+        self.logger.debug("Verify served from cache", key=delta_key.key)
+        return VerifyResult(
+            valid=True,
+            expected_sha256=sha,
+            actual_sha256=sha,
+            message="Integrity verified (cached)",
+        )
+
+    def _remember_verified(self, delta_key: ObjectKey, etag: str, sha: str) -> None:
+        """Record a passing verify, evicting the least recently used entry when full."""
+        cache_key = (delta_key.full_key, etag)
+        self._verified[cache_key] = (sha, time.monotonic())
+        self._verified.move_to_end(cache_key)
+        while len(self._verified) > _VERIFIED_CACHE_MAX:
+            self._verified.popitem(last=False)
+
     def _create_reference(
         self,
         local_file: Path,
@@ -347,31 +678,16 @@ class DeltaService:
             created_at=self.clock.now(),
         )
 
-        # Upload reference
+        # Upload reference in the background; the zero-diff delta encode and
+        # the cache copy below are local work that overlaps the transfer
         self.logger.info("Creating reference", key=ref_key)
-        self.storage.put(
+        ref_upload = self._executor.submit(
+            self.storage.put,
             full_ref_key,
             local_file,
             ref_meta.to_dict(),
         )
 
-        # Re-check for race condition
-        ref_head = self.storage.head(full_ref_key)
-        existing_sha = None
-        if ref_head:
-            existing_sha = resolve_metadata(ref_head.metadata, "file_sha256")
-        if ref_head and existing_sha and existing_sha != file_sha256:
-            self.logger.warning("Reference creation race detected, using existing")
-            # Proceed with existing reference
-            ref_sha256 = existing_sha
-        else:
-            ref_sha256 = file_sha256
-
-        # Cache reference
-        cached_path = self.cache.write_ref(delta_space.bucket, delta_space.prefix, local_file)
-        self.logger.debug("Cached reference", path=str(cached_path))
-
-        # Also create zero-diff delta
         delta_key = (
             f"{delta_space.prefix}/{original_name}.delta"
             if delta_space.prefix
@@ -380,9 +696,30 @@ class DeltaService:
         full_delta_key = f"{delta_space.bucket}/{delta_key}"
 
         with tempfile.NamedTemporaryFile() as zero_delta:
-            # Create empty delta using xdelta3
-            self.diff.encode(local_file, local_file, Path(zero_delta.name))
-            delta_size = Path(zero_delta.name).stat().st_size
+            try:
+                # Create empty delta using xdelta3
+                self.diff.encode(local_file, local_file, Path(zero_delta.name))
+                delta_size = Path(zero_delta.name).stat().st_size
+
+                # Cache reference
+                cached_path = self.cache.write_ref(
+                    delta_space.bucket, delta_space.prefix, local_file
+                )
+                self.logger.debug("Cached reference", path=str(cached_path))
+            finally:
+                ref_upload.result()
+
+            # Re-check for race condition
+            ref_head = self.storage.head(full_ref_key)
+            existing_sha = None
+            if ref_head:
+                existing_sha = resolve_metadata(ref_head.metadata, "file_sha256")
+            if ref_head and existing_sha and existing_sha != file_sha256:
+                self.logger.warning("Reference creation race detected, using existing")
+                # Proceed with existing reference
+                ref_sha256 = existing_sha
+            else:
+                ref_sha256 = file_sha256
 
             delta_meta = DeltaMeta(
                 tool=self.tool_version,
@@ -512,6 +849,12 @@ class DeltaService:
             cache_hit=cache_hit,
         )
 
+    def _open_large(self, full_key: str) -> BinaryIO:
+        """Open a possibly large object, with parallel ranged reads if storage offers them."""
+        if getattr(type(self.storage), "get_concurrent", None) is not None:
+            return self.storage.get_concurrent(full_key)
+        return self.storage.get(full_key)
+
     def _cache_reference(self, delta_space: DeltaSpace, expected_sha: str) -> None:
         """Download and cache reference."""
         ref_key = delta_space.reference_key()
@@ -519,70 +862,70 @@ class DeltaService:
 
         self.logger.info("Caching reference", key=ref_key)
 
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_ref:
-            tmp_path = Path(tmp_ref.name)
+        tmp_path = self.cache.reserve_temp(delta_space.bucket, delta_space.prefix)
+        try:
+            # Download reference, hashing it on the way to disk
+            with (
+                open(tmp_path, "wb") as tmp_ref,
+                closing(self._open_large(full_ref_key)) as ref_stream,
+            ):
+                actual_sha = _TeeReader(ref_stream, tmp_ref).copy_and_hash(self.hasher)
 
-            # Download reference
-            ref_stream = self.storage.get(full_ref_key)
-            for chunk in iter(lambda: ref_stream.read(8192), b""):
-                tmp_ref.write(chunk)
-            tmp_ref.flush()
-
-        # Verify SHA (after closing the file)
-        actual_sha = self.hasher.sha256(tmp_path)
-        if actual_sha != expected_sha:
-            tmp_path.unlink()
-            raise IntegrityMismatchError(
-                f"Reference SHA mismatch: expected {expected_sha}, got {actual_sha}"
-            )
+            # Verify SHA (after closing the file)
+            if actual_sha != expected_sha:
+                raise IntegrityMismatchError(
+                    f"Reference SHA mismatch: expected {expected_sha}, got {actual_sha}"
+                )
 
-        # Cache it
-        self.cache.write_ref(delta_space.bucket, delta_space.prefix, tmp_path)
-        tmp_path.unlink()
+            # Cache it: the staged file moves into place rather than being copied
+            self.cache.commit_temp(delta_space.bucket, delta_space.prefix, tmp_path, actual_sha)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     def _get_direct(
         self,
         object_key: ObjectKey,
         obj_head: ObjectHead,
         out: BinaryIO | Path,
+        resolved: dict[str, str] | None = None,
     ) -> None:
-        """Download file directly from S3 without delta processing."""
-        # Download the file directly
-        file_stream = self.storage.get(object_key.full_key)
+        """Download file directly from S3 without delta processing.
 
-        if isinstance(out, Path):
-            # Write to file path
-            with open(out, "wb") as f:
-                for chunk in iter(lambda: file_stream.read(8192), b""):
-                    f.write(chunk)
-        else:
-            # Write to binary stream
-            for chunk in iter(lambda: file_stream.read(8192), b""):
-                out.write(chunk)
+        ``resolved`` is the object's ``resolve_all`` metadata, if the caller has it.
+        """
+        if resolved is None:
+            resolved = resolve_all(obj_head.metadata)
+        expected_sha = resolved.get("file_sha256")
+
+        def write_to(sink: BinaryIO) -> str | None:
+            # With a SHA256 to verify, hash on the way out so the file never has
+            # to be re-read (and stream outputs get verified too)
+            if expected_sha:
+                return _TeeReader(file_stream, sink).copy_and_hash(self.hasher)
+            shutil.copyfileobj(file_stream, sink, _IO_CHUNK)
+            return None
 
-        # Verify integrity if SHA256 is present
-        expected_sha = resolve_metadata(obj_head.metadata, "file_sha256")
-        if expected_sha:
+        # Closing the stream cancels any ranged reads still in flight if the
+        # copy fails partway
+        with closing(self._open_large(object_key.full_key)) as file_stream:
             if isinstance(out, Path):
-                actual_sha = self.hasher.sha256(out)
+                # Write to file path
+                with open(out, "wb") as f:
+                    actual_sha = write_to(f)
             else:
-                # For streams, we can't verify after writing
-                # This would need a different approach (e.g., computing on the fly)
-                self.logger.warning(
-                    "Cannot verify SHA256 for stream output",
-                    key=object_key.key,
-                )
-                return
+                # Write to binary stream
+                actual_sha = write_to(out)
 
-            if actual_sha != expected_sha:
-                raise IntegrityMismatchError(
-                    f"SHA256 mismatch: expected {expected_sha}, got {actual_sha}"
-                )
+        # Verify integrity if SHA256 is present
+        if expected_sha and actual_sha != expected_sha:
+            raise IntegrityMismatchError(
+                f"SHA256 mismatch: expected {expected_sha}, got {actual_sha}"
+            )
 
         self.logger.info(
             "Direct download complete",
             key=object_key.key,
-            size=resolve_metadata(obj_head.metadata, "file_size"),
+            size=resolved.get("file_size"),
         )
 
     def _upload_direct(
@@ -660,13 +1003,11 @@ class DeltaService:
             self._delete_reference(object_key, full_key, result)
         elif object_key.key.endswith(".delta"):
             self._delete_delta(object_key, full_key, obj_head, result)
-        elif resolve_metadata(obj_head.metadata, "compression") == "none":
+        elif (resolved := resolve_all(obj_head.metadata)).get("compression") == "none":
             self.storage.delete(full_key)
             result.deleted = True
             result.type = "direct"
-            result.original_name = (
-                resolve_metadata(obj_head.metadata, "original_name") or object_key.key
-            )
+            result.original_name = resolved.get("original_name") or object_key.key
         else:
             self.storage.delete(full_key)
             result.deleted = True
@@ -686,16 +1027,58 @@ class DeltaService:
 
         return result
 
+    def _head_many(self, bucket: str, keys: list[str]) -> dict[str, ObjectHead | None]:
+        """HEAD bucket-relative keys in one batch, keyed by the relative key.
+
+        Storage implementations without ``head_many`` are queried one by one.
+        """
+        full_keys = [f"{bucket}/{key}" for key in keys]
+        if getattr(type(self.storage), "head_many", None) is not None:
+            heads = self.storage.head_many(full_keys)
+        else:
+            heads = {full_key: self.storage.head(full_key) for full_key in full_keys}
+        return {key: heads.get(full_key) for key, full_key in zip(keys, full_keys, strict=True)}
+
+    def _list_wide(self, prefix: str) -> Iterable[ObjectHead]:
+        """List a possibly large prefix whose consumer does not depend on order.
+
+        Storage implementations without ``list_sharded`` fall back to ``list``.
+        """
+        if getattr(type(self.storage), "list_sharded", None) is not None:
+            return self.storage.list_sharded(prefix)
+        return self.storage.list(prefix)
+
+    def _delete_many(self, bucket: str, keys: list[str]) -> list[tuple[str, Exception | None]]:
+        """Delete bucket-relative keys in bulk, pairing each key with its error (or None).
+
+        Storage implementations without ``delete_many`` are called one by one.
+        """
+        if getattr(type(self.storage), "delete_many", None) is not None:
+            results = self.storage.delete_many([f"{bucket}/{key}" for key in keys])
+            return [(key, error) for key, (_, error) in zip(keys, results, strict=True)]
+        outcomes: list[tuple[str, Exception | None]] = []
+        for key in keys:
+            try:
+                self.storage.delete(f"{bucket}/{key}")
+            except Exception as e:
+                outcomes.append((key, e))
+            else:
+                outcomes.append((key, None))
+        return outcomes
+
     def _delete_reference(self, object_key: ObjectKey, full_key: str, result: DeleteResult) -> None:
         """Handle deletion of a reference.bin file."""
         prefix = object_key.key.rsplit("/", 1)[0] if "/" in object_key.key else ""
         dependent_deltas = []
 
+        # Listed ObjectHeads already carry metadata; no per-delta HEAD needed
         for obj in self.storage.list(f"{object_key.bucket}/{prefix}"):
-            if obj.key.endswith(".delta") and obj.key != object_key.key:
-                delta_head = self.storage.head(f"{object_key.bucket}/{obj.key}")
-                if delta_head and delta_head.metadata.get("ref_key") == object_key.key:
-                    dependent_deltas.append(obj.key)
+            if (
+                obj.key.endswith(".delta")
+                and obj.key != object_key.key
+                and obj.metadata.get("ref_key") == object_key.key
+            ):
+                dependent_deltas.append(obj.key)
 
         if dependent_deltas:
             result.warnings.append(
@@ -737,16 +1120,20 @@ class DeltaService:
         if "/" not in object_key.key:
             return
 
-        deltaspace_prefix = "/".join(object_key.key.split("/")[:-1])
+        deltaspace_prefix = object_key.key.rpartition("/")[0]
         ref_key = f"{deltaspace_prefix}/reference.bin"
 
-        remaining_deltas = [
-            obj.key
-            for obj in self.storage.list(f"{object_key.bucket}/{deltaspace_prefix}")
-            if obj.key.endswith(".delta") and obj.key != object_key.key
-        ]
+        # Keys alone answer this; any() stops the listing at the first sibling delta
+        ds_prefix = f"{object_key.bucket}/{deltaspace_prefix}"
+        shallow = getattr(type(self.storage), "list_shallow", None) is not None
+        has_remaining_deltas = any(
+            obj.key.endswith(".delta") and obj.key != object_key.key
+            for obj in (
+                self.storage.list_shallow(ds_prefix) if shallow else self.storage.list(ds_prefix)
+            )
+        )
 
-        if not remaining_deltas:
+        if not has_remaining_deltas:
             ref_full_key = f"{object_key.bucket}/{ref_key}"
             ref_head = self.storage.head(ref_full_key)
             if ref_head:
@@ -783,12 +1170,16 @@ class DeltaService:
         )
 
         # Also check for references in parent deltaspaces affected by delta deletion
-        for ds_prefix in affected_deltaspaces:
-            ref_key = f"{ds_prefix}/reference.bin"
-            if ref_key not in references:
-                ref_head = self.storage.head(f"{bucket}/{ref_key}")
-                if ref_head:
-                    references.append(ref_key)
+        listed_references = set(references)
+        unlisted_refs = [
+            ref_key
+            for ref_key in (
+                f"{ds_prefix}/reference.bin" for ds_prefix in sorted(affected_deltaspaces)
+            )
+            if ref_key not in listed_references
+        ]
+        ref_heads = self._head_many(bucket, unlisted_refs)
+        references.extend(ref_key for ref_key in unlisted_refs if ref_heads[ref_key])
 
         result = RecursiveDeleteResult(
             bucket=bucket,
@@ -800,15 +1191,14 @@ class DeltaService:
         )
 
         # Phase 2: delete non-reference files first (dependency order)
-        for key in other_objects + direct_uploads + deltas:
-            try:
-                self.storage.delete(f"{bucket}/{key}")
+        for key, error in self._delete_many(bucket, other_objects + direct_uploads + deltas):
+            if error is None:
                 result.deleted_count += 1
                 self.logger.debug(f"Deleted {key}")
-            except Exception as e:
+            else:
                 result.failed_count += 1
-                result.errors.append(f"Failed to delete {key}: {str(e)}")
-                self.logger.error(f"Failed to delete {key}: {e}")
+                result.errors.append(f"Failed to delete {key}: {str(error)}")
+                self.logger.error(f"Failed to delete {key}: {error}")
 
         # Phase 3: delete references only if safe
         references_kept = self._delete_references_if_safe(bucket, prefix, references, result)
@@ -849,25 +1239,106 @@ class DeltaService:
         other_objects: list[str] = []
         affected_deltaspaces: set[str] = set()
 
-        for obj in self.storage.list(f"{bucket}/{prefix}" if prefix else bucket):
-            if prefix and not obj.key.startswith(prefix):
-                continue
+        # A "/"-terminated prefix lets the LIST stay within one folder, so every
+        # listed key is in scope and needs no client-side filtering
+        if prefix and not prefix.endswith("/"):
+            prefix = f"{prefix}/"
 
-            if obj.key.endswith("/reference.bin"):
-                references.append(obj.key)
-            elif obj.key.endswith(".delta"):
-                deltas.append(obj.key)
-                if "/" in obj.key:
-                    affected_deltaspaces.add("/".join(obj.key.split("/")[:-1]))
+        # References and deltas are recognised by key alone, so when the storage
+        # can list without metadata only the remaining objects are HEADed (in
+        # one batch) to tell direct uploads from foreign objects
+        list_prefix = f"{bucket}/{prefix}" if prefix else bucket
+        shallow = getattr(type(self.storage), "list_sharded", None) is not None
+        listing = (
+            self.storage.list_sharded(list_prefix, metadata=False)
+            if shallow
+            else self.storage.list(list_prefix)
+        )
+        unclassified: list[ObjectHead] = []
+        for obj in listing:
+            key = obj.key
+            if key.endswith("/reference.bin"):
+                references.append(key)
+            elif key.endswith(".delta"):
+                deltas.append(key)
+                deltaspace, sep, _ = key.rpartition("/")
+                if sep:
+                    affected_deltaspaces.add(deltaspace)
             else:
-                obj_head = self.storage.head(f"{bucket}/{obj.key}")
-                if obj_head and resolve_metadata(obj_head.metadata, "compression") == "none":
-                    direct_uploads.append(obj.key)
-                else:
-                    other_objects.append(obj.key)
+                unclassified.append(obj)
+
+        if shallow:
+            heads = self._head_many(bucket, [obj.key for obj in unclassified])
+            unclassified = [head for head in heads.values() if head is not None]
+        for obj in unclassified:
+            if resolve_metadata(obj.metadata, "compression") == "none":
+                direct_uploads.append(obj.key)
+            else:
+                other_objects.append(obj.key)
 
         return references, deltas, direct_uploads, other_objects, affected_deltaspaces
 
+    def _references_in_use(
+        self, bucket: str, prefix: str, references: list[str]
+    ) -> dict[str, bool]:
+        """Map each reference to whether objects outside the deletion scope share its deltaspace.
+
+        A lone reference is probed directly, stopping at the first hit. Several
+        references share one listing per distinct root prefix; the out-of-scope
+        keys are sorted once so each check is a binary search.
+        """
+
+        def deltaspace_of(ref_key: str) -> str:
+            if ref_key.endswith("/reference.bin"):
+                return ref_key[:-14]  # Remove "/reference.bin"
+            return ""
+
+        def list_prefix(deltaspace: str) -> str:
+            return f"{bucket}/{deltaspace}" if deltaspace else bucket
+
+        if len(references) == 1:
+            ref_key = references[0]
+            ds_list_prefix = list_prefix(deltaspace_of(ref_key))
+            if getattr(type(self.storage), "exists_any", None) is not None:
+                return {ref_key: self.storage.exists_any(ds_list_prefix, ref_key, prefix)}
+            return {
+                ref_key: any(
+                    obj.key != ref_key and not (prefix and obj.key.startswith(prefix))
+                    for obj in self.storage.list(ds_list_prefix)
+                )
+            }
+
+        # Sorted, a deltaspace follows any root it extends, so comparing with
+        # the last root is enough to list each object at most once
+        roots: list[str] = []
+        for deltaspace in sorted({deltaspace_of(ref_key) for ref_key in references}):
+            if not roots or not deltaspace.startswith(roots[-1]):
+                roots.append(deltaspace)
+
+        shallow = getattr(type(self.storage), "list_shallow", None) is not None
+        outside = sorted(
+            obj.key
+            for root in roots
+            for obj in (
+                self.storage.list_shallow(list_prefix(root))
+                if shallow
+                else self.storage.list(list_prefix(root))
+            )
+            if not (prefix and obj.key.startswith(prefix))
+        )
+
+        in_use: dict[str, bool] = {}
+        for ref_key in references:
+            deltaspace = deltaspace_of(ref_key)
+            in_use[ref_key] = False
+            for key in itertools.islice(outside, bisect.bisect_left(outside, deltaspace), None):
+                if not key.startswith(deltaspace):
+                    break
+                if key != ref_key:
+                    in_use[ref_key] = True
+                    break
+        return in_use
+
     def _delete_references_if_safe(
         self,
         bucket: str,
@@ -880,37 +1351,38 @@ class DeltaService:
         Returns the number of references kept (not deleted).
         """
         references_kept = 0
-        deletion_prefix_full = f"{bucket}/{prefix}" if prefix else bucket
-
-        for ref_key in references:
-            try:
-                if ref_key.endswith("/reference.bin"):
-                    deltaspace_prefix = ref_key[:-14]  # Remove "/reference.bin"
-                else:
-                    deltaspace_prefix = ""
-
-                ds_list_prefix = f"{bucket}/{deltaspace_prefix}" if deltaspace_prefix else bucket
-                has_remaining_files = any(
-                    not (prefix and f"{bucket}/{obj.key}".startswith(deletion_prefix_full))
-                    and obj.key != ref_key
-                    for obj in self.storage.list(ds_list_prefix)
-                )
-
-                if not has_remaining_files:
-                    self.storage.delete(f"{bucket}/{ref_key}")
-                    result.deleted_count += 1
-                    self.logger.debug(f"Deleted reference {ref_key}")
-                else:
-                    references_kept += 1
-                    result.warnings.append(f"Kept reference {ref_key} (still in use)")
-                    self.logger.info(
-                        f"Kept reference {ref_key} - still in use outside deletion scope"
-                    )
+        safe_to_delete: list[str] = []
+
+        try:
+            in_use = self._references_in_use(bucket, prefix, references)
+        except Exception as e:
+            # One failed listing must not fail unrelated references: check each alone
+            self.logger.warning(f"Batched reference check failed, checking one by one: {e}")
+            in_use = {}
+            for ref_key in references:
+                try:
+                    in_use.update(self._references_in_use(bucket, prefix, [ref_key]))
+                except Exception as ref_error:
+                    result.failed_count += 1
+                    result.errors.append(f"Failed to delete reference {ref_key}: {str(ref_error)}")
+                    self.logger.error(f"Failed to delete reference {ref_key}: {ref_error}")
+
+        for ref_key, used in in_use.items():
+            if not used:
+                safe_to_delete.append(ref_key)
+            else:
+                references_kept += 1
+                result.warnings.append(f"Kept reference {ref_key} (still in use)")
+                self.logger.info(f"Kept reference {ref_key} - still in use outside deletion scope")
 
-            except Exception as e:
+        for ref_key, error in self._delete_many(bucket, safe_to_delete):
+            if error is None:
+                result.deleted_count += 1
+                self.logger.debug(f"Deleted reference {ref_key}")
+            else:
                 result.failed_count += 1
-                result.errors.append(f"Failed to delete reference {ref_key}: {str(e)}")
-                self.logger.error(f"Failed to delete reference {ref_key}: {e}")
+                result.errors.append(f"Failed to delete reference {ref_key}: {str(error)}")
+                self.logger.error(f"Failed to delete reference {ref_key}: {error}")
 
         return references_kept
 
@@ -939,15 +1411,29 @@ class DeltaService:
         """
         start_time = self.clock.now()
 
-        # Check if object exists and is deltaglider-compressed
-        obj_head = self.storage.head(f"{bucket}/{key}")
-
-        # If not found directly, try with .delta extension
-        if obj_head is None and not key.endswith(".delta"):
-            obj_head = self.storage.head(f"{bucket}/{key}.delta")
+        # Check if object exists and is deltaglider-compressed. Files the delta
+        # policy covers are almost always stored as <key>.delta, so probe that
+        # form first; anything else is probed as-is first.
+        if key.endswith(".delta"):
+            candidates = [key]
+        elif self.should_use_delta(Path(key).name):
+            candidates = [f"{key}.delta", key]
+        else:
+            candidates = [key, f"{key}.delta"]
+        obj_head = None
+        for candidate in candidates:
+            try:
+                obj_head = self.storage.head(f"{bucket}/{candidate}")
+            except Exception as e:
+                if candidate == candidates[-1]:
+                    raise
+                # Without s3:ListBucket a missing key is a 403, not a 404: a
+                # refused speculative probe is a miss, not a failure
+                self.logger.debug(f"Probe of {candidate} failed, trying next: {e}")
+                continue
             if obj_head is not None:
-                # Found the delta version, update the key
-                key = f"{key}.delta"
+                key = candidate
+                break
 
         if obj_head is None:
             raise NotFoundError(f"Object not found: {key}")
@@ -967,22 +1453,13 @@ class DeltaService:
         # Use the original filename without .delta extension for the temp file
         original_name = key.removesuffix(".delta") if key.endswith(".delta") else key
         temp_filename = f"{uuid.uuid4().hex}_{Path(original_name).name}"
-        temp_key = f".deltaglider/tmp/{temp_filename}"
-
-        # Download and decompress the file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            decompressed_path = tmp_path / "decompressed"
 
-            # Use the existing get method to decompress
-            object_key = ObjectKey(bucket=bucket, key=key)
-            self.get(object_key, decompressed_path)
-
-            # Calculate expiration time
+        def temp_target() -> tuple[str, dict[str, str]]:
+            # Expiry counts from when the temporary copy is written. Its epoch
+            # leads the key, so purge_temp_files can judge expiry from a listing.
             expires_at = self.clock.now() + timedelta(seconds=expires_in_seconds)
-
-            # Create metadata for temporary file
-            metadata = {
+            temp_key = f".deltaglider/tmp/{_utc_epoch(expires_at)}/{temp_filename}"
+            return temp_key, {
                 "dg-expires-at": expires_at.isoformat(),
                 "dg-original-key": key,
                 "dg-original-filename": Path(original_name).name,
@@ -990,19 +1467,41 @@ class DeltaService:
                 "dg-created-at": self.clock.now().isoformat(),
             }
 
-            # Upload the decompressed file
+        if (
+            not is_delta
+            and resolve_metadata(obj_head.metadata, "compression") == "none"
+            and getattr(type(self.storage), "copy", None) is not None
+        ):
+            # Direct uploads are stored as-is: copy them server-side
+            temp_key, metadata = temp_target()
             self.logger.info(
-                "Uploading rehydrated file",
+                "Copying direct upload for download",
                 original_key=key,
                 temp_key=temp_key,
-                expires_at=expires_at.isoformat(),
+                expires_at=metadata["dg-expires-at"],
             )
+            self.storage.copy(f"{bucket}/{key}", f"{bucket}/{temp_key}", metadata)
+        else:
+            # Decompress into this thread's scratch directory; get() verifies the
+            # SHA256 before the file appears there, so only checked bytes are
+            # uploaded (large files go up as concurrent multipart parts)
+            decompressed_path = _scratch_path("rehydrate")
+            try:
+                # Use the existing get method to decompress, reusing the HEAD above
+                object_key = ObjectKey(bucket=bucket, key=key)
+                self.get(object_key, decompressed_path, obj_head)
 
-            self.storage.put(
-                f"{bucket}/{temp_key}",
-                decompressed_path,
-                metadata,
-            )
+                # Upload the decompressed file
+                temp_key, metadata = temp_target()
+                self.logger.info(
+                    "Uploading rehydrated file",
+                    original_key=key,
+                    temp_key=temp_key,
+                    expires_at=metadata["dg-expires-at"],
+                )
+                self.storage.put(f"{bucket}/{temp_key}", decompressed_path, metadata)
+            finally:
+                decompressed_path.unlink(missing_ok=True)
 
         duration = (self.clock.now() - start_time).total_seconds()
         self.logger.info(
@@ -1019,8 +1518,9 @@ class DeltaService:
     def purge_temp_files(self, bucket: str) -> dict[str, Any]:
         """Purge expired temporary files from .deltaglider/tmp/.
 
-        Scans the .deltaglider/tmp/ prefix and deletes any files
-        whose dg-expires-at metadata indicates they have expired.
+        Scans the .deltaglider/tmp/ prefix and deletes any files whose
+        expiry (the epoch segment of the key, or dg-expires-at metadata for
+        older flat keys) has passed.
 
         Args:
             bucket: S3 bucket to purge temp files from
@@ -1039,55 +1539,117 @@ class DeltaService:
         total_size_freed = 0
         errors = []
 
-        # List all objects in temp directory
-        for obj in self.storage.list(f"{bucket}/{prefix}"):
-            if not obj.key.startswith(prefix):
-                continue
+        # The purge is a pipeline: the listing (prefetched by the storage), the
+        # HEADs of legacy keys and the bulk deletes all run at once. At most
+        # _PURGE_IN_FLIGHT delete batches are outstanding; settling the oldest
+        # before submitting more keeps memory flat however many keys expire.
+        batch: list[tuple[ObjectHead, int]] = []
+        pending: deque[
+            tuple[list[tuple[ObjectHead, int]], Future[list[tuple[str, Exception | None]]]]
+        ] = deque()
+
+        def settle(in_flight: int) -> None:
+            nonlocal deleted_count, error_count, total_size_freed
+            while len(pending) > in_flight:
+                entries, future = pending.popleft()
+                try:
+                    outcomes = future.result()
+                except Exception as e:
+                    # The whole request failed; every key in it is unaccounted for
+                    outcomes = [(obj.key, e) for obj, _ in entries]
+                for (obj, expires_epoch), (_, error) in zip(entries, outcomes, strict=True):
+                    if error is not None:
+                        error_count += 1
+                        errors.append(f"Error processing {obj.key}: {str(error)}")
+                        self.logger.error(f"Failed to process temp file {obj.key}: {error}")
+                    else:
+                        deleted_count += 1
+                        total_size_freed += obj.size
+                        self.logger.debug(
+                            f"Deleted expired temp file {obj.key}",
+                            expired_at=datetime.fromtimestamp(expires_epoch, UTC).isoformat(),
+                            size=obj.size,
+                        )
+
+        def submit(entries: list[tuple[ObjectHead, int]]) -> None:
+            settle(_PURGE_IN_FLIGHT - 1)
+            keys = [obj.key for obj, _ in entries]
+            pending.append((entries, self._executor.submit(self._delete_many, bucket, keys)))
+
+        # Expiries are compared as whole epoch seconds; stamps round up, so
+        # nothing is purged before its time
+        now = self.clock.now()
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=UTC)  # the clock reports naive UTC
+        now_epoch = math.floor(now.timestamp())
+
+        # Keys written by rehydrate_for_download lead with their expiry epoch
+        # (.deltaglider/tmp/<epoch>/<name>), so a shallow listing decides them;
+        # older flat keys only carry the expiry in metadata and are HEADed, a
+        # batch at a time on the executor while the listing continues
+        shallow = getattr(type(self.storage), "list_shallow", None) is not None
+        listing = (
+            self.storage.list_shallow(f"{bucket}/{prefix}")
+            if shallow
+            else self._list_wide(f"{bucket}/{prefix}")
+        )
 
-            try:
-                # Get object metadata
-                obj_head = self.storage.head(f"{bucket}/{obj.key}")
-                if obj_head is None:
+        def candidates() -> Iterator[tuple[ObjectHead, int | None]]:
+            unstamped: list[str] = []
+            lookups: list[Future[dict[str, ObjectHead | None]]] = []
+            for obj in listing:
+                if not obj.key.startswith(prefix):
                     continue
-
+                epoch, sep, _ = obj.key[len(prefix) :].partition("/")
+                if sep and epoch.isdigit():
+                    yield obj, int(epoch)
+                elif shallow:
+                    unstamped.append(obj.key)
+                    if len(unstamped) >= _PURGE_BATCH:
+                        lookups.append(self._executor.submit(self._head_many, bucket, unstamped))
+                        unstamped = []
+                else:
+                    yield obj, None
+            if unstamped:
+                lookups.append(self._executor.submit(self._head_many, bucket, unstamped))
+            for lookup in lookups:
+                heads = lookup.result()
+                yield from ((head, None) for head in heads.values() if head is not None)
+
+        for obj, expires_epoch in candidates():
+            try:
                 # Check expiration
-                expires_at_str = obj_head.metadata.get("dg-expires-at")
-                if not expires_at_str:
-                    # No expiration metadata, skip
-                    self.logger.debug(f"No expiration metadata for {obj.key}")
-                    continue
-
-                # Parse expiration time
-                from datetime import datetime
-
-                try:
-                    expires_at = datetime.fromisoformat(expires_at_str.replace("Z", "+00:00"))
-                    if expires_at.tzinfo is None:
-                        expires_at = expires_at.replace(tzinfo=UTC)
-                except ValueError:
-                    self.logger.warning(
-                        f"Invalid expiration format for {obj.key}: {expires_at_str}"
-                    )
-                    continue
+                if expires_epoch is None:
+                    expires_at_str = obj.metadata.get("dg-expires-at")
+                    if not expires_at_str:
+                        # No expiration metadata, skip
+                        self.logger.debug(f"No expiration metadata for {obj.key}")
+                        continue
+
+                    expires_epoch = _parse_expiry(expires_at_str)
+                    if expires_epoch is None:
+                        self.logger.warning(
+                            f"Invalid expiration format for {obj.key}: {expires_at_str}"
+                        )
+                        continue
 
                 # Check if expired
-                if self.clock.now() >= expires_at:
+                if now_epoch >= expires_epoch:
                     expired_count += 1
-                    # Delete the file
-                    self.storage.delete(f"{bucket}/{obj.key}")
-                    deleted_count += 1
-                    total_size_freed += obj.size
-                    self.logger.debug(
-                        f"Deleted expired temp file {obj.key}",
-                        expired_at=expires_at_str,
-                        size=obj.size,
-                    )
+                    batch.append((obj, expires_epoch))
+                    if len(batch) >= _PURGE_BATCH:
+                        submit(batch)
+                        batch = []
 
             except Exception as e:
                 error_count += 1
                 errors.append(f"Error processing {obj.key}: {str(e)}")
                 self.logger.error(f"Failed to process temp file {obj.key}: {e}")
 
+        if batch:
+            submit(batch)
+        settle(0)
+
         duration = (self.clock.now() - start_time).total_seconds()
 
         result = {
@@ -1,5 +1,7 @@
 """Cache port interface."""
 
+import os
+import tempfile
 from pathlib import Path
 from typing import Protocol
 
@@ -39,6 +41,26 @@ class CachePort(Protocol):
         """Cache reference file."""
         ...
 
+    def reserve_temp(self, bucket: str, prefix: str) -> Path:
+        """Reserve a staging file for a reference about to be downloaded.
+
+        Filesystem caches place it on the cache's own filesystem, so
+        ``commit_temp`` can move the file into place instead of copying it.
+        """
+        fd, name = tempfile.mkstemp(prefix="dg-ref-")
+        os.close(fd)
+        return Path(name)
+
+    def commit_temp(self, bucket: str, prefix: str, tmp_path: Path, sha: str) -> Path:
+        """Cache a staged reference whose SHA256 the caller has verified.
+
+        Consumes ``tmp_path`` and returns the cached file's path.
+        """
+        try:
+            return self.write_ref(bucket, prefix, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
     def evict(self, bucket: str, prefix: str) -> None:
         """Remove cached reference."""
         ...
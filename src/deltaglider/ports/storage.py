@@ -1,6 +1,6 @@
 """Storage port interface."""
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -33,14 +33,46 @@ class StoragePort(Protocol):
         """Get object metadata."""
         ...
 
+    def head_many(self, keys: Iterable[str]) -> dict[str, ObjectHead | None]:
+        """Get metadata for several objects, keyed by the requested key."""
+        return {key: self.head(key) for key in keys}
+
     def list(self, prefix: str) -> Iterator[ObjectHead]:
         """List objects by prefix."""
         ...
 
+    def list_shallow(self, prefix: str) -> Iterator[ObjectHead]:
+        """List objects by prefix from the listing alone; metadata may be left empty."""
+        return self.list(prefix)
+
+    def list_sharded(
+        self, prefix: str, shards: int = 16, metadata: bool = True
+    ) -> Iterator[ObjectHead]:
+        """List objects by prefix with up to ``shards`` concurrent sub-listings.
+
+        Objects may be yielded in any order. With ``metadata=False`` their
+        metadata may be left empty.
+        """
+        return self.list(prefix)
+
+    def exists_any(self, prefix: str, exclude_key: str = "", within: str = "") -> bool:
+        """Whether any object under prefix, other than exclude_key, lies outside within.
+
+        exclude_key and within are bucket-relative; an empty within excludes nothing.
+        """
+        return any(
+            obj.key != exclude_key and not (within and obj.key.startswith(within))
+            for obj in self.list(prefix)
+        )
+
     def get(self, key: str) -> BinaryIO:
         """Get object content as stream."""
         ...
 
+    def get_concurrent(self, key: str) -> BinaryIO:
+        """Get object content as stream, downloading large objects in parallel parts."""
+        return self.get(key)
+
     def put(
         self,
         key: str,
@@ -51,6 +83,28 @@ class StoragePort(Protocol):
         """Put object with metadata."""
         ...
 
+    def copy(
+        self,
+        src_key: str,
+        dst_key: str,
+        metadata: dict[str, str],
+        content_type: str = "application/octet-stream",
+    ) -> PutResult:
+        """Copy an object, replacing its metadata."""
+        return self.put(dst_key, self.get(src_key), metadata, content_type)
+
     def delete(self, key: str) -> None:
         """Delete object."""
         ...
+
+    def delete_many(self, keys: Iterable[str]) -> Sequence[tuple[str, Exception | None]]:
+        """Delete several objects, returning each key with its error (None on success)."""
+        results: list[tuple[str, Exception | None]] = []
+        for key in keys:
+            try:
+                self.delete(key)
+            except Exception as e:
+                results.append((key, e))
+            else:
+                results.append((key, None))
+        return results
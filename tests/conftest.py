@@ -15,6 +15,15 @@ from deltaglider.adapters import (
     UtcClockAdapter,
 )
 from deltaglider.core import DeltaService
+from deltaglider.core.config import DeltaGliderConfig
+
+
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Re-read DG_* environment variables for every test (they may be monkeypatched)."""
+    DeltaGliderConfig.reset_cache()
+    yield
+    DeltaGliderConfig.reset_cache()
 
 
 @pytest.fixture
@@ -67,7 +67,7 @@ class TestCpCommand:
             )
 
             # Mock service.get to create the file
-            def mock_get(obj_key, local_path):
+            def mock_get(obj_key, local_path, obj_head=None):
                 # Create the file so stat() works
                 local_path.write_bytes(b"downloaded content")
 
@@ -80,6 +80,107 @@ class TestCpCommand:
                 assert "download:" in result.output
                 mock_service.get.assert_called_once()
 
+    def test_cp_download_auto_detects_delta(self):
+        """Downloading a bare key falls back to its .delta counterpart."""
+        runner = CliRunner()
+        mock_service = create_mock_service()
+
+        def mock_head(full_key):
+            if full_key.endswith(".delta"):
+                return ObjectHead(
+                    key="test.zip.delta", size=100, etag="etag", last_modified=None, metadata={}
+                )
+            return None
+
+        mock_service.storage.head.side_effect = mock_head
+
+        def mock_get(obj_key, local_path, obj_head=None):
+            local_path.write_bytes(b"downloaded content")
+
+        mock_service.get.side_effect = mock_get
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "downloaded.zip"
+            with patch("deltaglider.app.cli.main.create_service", return_value=mock_service):
+                result = runner.invoke(cli, ["cp", "s3://test-bucket/test.zip", str(output_file)])
+
+        assert result.exit_code == 0
+        assert "Auto-detected delta" in result.output
+        obj_key, _, obj_head = mock_service.get.call_args.args
+        assert obj_key.key == "test.zip.delta"
+        # The probe's HEAD result is reused instead of HEADing again
+        assert obj_head.key == "test.zip.delta"
+
+    def test_cp_download_plain_object_without_delta(self):
+        """A bare key is downloaded as-is when no .delta counterpart exists."""
+        runner = CliRunner()
+        mock_service = create_mock_service()
+
+        def mock_head(full_key):
+            if full_key.endswith(".delta"):
+                return None
+            return ObjectHead(key="notes.txt", size=5, etag="etag", last_modified=None, metadata={})
+
+        mock_service.storage.head.side_effect = mock_head
+        mock_service.get.side_effect = lambda obj_key, local_path, obj_head=None: (
+            local_path.write_bytes(b"hello")
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "notes.txt"
+            with patch("deltaglider.app.cli.main.create_service", return_value=mock_service):
+                result = runner.invoke(cli, ["cp", "s3://test-bucket/notes.txt", str(output_file)])
+
+        assert result.exit_code == 0
+        assert "Auto-detected delta" not in result.output
+        assert mock_service.get.call_args.args[0].key == "notes.txt"
+
+    def test_cp_download_plain_object_when_delta_probe_is_forbidden(self):
+        """A 403 on the speculative .delta HEAD falls back to the bare key."""
+        from botocore.exceptions import ClientError
+
+        runner = CliRunner()
+        mock_service = create_mock_service()
+
+        def mock_head(full_key):
+            if full_key.endswith(".delta"):
+                raise ClientError({"Error": {"Code": "403"}}, "HeadObject")
+            return ObjectHead(key="notes.txt", size=5, etag="etag", last_modified=None, metadata={})
+
+        mock_service.storage.head.side_effect = mock_head
+        mock_service.get.side_effect = lambda obj_key, local_path, obj_head=None: (
+            local_path.write_bytes(b"hello")
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "notes.txt"
+            with patch("deltaglider.app.cli.main.create_service", return_value=mock_service):
+                result = runner.invoke(cli, ["cp", "s3://test-bucket/notes.txt", str(output_file)])
+
+        assert result.exit_code == 0, result.output
+        assert mock_service.get.call_args.args[0].key == "notes.txt"
+
+    def test_resolve_download_key_batches_probes_and_survives_403(self):
+        """S3 storage probes both keys on its pool; a refused probe is a miss."""
+        from botocore.exceptions import ClientError
+
+        from deltaglider.adapters.storage_s3 import S3StorageAdapter
+        from deltaglider.app.cli.aws_compat import _resolve_download_key
+
+        def head_object(Bucket, Key):
+            if Key.endswith(".delta"):
+                raise ClientError({"Error": {"Code": "403"}}, "HeadObject")
+            return {"ContentLength": 5, "ETag": '"e"', "LastModified": None, "Metadata": {}}
+
+        client = MagicMock()
+        client.head_object.side_effect = head_object
+        service = Mock(storage=S3StorageAdapter(client=client))
+
+        key, head = _resolve_download_key(service, "test-bucket", "notes.txt")
+
+        assert key == "notes.txt"
+        assert head is not None and head.size == 5
+
     def test_cp_recursive(self):
         """Test cp command with recursive flag."""
         runner = CliRunner()
@@ -206,3 +307,158 @@ class TestSyncCommand:
 # Since the core functionality (cp and sync) is tested and working,
 # and ls/rm are simpler wrappers around S3 operations, we can consider
 # the AWS S3 CLI compatibility sufficiently tested for now.
+
+
+class TestPutManyCommand:
+    """Test put-many batch upload command."""
+
+    @staticmethod
+    def _summary(name: str) -> PutSummary:
+        return PutSummary(
+            operation="create_delta",
+            bucket="test-bucket",
+            key=f"releases/{name}.delta",
+            original_name=name,
+            file_size=12,
+            file_sha256="abc123",
+            delta_size=3,
+            delta_ratio=0.25,
+            ref_key="releases/reference.bin",
+        )
+
+    def _write_files(self, tmpdir: str, count: int) -> list[str]:
+        paths = []
+        for i in range(count):
+            path = Path(tmpdir) / f"app-{i}.zip"
+            path.write_bytes(b"test content")
+            paths.append(str(path))
+        return paths
+
+    def test_put_many_serial(self):
+        """With one job every file goes through the parent's service into the prefix."""
+        runner = CliRunner()
+        mock_service = create_mock_service()
+        mock_service.put.side_effect = lambda path, space, ratio: self._summary(path.name)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = self._write_files(tmpdir, 3)
+            with patch("deltaglider.app.cli.main.create_service", return_value=mock_service):
+                result = runner.invoke(
+                    cli, ["put-many", "-j", "1", "s3://test-bucket/releases", *files]
+                )
+
+        assert result.exit_code == 0, result.output
+        assert result.output.count("upload:") == 3
+        assert mock_service.put.call_count == 3
+        spaces = {call.args[1].prefix for call in mock_service.put.call_args_list}
+        assert spaces == {"releases"}
+
+    def test_put_many_process_pool(self):
+        """Files after the first are uploaded by worker processes."""
+        import multiprocessing
+
+        runner = CliRunner()
+        mock_service = create_mock_service()
+        workers_at_first_put = []
+
+        def mock_put(path, space, ratio):
+            workers_at_first_put.append(len(multiprocessing.active_children()))
+            return self._summary(path.name)
+
+        mock_service.put.side_effect = mock_put
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = self._write_files(tmpdir, 4)
+            with patch("deltaglider.app.cli.main.create_service", return_value=mock_service):
+                result = runner.invoke(
+                    cli, ["put-many", "-j", "2", "s3://test-bucket/releases/", *files]
+                )
+
+        assert result.exit_code == 0, result.output
+        assert result.output.count("upload:") == 4
+        # Only the reference-establishing first upload runs in this process, and
+        # the workers were forked before it started any threads
+        assert mock_service.put.call_count == 1
+        assert workers_at_first_put == [2]
+
+    def test_put_many_rejects_duplicate_basenames(self):
+        """Two files with one base name would race for the same key."""
+        runner = CliRunner()
+        mock_service = create_mock_service()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for sub in ("a", "b"):
+                (Path(tmpdir) / sub).mkdir()
+                (Path(tmpdir) / sub / "app.zip").write_bytes(b"test content")
+            files = [str(Path(tmpdir) / sub / "app.zip") for sub in ("a", "b")]
+            with patch("deltaglider.app.cli.main.create_service", return_value=mock_service):
+                result = runner.invoke(cli, ["put-many", "s3://test-bucket/releases/", *files])
+
+        assert result.exit_code == 1
+        assert "app.zip" in result.output
+        mock_service.put.assert_not_called()
+
+    def test_put_many_reports_failures(self):
+        """A failed upload is reported and makes the command exit non-zero."""
+        runner = CliRunner()
+        mock_service = create_mock_service()
+        mock_service.put.side_effect = [self._summary("app-0.zip"), RuntimeError("boom")]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = self._write_files(tmpdir, 2)
+            with patch("deltaglider.app.cli.main.create_service", return_value=mock_service):
+                result = runner.invoke(
+                    cli, ["put-many", "-j", "1", "s3://test-bucket/releases/", *files]
+                )
+
+        assert result.exit_code == 1
+        assert "boom" in result.output
+        assert "1 of 2 uploads failed" in result.output
+
+
+class TestLazyService:
+    """The service is only built when a command actually runs."""
+
+    def test_help_does_not_create_service(self):
+        runner = CliRunner()
+        with patch("deltaglider.app.cli.main.create_service") as factory:
+            result = runner.invoke(cli, ["cp", "--help"])
+
+        assert result.exit_code == 0
+        factory.assert_not_called()
+
+    def test_service_created_once_per_invocation(self):
+        runner = CliRunner()
+        mock_service = create_mock_service()
+        mock_service.verify.return_value = Mock(
+            valid=True, expected_sha256="a", actual_sha256="a", message="ok"
+        )
+
+        with patch("deltaglider.app.cli.main.create_service", return_value=mock_service) as factory:
+            result = runner.invoke(cli, ["verify", "s3://bucket/file.zip"])
+
+        assert result.exit_code == 0
+        factory.assert_called_once()
+
+
+class TestJsonOutput:
+    """CLI JSON output is identical with or without orjson."""
+
+    def test_dumps_json_matches_stdlib(self):
+        import json
+        from datetime import UTC, datetime
+
+        from deltaglider.app.cli import main as cli_main
+
+        payload = {
+            "bucket": "b",
+            "count": 3,
+            "valid": True,
+            "created": datetime(2024, 1, 1, tzinfo=UTC),
+            "items": [{"key": "a.zip", "name": "naïve ✓"}],
+        }
+
+        expected = json.dumps(payload, indent=2, default=str, ensure_ascii=False)
+        assert cli_main._dumps_json(payload, default=str) == expected
+        with patch.object(cli_main, "_orjson", None):
+            assert cli_main._dumps_json(payload, default=str) == expected
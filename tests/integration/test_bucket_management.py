@@ -4,6 +4,7 @@ from typing import Any
 from unittest.mock import Mock
 
 import pytest
+from botocore.exceptions import ClientError
 
 from deltaglider.app.cli.main import create_service
 from deltaglider.client import DeltaGliderClient
@@ -70,7 +71,9 @@ class TestBucketManagement:
 
         # Mock boto3 client to raise BucketAlreadyExists
         mock_boto3_client = Mock()
-        mock_boto3_client.create_bucket.side_effect = Exception("BucketAlreadyOwnedByYou")
+        mock_boto3_client.create_bucket.side_effect = ClientError(
+            {"Error": {"Code": "BucketAlreadyOwnedByYou", "Message": "owned"}}, "CreateBucket"
+        )
         mock_storage.client = mock_boto3_client
 
         client = DeltaGliderClient(service)
@@ -195,7 +198,9 @@ class TestBucketManagement:
 
         # Mock boto3 client to raise NoSuchBucket
         mock_boto3_client = Mock()
-        mock_boto3_client.delete_bucket.side_effect = Exception("NoSuchBucket")
+        mock_boto3_client.delete_bucket.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchBucket", "Message": "missing"}}, "DeleteBucket"
+        )
         mock_storage.client = mock_boto3_client
 
         client = DeltaGliderClient(service)
@@ -199,6 +199,23 @@ class TestCredentialHandling:
         assert client is not None
         assert client.service.storage.client is not None
 
+
+class TestEnvironmentConfig:
+    """create_client takes its tunables from DeltaGliderConfig."""
+
+    def test_ttls_are_read_from_config(self, monkeypatch):
+        from deltaglider.core.config import DeltaGliderConfig
+
+        monkeypatch.setenv("DG_VERIFY_TTL", "30")
+        monkeypatch.setenv("DG_STATS_CACHE_TTL", "15")
+        DeltaGliderConfig.reset_cache()
+
+        client = create_client()
+
+        assert client.service.verify_ttl == 30.0
+        assert client._stats_cache_ttl == 15.0
+        assert create_client(verify_ttl=5).service.verify_ttl == 5
+
     def test_create_client_with_endpoint_and_credentials(self, tmp_path):
         """Test passing both endpoint URL and credentials."""
         client = create_client(
@@ -226,6 +243,14 @@ class TestBoto3Compatibility:
         obj = client.service.storage.objects["test-bucket/test.txt"]
         assert obj["data"] == b"Hello World"
 
+    def test_put_object_etag_is_content_sha256(self, client):
+        """put_object reports the content SHA256 as ETag."""
+        import hashlib
+
+        response = client.put_object(Bucket="test-bucket", Key="etag.txt", Body=b"etag body")
+
+        assert response["ETag"] == f'"{hashlib.sha256(b"etag body").hexdigest()}"'
+
     def test_put_object_with_string(self, client):
         """Test put_object with string data."""
         response = client.put_object(Bucket="test-bucket", Key="test2.txt", Body="Hello String")
@@ -389,6 +414,19 @@ class TestDeltaGliderFeatures:
         # Should find files in folder1
         assert any("folder1/" in item["Key"] for item in similar)
 
+    def test_find_similar_files_lists_version_family_first(self, client):
+        """A versioned name only lists its own family when that family has matches."""
+        storage = client.service.storage
+        for name in ("app-v1.2.3.zip", "app-v1.2.4.zip", "tool-v9.zip"):
+            storage.objects[f"test-bucket/releases/{name}"] = {"size": 10, "metadata": {}}
+
+        similar = client.find_similar_files("test-bucket", "releases/", "app-v1.2.5.zip")
+
+        assert [item["Key"] for item in similar] == [
+            "releases/app-v1.2.3.zip",
+            "releases/app-v1.2.4.zip",
+        ]
+
     def test_upload_batch(self, client, tmp_path):
         """Test batch upload functionality."""
         # Create test files
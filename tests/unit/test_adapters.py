@@ -48,6 +48,28 @@ class TestSha256Adapter:
         # Verify
         assert actual == expected
 
+    def test_sha256_multi_chunk_file(self, temp_dir):
+        """Test hashing a file larger than one read buffer."""
+        file_path = temp_dir / "large.bin"
+        content = bytes(range(256)) * 8193  # ~2 MiB, not chunk-aligned
+        file_path.write_bytes(content)
+
+        assert Sha256Adapter().sha256(file_path) == hashlib.sha256(content).hexdigest()
+
+    def test_sha256_mapped_handles_empty_and_regular_files(self, temp_dir):
+        """Test mmap-based hashing of open files, including empty ones."""
+        from deltaglider.adapters.hash_sha import sha256_mapped
+
+        empty = temp_dir / "empty.bin"
+        empty.write_bytes(b"")
+        data = temp_dir / "data.bin"
+        data.write_bytes(b"reference bytes" * 1000)
+
+        with open(empty, "rb") as f:
+            assert sha256_mapped(f) == hashlib.sha256(b"").hexdigest()
+        with open(data, "rb") as f:
+            assert sha256_mapped(f) == hashlib.sha256(b"reference bytes" * 1000).hexdigest()
+
 
 class TestFsCacheAdapter:
     """Test filesystem cache adapter."""
@@ -132,6 +154,20 @@ class TestFsCacheAdapter:
         assert cached.read_text() == "source content"
         assert cached == temp_dir / "cache" / "bucket" / "deltaspace/path" / "reference.bin"
 
+    def test_reserve_and_commit_temp_moves_into_place(self, temp_dir):
+        """A staged reference lives beside its cache path and is renamed, not copied."""
+        hasher = Sha256Adapter()
+        adapter = FsCacheAdapter(temp_dir / "cache", hasher)
+
+        staged = adapter.reserve_temp("bucket", "deltaspace")
+        staged.write_text("staged content")
+        cached = adapter.commit_temp("bucket", "deltaspace", staged, hasher.sha256(staged))
+
+        assert staged.parent == cached.parent
+        assert not staged.exists()
+        assert cached == adapter.ref_path("bucket", "deltaspace")
+        assert cached.read_text() == "staged content"
+
     def test_evict(self, temp_dir):
         """Test evicting cached reference."""
         # Setup
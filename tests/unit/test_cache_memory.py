@@ -198,3 +198,16 @@ class TestMemoryCache:
         # Access order should now be: [prefix2, prefix1]
         assert memory_cache._access_order[0] == ("bucket", "prefix2")
         assert memory_cache._access_order[1] == ("bucket", "prefix1")
+
+    def test_rewrite_same_key_replaces_size(self, memory_cache, temp_dir):
+        """Re-caching a deltaspace replaces its entry instead of double-counting."""
+        file1 = temp_dir / "v1.bin"
+        file2 = temp_dir / "v2.bin"
+        file1.write_bytes(b"a" * 100)
+        file2.write_bytes(b"b" * 40)
+
+        memory_cache.write_ref("bucket", "prefix", file1)
+        memory_cache.write_ref("bucket", "prefix", file2)
+
+        assert memory_cache._current_size == 40
+        assert memory_cache._access_order == [("bucket", "prefix")]
@@ -0,0 +1,30 @@
+"""Tests for DeltaGliderConfig environment parsing."""
+
+from deltaglider.core.config import DeltaGliderConfig
+
+
+class TestFromEnv:
+    """Environment variables are parsed once and reused until reset."""
+
+    def test_env_parsed_once_until_reset(self, monkeypatch):
+        monkeypatch.setenv("DG_MAX_RATIO", "0.3")
+        first = DeltaGliderConfig.from_env(region="eu-west-1")
+        assert first.max_ratio == 0.3
+        assert first.region == "eu-west-1"
+
+        monkeypatch.setenv("DG_MAX_RATIO", "0.9")
+        second = DeltaGliderConfig.from_env()
+        assert second.max_ratio == 0.3
+        assert second is not first
+        assert second.region is None
+
+        DeltaGliderConfig.reset_cache()
+        assert DeltaGliderConfig.from_env().max_ratio == 0.9
+
+    def test_log_level_env_overrides_argument(self, monkeypatch):
+        monkeypatch.delenv("DG_LOG_LEVEL", raising=False)
+        assert DeltaGliderConfig.from_env(log_level="DEBUG").log_level == "DEBUG"
+
+        monkeypatch.setenv("DG_LOG_LEVEL", "WARNING")
+        DeltaGliderConfig.reset_cache()
+        assert DeltaGliderConfig.from_env(log_level="DEBUG").log_level == "WARNING"
@@ -1,5 +1,6 @@
 """Unit tests for DeltaService."""
 
+import os
 import warnings
 
 import pytest
@@ -10,6 +11,7 @@ from deltaglider.core import (
     ObjectKey,
     PolicyViolationWarning,
 )
+from deltaglider.core.models import DeleteResult, RecursiveDeleteResult
 from deltaglider.ports.storage import ObjectHead, PutResult
 
 
@@ -38,6 +40,25 @@ class TestDeltaServicePut:
         assert mock_storage.head.call_count == 2  # Initial check + re-check
         assert mock_storage.put.call_count == 2  # Reference + zero-diff delta
 
+    def test_put_with_precomputed_sha_skips_hashing(self, service, temp_dir, mock_storage):
+        """A SHA256 produced by write_and_hash is reused instead of rehashing the file."""
+        import io
+        from unittest.mock import patch
+
+        mock_storage.head.return_value = None
+        mock_storage.put.return_value = PutResult(etag="abc123")
+        local_file = temp_dir / "notes.txt"
+        sha = service.write_and_hash(io.BytesIO(b"some notes"), local_file)
+
+        with patch.object(service.hasher, "sha256") as rehash:
+            summary = service.put(
+                local_file, DeltaSpace(bucket="test-bucket", prefix="docs"), precomputed_sha256=sha
+            )
+
+        rehash.assert_not_called()
+        assert local_file.read_bytes() == b"some notes"
+        assert summary.file_sha256 == sha
+
     def test_create_delta_subsequent_file(self, service, sample_file, mock_storage, mock_diff):
         """Test creating delta for subsequent file."""
         # Setup
@@ -174,6 +195,13 @@ class TestDeltaServicePut:
         assert "dg-created-at" in emitted_meta
 
 
+def _default_file_mode() -> int:
+    """Mode a freshly created file gets under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 class TestDeltaServiceGet:
     """Test DeltaService.get method."""
 
@@ -219,6 +247,120 @@ class TestDeltaServiceGet:
         assert output_path.exists()
         assert output_path.read_bytes() == test_content
 
+    def test_get_reuses_supplied_head(self, service, mock_storage, temp_dir):
+        """A HEAD result passed by the caller is used instead of a new HEAD."""
+        import io
+
+        key = ObjectKey(bucket="test-bucket", key="test/notes.txt")
+        head = ObjectHead(key="test/notes.txt", size=5, etag="abc", last_modified=None, metadata={})
+        mock_storage.get.return_value = io.BytesIO(b"hello")
+
+        output_path = temp_dir / "notes.txt"
+        service.get(key, output_path, head)
+
+        mock_storage.head.assert_not_called()
+        assert output_path.read_bytes() == b"hello"
+
+    def test_get_direct_to_stream_verifies_sha_in_flight(self, service, mock_storage):
+        """Direct downloads into a stream are hashed while written and verified."""
+        import hashlib
+        import io
+
+        from deltaglider.core import IntegrityMismatchError
+
+        key = ObjectKey(bucket="test-bucket", key="test/notes.txt")
+        metadata = {
+            "dg-file-sha256": hashlib.sha256(b"hello").hexdigest(),
+            "dg-compression": "none",
+        }
+        head = ObjectHead(
+            key="test/notes.txt", size=5, etag="a", last_modified=None, metadata=metadata
+        )
+
+        mock_storage.get.return_value = io.BytesIO(b"hello")
+        out = io.BytesIO()
+        service.get(key, out, head)
+        assert out.getvalue() == b"hello"
+
+        tampered = io.BytesIO(b"tampered")
+        mock_storage.get.return_value = tampered
+        with pytest.raises(IntegrityMismatchError):
+            service.get(key, io.BytesIO(), head)
+        assert tampered.closed
+
+    def test_get_delta_leaves_no_scratch_files(self, service, mock_storage, mock_diff, temp_dir):
+        """Delta downloads clean up their intermediates, for path and stream targets."""
+        import hashlib
+        import io
+
+        reference, content = b"reference bytes", b"decoded content"
+        metadata = {
+            "dg-tool": "deltaglider/test",
+            "dg-original-name": "app.zip",
+            "dg-file-sha256": hashlib.sha256(content).hexdigest(),
+            "dg-file-size": str(len(content)),
+            "dg-created-at": "2026-01-01T00:00:00Z",
+            "dg-ref-key": "releases/reference.bin",
+            "dg-ref-sha256": hashlib.sha256(reference).hexdigest(),
+            "dg-delta-size": "5",
+        }
+        head = ObjectHead(
+            key="releases/app.zip.delta", size=5, etag="e", last_modified=None, metadata=metadata
+        )
+        mock_storage.get.side_effect = lambda key: io.BytesIO(
+            reference if key.endswith("reference.bin") else b"delta"
+        )
+        mock_diff.decode.side_effect = lambda base, delta, out: out.write_bytes(content)
+        key = ObjectKey(bucket="test-bucket", key="releases/app.zip.delta")
+
+        target_dir = temp_dir / "downloads"
+        target_dir.mkdir()
+        service.get(key, target_dir / "app.zip", head)
+        stream = io.BytesIO()
+        service.get(key, stream, head)
+
+        assert [p.name for p in target_dir.iterdir()] == ["app.zip"]
+        assert (target_dir / "app.zip").read_bytes() == content
+        assert (target_dir / "app.zip").stat().st_mode & 0o777 == _default_file_mode()
+        assert stream.getvalue() == content
+        scratch_dir = mock_diff.decode.call_args.args[1].parent
+        assert list(scratch_dir.iterdir()) == []
+
+    def test_get_zero_diff_delta_served_from_reference(
+        self, service, mock_storage, mock_diff, temp_dir
+    ):
+        """A delta whose file SHA equals its reference SHA skips download and decode."""
+        import hashlib
+        import io
+
+        content = b"identical to the reference"
+        sha = hashlib.sha256(content).hexdigest()
+        metadata = {
+            "dg-tool": "deltaglider/test",
+            "dg-original-name": "app.zip",
+            "dg-file-sha256": sha,
+            "dg-file-size": str(len(content)),
+            "dg-created-at": "2026-01-01T00:00:00Z",
+            "dg-ref-key": "releases/reference.bin",
+            "dg-ref-sha256": sha,
+            "dg-delta-size": "5",
+        }
+        head = ObjectHead(
+            key="releases/app.zip.delta", size=5, etag="e", last_modified=None, metadata=metadata
+        )
+        mock_storage.get.side_effect = lambda key: io.BytesIO(content)
+        key = ObjectKey(bucket="test-bucket", key="releases/app.zip.delta")
+
+        service.get(key, temp_dir / "app.zip", head)
+        stream = io.BytesIO()
+        service.get(key, stream, head)
+
+        assert (temp_dir / "app.zip").read_bytes() == content
+        assert (temp_dir / "app.zip").stat().st_mode & 0o777 == _default_file_mode()
+        assert stream.getvalue() == content
+        mock_storage.get.assert_called_once_with("test-bucket/releases/reference.bin")
+        mock_diff.decode.assert_not_called()
+
     def test_get_legacy_direct_upload_not_misclassified_as_regular_s3(
         self, service, mock_storage, temp_dir
     ):
@@ -357,3 +499,451 @@ class TestDeltaServiceVerify:
         assert result.expected_sha256 == test_sha
         assert result.actual_sha256 == test_sha
         assert "verified" in result.message.lower()
+
+    def test_verify_ttl_reuses_result_until_etag_changes(
+        self, service, mock_storage, mock_diff, temp_dir
+    ):
+        """A passing verify is reused for an unchanged ETag while verify_ttl is set."""
+        import io
+
+        delta_key = ObjectKey(bucket="test-bucket", key="test/file.zip.delta")
+        test_content = b"test file content"
+        ref_content = b"reference content for test"
+        test_sha = service.hasher.sha256(io.BytesIO(test_content))
+        ref_sha = service.hasher.sha256(io.BytesIO(ref_content))
+
+        delta_metadata = {
+            "dg-tool": "deltaglider/0.1.0",
+            "dg-original-name": "file.zip",
+            "dg-file-sha256": test_sha,
+            "dg-file-size": str(len(test_content)),
+            "dg-created-at": "2025-01-01T00:00:00Z",
+            "dg-ref-key": "test/reference.bin",
+            "dg-ref-sha256": ref_sha,
+            "dg-delta-size": "100",
+            "dg-delta-cmd": "xdelta3 -e -9 -s reference.bin file.zip file.zip.delta",
+        }
+        mock_storage.head.return_value = ObjectHead(
+            key="test/file.zip.delta",
+            size=100,
+            etag="delta123",
+            last_modified=None,
+            metadata=delta_metadata,
+        )
+        mock_storage.get.side_effect = lambda key: io.BytesIO(
+            b"delta content" if "delta" in key else ref_content
+        )
+        mock_diff.decode.side_effect = lambda base, delta, out: out.write_bytes(test_content)
+
+        ref_path = service.cache.ref_path("test-bucket", "test")
+        ref_path.parent.mkdir(parents=True, exist_ok=True)
+        ref_path.write_bytes(ref_content)
+
+        service.verify_ttl = 60.0
+        first = service.verify(delta_key)
+        second = service.verify(delta_key)
+
+        assert first.valid is True
+        assert second.valid is True
+        assert second.actual_sha256 == test_sha
+        assert mock_diff.decode.call_count == 1
+        assert mock_storage.head.call_count == 2  # one HEAD per verify
+
+        # A new ETag means the object changed, so it must be re-verified
+        mock_storage.head.return_value = ObjectHead(
+            key="test/file.zip.delta",
+            size=100,
+            etag="delta456",
+            last_modified=None,
+            metadata=delta_metadata,
+        )
+        service.verify(delta_key)
+        assert mock_diff.decode.call_count == 2
+
+
+class TestCopyFileToStream:
+    """Decoded output reaches caller streams via sendfile or copyfileobj."""
+
+    def test_copies_into_file_and_memory_streams(self, temp_dir):
+        import io
+
+        from deltaglider.core.service import _copy_file_to_stream
+
+        payload = bytes(range(256)) * 5000
+        src_path = temp_dir / "decoded"
+        src_path.write_bytes(payload)
+
+        with open(temp_dir / "out", "wb") as out, open(src_path, "rb") as src:
+            out.write(b"head:")
+            _copy_file_to_stream(src, out)
+            out.write(b":tail")
+        assert (temp_dir / "out").read_bytes() == b"head:" + payload + b":tail"
+
+        memory = io.BytesIO()
+        with open(src_path, "rb") as src:
+            _copy_file_to_stream(src, memory)
+        assert memory.getvalue() == payload
+
+
+class TestClassifyForDeletion:
+    """Recursive-delete classification works from the listing alone."""
+
+    def test_classifies_from_listed_metadata_without_head(self, service, mock_storage):
+        def head(key, metadata=None):
+            return ObjectHead(
+                key=key, size=1, etag="e", last_modified=None, metadata=metadata or {}
+            )
+
+        mock_storage.list.return_value = [
+            head("app/reference.bin"),
+            head("app/v1.zip.delta"),
+            head("app/notes.txt", {"dg-compression": "none"}),
+            head("app/foreign.bin"),
+        ]
+
+        references, deltas, direct, other, spaces = service._classify_objects_for_deletion(
+            "bucket", "app/"
+        )
+
+        assert references == ["app/reference.bin"]
+        assert deltas == ["app/v1.zip.delta"]
+        assert direct == ["app/notes.txt"]
+        assert other == ["app/foreign.bin"]
+        assert spaces == {"app"}
+        mock_storage.head.assert_not_called()
+
+    def test_only_unrecognised_keys_are_headed_after_a_shallow_listing(self, service):
+        class ShallowStorage:
+            def __init__(self):
+                self.heads = []
+
+            def list_sharded(self, prefix, shards=16, metadata=True):
+                assert metadata is False
+                return [
+                    ObjectHead(key=key, size=1, etag="e", last_modified=None, metadata={})
+                    for key in ("app/reference.bin", "app/v1.zip.delta", "app/notes.txt")
+                ]
+
+            def head(self, key):
+                self.heads.append(key)
+                return ObjectHead(
+                    key=key.split("/", 1)[1],
+                    size=1,
+                    etag="e",
+                    last_modified=None,
+                    metadata={"dg-compression": "none"},
+                )
+
+        service.storage = ShallowStorage()
+
+        references, deltas, direct, other, _ = service._classify_objects_for_deletion(
+            "bucket", "app/"
+        )
+
+        assert (references, deltas, direct, other) == (
+            ["app/reference.bin"],
+            ["app/v1.zip.delta"],
+            ["app/notes.txt"],
+            [],
+        )
+        assert service.storage.heads == ["bucket/app/notes.txt"]
+
+    def test_prefix_is_listed_as_a_folder(self, service, mock_storage):
+        mock_storage.list.return_value = []
+
+        service._classify_objects_for_deletion("bucket", "app")
+
+        mock_storage.list.assert_called_once_with("bucket/app/")
+
+
+class TestDeleteDelta:
+    """Deleting a delta checks for sibling deltas from the listing alone."""
+
+    def test_sibling_check_uses_a_shallow_listing(self, service):
+        class ShallowStorage:
+            def __init__(self):
+                self.listed = []
+                self.deleted = []
+
+            def list_shallow(self, prefix):
+                self.listed.append(prefix)
+                return [
+                    ObjectHead(key=key, size=1, etag="e", last_modified=None, metadata={})
+                    for key in ("app/reference.bin", "app/v2.zip.delta")
+                ]
+
+            def list(self, prefix):
+                raise AssertionError("sibling check must not HEAD every object")
+
+            def delete(self, key):
+                self.deleted.append(key)
+
+        service.storage = ShallowStorage()
+        head = ObjectHead(key="app/v1.zip.delta", size=1, etag="e", last_modified=None, metadata={})
+        result = DeleteResult(key="app/v1.zip.delta", bucket="bucket")
+
+        service._delete_delta(
+            ObjectKey("bucket", "app/v1.zip.delta"), "bucket/app/v1.zip.delta", head, result
+        )
+
+        assert service.storage.listed == ["bucket/app"]
+        assert service.storage.deleted == ["bucket/app/v1.zip.delta"]
+        assert result.cleaned_reference is None
+
+
+class TestReferencesInUse:
+    """Reference safety checks share one listing per root deltaspace."""
+
+    def test_nested_deltaspaces_share_a_listing(self, service, mock_storage):
+        remaining = ["a/b/x.zip.delta", "a/reference.bin", "c/reference.bin"]
+
+        def list_objects(prefix):
+            listed = prefix.split("/", 1)[1]
+            return [
+                ObjectHead(key=key, size=1, etag="e", last_modified=None, metadata={})
+                for key in remaining
+                if key.startswith(listed)
+            ]
+
+        mock_storage.list.side_effect = list_objects
+
+        in_use = service._references_in_use(
+            "bucket", "", ["a/reference.bin", "a/b/reference.bin", "c/reference.bin"]
+        )
+
+        assert in_use == {
+            "a/reference.bin": True,
+            "a/b/reference.bin": True,
+            "c/reference.bin": False,
+        }
+        assert sorted(c.args[0] for c in mock_storage.list.call_args_list) == [
+            "bucket/a",
+            "bucket/c",
+        ]
+
+    def test_failed_listing_only_fails_its_own_reference(self, service, mock_storage):
+        def list_objects(prefix):
+            if prefix == "bucket/a":
+                raise RuntimeError("access denied")
+            return [
+                ObjectHead(key="c/reference.bin", size=1, etag="e", last_modified=None, metadata={})
+            ]
+
+        mock_storage.list.side_effect = list_objects
+        result = RecursiveDeleteResult(bucket="bucket", prefix="")
+
+        kept = service._delete_references_if_safe(
+            "bucket", "", ["a/reference.bin", "c/reference.bin"], result
+        )
+
+        assert kept == 0
+        assert result.failed_count == 1
+        assert result.errors == ["Failed to delete reference a/reference.bin: access denied"]
+        mock_storage.delete.assert_called_once_with("bucket/c/reference.bin")
+
+
+class TestRehydrateForDownload:
+    """Rehydration re-uploads a decompressed copy under .deltaglider/tmp/."""
+
+    def test_rehydrate_heads_object_once(self, service, mock_storage):
+        import hashlib
+        import io
+
+        content = b"rehydrated bytes"
+        mock_storage.head.return_value = ObjectHead(
+            key="app/notes.txt",
+            size=len(content),
+            etag="e",
+            last_modified=None,
+            metadata={
+                "dg-file-sha256": hashlib.sha256(content).hexdigest(),
+                "dg-compression": "none",
+            },
+        )
+        mock_storage.get.return_value = io.BytesIO(content)
+        mock_storage.put.return_value = PutResult(etag="tmp")
+
+        temp_key = service.rehydrate_for_download("bucket", "app/notes.txt")
+
+        epoch, _, name = temp_key.removeprefix(".deltaglider/tmp/").partition("/")
+        assert epoch.isdigit() and name.endswith("_notes.txt")
+        mock_storage.head.assert_called_once_with("bucket/app/notes.txt")
+        assert mock_storage.put.call_args.args[0] == f"bucket/{temp_key}"
+        assert not mock_storage.put.call_args.args[1].exists()  # scratch copy removed
+
+    def test_delta_candidates_probe_the_delta_key_first(self, service, mock_storage):
+        mock_storage.head.side_effect = lambda key: (
+            ObjectHead(
+                key="app/v2.zip.delta",
+                size=1,
+                etag="e",
+                last_modified=None,
+                metadata={"dg-file-sha256": "abc"},
+            )
+            if key == "bucket/app/v2.zip.delta"
+            else None
+        )
+        mock_storage.put.return_value = PutResult(etag="tmp")
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(service, "get", lambda *args: args[1].write_bytes(b"data"))
+            service.rehydrate_for_download("bucket", "app/v2.zip")
+
+        mock_storage.head.assert_called_once_with("bucket/app/v2.zip.delta")
+
+    def test_refused_speculative_probe_falls_through(self, service, mock_storage):
+        def head(key):
+            if key.endswith(".delta"):
+                raise RuntimeError("403 Forbidden")
+            return ObjectHead(key="app/v2.zip", size=1, etag="e", last_modified=None, metadata={})
+
+        mock_storage.head.side_effect = head
+
+        assert service.rehydrate_for_download("bucket", "app/v2.zip") is None
+        assert mock_storage.head.call_count == 2
+
+    def test_direct_upload_is_copied_server_side(self, service):
+        class CopyingStorage:
+            def __init__(self):
+                self.copies = []
+
+            def head(self, key):
+                return ObjectHead(
+                    key="app/notes.txt",
+                    size=1,
+                    etag="e",
+                    last_modified=None,
+                    metadata={"dg-file-sha256": "abc", "dg-compression": "none"},
+                )
+
+            def copy(self, src_key, dst_key, metadata, content_type="application/octet-stream"):
+                self.copies.append((src_key, dst_key, metadata))
+                return PutResult(etag="copied")
+
+        service.storage = CopyingStorage()
+
+        temp_key = service.rehydrate_for_download("bucket", "app/notes.txt")
+
+        [(src_key, dst_key, metadata)] = service.storage.copies
+        assert src_key == "bucket/app/notes.txt"
+        assert dst_key == f"bucket/{temp_key}"
+        assert metadata["dg-original-key"] == "app/notes.txt"
+        assert "dg-expires-at" in metadata
+
+
+class TestPurgeTempFiles:
+    """Expired rehydrated copies are purged using the listed metadata."""
+
+    def test_purges_expired_without_extra_heads(self, service, mock_storage):
+        def head(key, expires_at=None):
+            metadata = {"dg-expires-at": expires_at} if expires_at else {}
+            return ObjectHead(key=key, size=10, etag="e", last_modified=None, metadata=metadata)
+
+        mock_storage.list.return_value = [
+            head(".deltaglider/tmp/old.zip", "2000-01-01T00:00:00Z"),
+            head(".deltaglider/tmp/new.zip", "2999-01-01T00:00:00Z"),
+            head(".deltaglider/tmp/unmarked.zip"),
+        ]
+
+        result = service.purge_temp_files("bucket")
+
+        assert result["deleted_count"] == 1
+        assert result["total_size_freed"] == 10
+        mock_storage.delete.assert_called_once_with("bucket/.deltaglider/tmp/old.zip")
+        mock_storage.head.assert_not_called()
+
+    def test_failed_deletes_are_reported(self, service, mock_storage):
+        mock_storage.list.return_value = [
+            ObjectHead(
+                key=f".deltaglider/tmp/{name}.zip",
+                size=10,
+                etag="e",
+                last_modified=None,
+                metadata={"dg-expires-at": "2000-01-01T00:00:00Z"},
+            )
+            for name in ("a", "b")
+        ]
+        mock_storage.delete.side_effect = [None, RuntimeError("denied")]
+
+        result = service.purge_temp_files("bucket")
+
+        assert result["expired_count"] == 2
+        assert result["deleted_count"] == 1
+        assert result["error_count"] == 1
+        assert result["total_size_freed"] == 10
+
+    def test_expired_keys_are_deleted_in_batches(self, service):
+        from unittest.mock import patch
+
+        from deltaglider.core import service as service_module
+
+        class BulkDeleteStorage:
+            def __init__(self):
+                self.batches = []
+
+            def list(self, prefix):
+                return [
+                    ObjectHead(
+                        key=f".deltaglider/tmp/{i}.zip",
+                        size=1,
+                        etag="e",
+                        last_modified=None,
+                        metadata={"dg-expires-at": "2000-01-01T00:00:00Z"},
+                    )
+                    for i in range(5)
+                ]
+
+            def delete_many(self, keys):
+                self.batches.append(list(keys))
+                return [(key, None) for key in self.batches[-1]]
+
+        service.storage = BulkDeleteStorage()
+
+        with (
+            patch.object(service_module, "_PURGE_BATCH", 2),
+            patch.object(service_module, "_PURGE_IN_FLIGHT", 1),
+        ):
+            result = service.purge_temp_files("bucket")
+
+        assert result["deleted_count"] == 5
+        assert sorted(len(batch) for batch in service.storage.batches) == [1, 2, 2]
+
+    def test_stamped_keys_are_judged_from_the_listing(self, service):
+        class ShallowStorage:
+            def __init__(self):
+                self.heads = []
+                self.deleted = []
+
+            def list_shallow(self, prefix):
+                return [
+                    ObjectHead(key=key, size=5, etag="e", last_modified=None, metadata={})
+                    for key in (
+                        ".deltaglider/tmp/946684800/old.zip",
+                        ".deltaglider/tmp/32503680000/new.zip",
+                        ".deltaglider/tmp/legacy.zip",
+                    )
+                ]
+
+            def head(self, key):
+                self.heads.append(key)
+                return ObjectHead(
+                    key=key.split("/", 1)[1],
+                    size=5,
+                    etag="e",
+                    last_modified=None,
+                    metadata={"dg-expires-at": "2000-01-01T00:00:00Z"},
+                )
+
+            def delete(self, key):
+                self.deleted.append(key)
+
+        service.storage = ShallowStorage()
+
+        result = service.purge_temp_files("bucket")
+
+        assert result["deleted_count"] == 2
+        assert service.storage.heads == ["bucket/.deltaglider/tmp/legacy.zip"]
+        assert sorted(service.storage.deleted) == [
+            "bucket/.deltaglider/tmp/946684800/old.zip",
+            "bucket/.deltaglider/tmp/legacy.zip",
+        ]
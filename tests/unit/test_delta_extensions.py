@@ -23,3 +23,27 @@ def test_is_delta_candidate_rejects_other_extensions():
     """Non delta-friendly extensions should return False."""
     assert not is_delta_candidate("document.txt")
     assert not is_delta_candidate("image.jpeg")
+
+
+def test_service_policy_change_invalidates_cached_decisions(service):
+    """Assigning new extensions must not serve stale cached decisions."""
+    assert not service.should_use_delta("notes.txt")
+    assert service.should_use_delta("build.zip")
+
+    service.delta_extensions = {".txt"}
+
+    assert service.should_use_delta("notes.txt")
+    assert not service.should_use_delta("build.zip")
+
+
+def test_service_policy_mutated_in_place_invalidates_cached_decisions(service):
+    """In-place changes to delta_extensions take effect like assignments do."""
+    assert not service.should_use_delta("notes.txt")
+
+    service.delta_extensions.add(".txt")
+    assert service.should_use_delta("notes.txt")
+
+    service.delta_extensions -= {".txt", ".zip"}
+    assert not service.should_use_delta("notes.txt")
+    assert not service.should_use_delta("build.zip")
+    assert isinstance(service.delta_extensions, set)
@@ -16,6 +16,7 @@ objects don't break. These tests pin both halves of the contract.
 from deltaglider.core.models import (
     METADATA_KEY_ALIASES,
     METADATA_PREFIX,
+    resolve_all,
     resolve_metadata,
 )
 
@@ -87,6 +88,19 @@ class TestResolveMetadataAliases:
         meta = {f"{METADATA_PREFIX}original-name": ""}
         assert resolve_metadata(meta, "original_name") is None
 
+    def test_resolve_all_matches_per_field_lookup(self):
+        """The one-pass resolver agrees with resolve_metadata for every field."""
+        meta = {
+            f"{METADATA_PREFIX}file-sha256": "new",
+            "file_sha256": "old",
+            "original_name": "build.zip",
+            "compression": "",
+        }
+        resolved = resolve_all(meta)
+        for field in METADATA_KEY_ALIASES:
+            assert resolved.get(field) == resolve_metadata(meta, field)
+        assert resolved == {"file_sha256": "new", "original_name": "build.zip"}
+
 
 class TestAliasTableContract:
     """Pin the alias-table shape so a future regression on the
@@ -2,7 +2,55 @@
 
 from unittest.mock import Mock
 
-from deltaglider.core.object_listing import list_all_objects, list_objects_page
+import pytest
+
+from deltaglider.core import object_listing
+from deltaglider.core.object_listing import (
+    ObjectListing,
+    iter_all_objects,
+    list_all_objects,
+    list_objects_page,
+)
+
+
+class FakeListingStorage:
+    """In-memory list_objects honouring prefix, delimiter, start_after and tokens."""
+
+    def __init__(self, keys):
+        self.keys = sorted(keys)
+        self.calls = []
+
+    def list_objects(
+        self,
+        bucket,
+        prefix="",
+        delimiter="",
+        max_keys=1000,
+        start_after=None,
+        continuation_token=None,
+    ):
+        self.calls.append({"prefix": prefix, "delimiter": delimiter})
+        after = continuation_token or start_after or ""
+        objects, prefixes = [], []
+        for key in self.keys:
+            if not key.startswith(prefix) or key <= after:
+                continue
+            rest = key[len(prefix) :]
+            if delimiter and delimiter in rest:
+                common = prefix + rest.split(delimiter, 1)[0] + delimiter
+                if common not in prefixes:
+                    prefixes.append(common)
+                continue
+            objects.append({"key": key, "size": 1})
+        entries = sorted([(o["key"], o) for o in objects] + [(p, None) for p in prefixes])
+        page = entries[:max_keys]
+        truncated = len(entries) > max_keys
+        return {
+            "objects": [o for _, o in page if o is not None],
+            "common_prefixes": [k for k, o in page if o is None],
+            "is_truncated": truncated,
+            "next_continuation_token": page[-1][0] if truncated else None,
+        }
 
 
 def test_list_objects_page_passes_continuation_token():
@@ -110,3 +158,91 @@ def test_list_all_objects_prevents_infinite_loop():
     # Should stop at max_iterations
     assert storage.list_objects.call_count == 10
     assert result.is_truncated
+
+
+def test_iter_all_objects_streams_and_records_summary():
+    """iter_all_objects yields page by page and reports the cap on the summary."""
+    from deltaglider.core.object_listing import ObjectListing, iter_all_objects
+
+    storage = Mock()
+    storage.list_objects.side_effect = [
+        {
+            "objects": [{"key": f"obj{i}"} for i in range(3)],
+            "common_prefixes": ["a/"],
+            "is_truncated": True,
+            "next_continuation_token": "token1",
+        },
+        {
+            "objects": [{"key": f"obj{i}"} for i in range(3, 6)],
+            "common_prefixes": ["a/"],
+            "is_truncated": True,
+            "next_continuation_token": "token2",
+        },
+    ]
+
+    summary = ObjectListing()
+    stream = iter_all_objects(storage, bucket="test-bucket", max_objects=5, summary=summary)
+
+    # Nothing is listed until the stream is consumed
+    assert storage.list_objects.call_count == 0
+    keys = [obj["key"] for obj in stream]
+
+    assert keys == ["obj0", "obj1", "obj2", "obj3", "obj4"]
+    assert summary.objects == []
+    assert summary.key_count == 5
+    assert summary.limit_reached
+    assert summary.is_truncated
+    assert summary.common_prefixes == ["a/"]
+
+
+@pytest.mark.parametrize("max_objects", [None, 95])
+def test_concurrent_listing_fans_out_and_keeps_key_order(max_objects):
+    """Large listings fan out over top-level prefixes but yield what a sequential LIST would."""
+    keys = [f"{space}/file{i:02d}" for space in ("a", "b", "c", "d") for i in range(30)]
+    keys += ["b.txt", "top.txt"]
+    sequential = [
+        obj["key"]
+        for obj in iter_all_objects(
+            FakeListingStorage(keys), bucket="b", max_keys=10, max_objects=max_objects
+        )
+    ]
+
+    storage = FakeListingStorage(keys)
+    summary = ObjectListing()
+    concurrent = [
+        obj["key"]
+        for obj in iter_all_objects(
+            storage,
+            bucket="b",
+            max_keys=10,
+            max_objects=max_objects,
+            summary=summary,
+            concurrency=4,
+        )
+    ]
+
+    assert concurrent == sequential
+    assert summary.limit_reached is (max_objects is not None)
+    assert {"prefix": "", "delimiter": "/"} in storage.calls
+    # The first three sequential pages covered a/; only later prefixes are fanned out
+    assert {call["prefix"] for call in storage.calls} == {"", "b/", "c/", "d/"}
+    assert object_listing.PARALLEL_LIST_AFTER_PAGES == 3
+
+
+def test_concurrent_listing_keeps_the_iteration_cap():
+    """Fanned-out prefix workers share the listing's remaining page budget."""
+    spaces = ("a", "b", "c", "d", "e", "f")
+    keys = [f"{space}/file{i:02d}" for space in spaces for i in range(40)]
+    storage = FakeListingStorage(keys)
+    summary = ObjectListing()
+
+    listed = list(
+        iter_all_objects(
+            storage, bucket="b", max_keys=10, max_iterations=8, summary=summary, concurrency=4
+        )
+    )
+
+    assert len(storage.calls) <= 8
+    assert [obj["key"] for obj in listed] == sorted(keys)[: len(listed)]
+    assert 30 <= len(listed) < len(keys)
+    assert summary.is_truncated
@@ -31,6 +31,21 @@ def test_parse_requires_key_when_configured() -> None:
         parse_s3_url("s3://bucket-only", allow_empty_key=False)
 
 
+def test_parse_collapses_leading_key_slashes() -> None:
+    """Repeated separators between bucket and key are not part of the key."""
+    parsed = parse_s3_url("s3://bucket//dir/file.zip")
+    assert parsed.bucket == "bucket"
+    assert parsed.key == "dir/file.zip"
+
+
+def test_parse_rejects_missing_bucket_and_scheme() -> None:
+    """URLs without a bucket or with another scheme are rejected."""
+    with pytest.raises(ValueError, match="missing bucket"):
+        parse_s3_url("s3:///key")
+    with pytest.raises(ValueError, match="Invalid S3 URL"):
+        parse_s3_url("https://bucket/key")
+
+
 def test_build_s3_url_round_trip() -> None:
     """build_s3_url should round-trip with parse_s3_url."""
     url = build_s3_url("bucket", "dir/file.tar")
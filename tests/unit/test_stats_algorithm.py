@@ -1,10 +1,54 @@
 """Exhaustive tests for the bucket statistics algorithm."""
 
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from deltaglider.client_operations.stats import get_bucket_stats
+from deltaglider.client_operations.stats import (
+    _OBJ_DELTA,
+    _OBJ_DIRECT,
+    _OBJ_REFERENCE,
+    _classify,
+    _DeltaMeta,
+    _ListingTotals,
+    get_bucket_stats,
+)
+
+
+@pytest.mark.parametrize(
+    ("key", "kind"),
+    [
+        ("app/v1.zip.delta", _OBJ_DELTA),
+        ("v1.zip.delta", _OBJ_DELTA),
+        ("app/reference.bin", _OBJ_REFERENCE),
+        ("reference.bin", _OBJ_REFERENCE),
+        ("app/my-reference.bin", _OBJ_DIRECT),
+        ("app/file.zip", _OBJ_DIRECT),
+    ],
+)
+def test_classify(key, kind):
+    """Keys are classified once as delta, reference or direct."""
+    assert _classify(key) == kind
+
+
+def test_quick_listing_totals_keep_no_delta_keys():
+    """Quick mode only counts deltas; other modes keep their keys for metadata lookup."""
+    listing = [
+        {"key": "app/reference.bin", "size": 1000},
+        {"key": "app/v1.zip.delta", "size": 10},
+        {"key": "app/v2.zip.delta", "size": 20},
+        {"key": "readme.txt", "size": 5},
+    ]
+    quick, detailed = _ListingTotals(), _ListingTotals(keep_delta_keys=True)
+    for obj in listing:
+        quick.add(obj)
+        detailed.add(obj)
+
+    assert (quick.delta_count, quick.delta_size, quick.delta_keys) == (2, 30, None)
+    assert detailed.delta_keys == ["app/v1.zip.delta", "app/v2.zip.delta"]
+    assert quick.reference_files == {"app": 1000}
+    assert (quick.direct_count, quick.direct_size) == (1, 5)
 
 
 class TestBucketStatsAlgorithm:
@@ -332,13 +376,15 @@ class TestBucketStatsAlgorithm:
         # Execute with mocked ThreadPoolExecutor
         with patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
             mock_pool = MagicMock()
-            mock_executor.return_value.__enter__.return_value = mock_pool
+            mock_executor.return_value = mock_pool
 
             # Simulate parallel execution
             futures = []
-            for i in range(num_deltas):
+            for _ in range(num_deltas):
                 future = Mock()
-                future.result.return_value = (f"file{i}.zip.delta", {"dg-file-size": "19500000"})
+                future.result.return_value = _DeltaMeta(
+                    file_size=19500000, ratio=None, ref_key=None
+                )
                 futures.append(future)
 
             mock_pool.submit.side_effect = futures
@@ -348,10 +394,48 @@ class TestBucketStatsAlgorithm:
             )
 
             with patch_as_completed:
-                _ = get_bucket_stats(mock_client, "parallel-bucket", mode="detailed")
+                stats = get_bucket_stats(mock_client, "parallel-bucket", mode="detailed")
 
         # Verify ThreadPoolExecutor was used with correct max_workers
         mock_executor.assert_called_once_with(max_workers=10)  # min(10, 50) = 10
+        assert mock_pool.submit.call_count == num_deltas
+        assert stats.total_size == num_deltas * 19500000
+
+    def test_metadata_heads_overlap_listing(self, mock_client):
+        """Deltas from the first LIST page are HEADed before the next page is requested."""
+        head_started = threading.Event()
+        pages = iter(
+            [
+                {
+                    "objects": [{"key": "app/v1.zip.delta", "size": 10}],
+                    "is_truncated": True,
+                    "next_continuation_token": "token1",
+                },
+                {
+                    "objects": [{"key": "app/v2.zip.delta", "size": 12}],
+                    "is_truncated": False,
+                },
+            ]
+        )
+
+        def list_objects(**kwargs):
+            if kwargs.get("continuation_token"):
+                assert head_started.wait(timeout=5), "HEAD did not start during listing"
+            return next(pages)
+
+        def mock_head(path):
+            head_started.set()
+            head = Mock()
+            head.metadata = {"dg-file-size": "100"}
+            return head
+
+        mock_client.service.storage.list_objects.side_effect = list_objects
+        mock_client.service.storage.head.side_effect = mock_head
+
+        stats = get_bucket_stats(mock_client, "overlap-bucket", mode="detailed", use_cache=False)
+
+        assert stats.delta_objects == 2
+        assert stats.total_size == 200
 
     def test_stats_modes_control_metadata_fetch(self, mock_client):
         """Metadata fetching should depend on the selected stats mode."""
@@ -1,15 +1,30 @@
 """Unit tests for bucket stats caching functionality."""
 
+import io
 import json
+import threading
+import time
 from unittest.mock import MagicMock
 
 from deltaglider.client_models import BucketStats
 from deltaglider.client_operations.stats import (
+    _delta_metadata_index_from_cache,
+    _DeltaMeta,
+    _DeltaMetadataPrefetcher,
     _get_cache_key,
     _is_cache_valid,
+    _load_stats_cache,
     _read_stats_cache,
     _write_stats_cache,
 )
+from deltaglider.ports.storage import ObjectHead
+
+
+def _resolve(client, objects, index):
+    prefetcher = _DeltaMetadataPrefetcher(client, "bucket", index)
+    for obj in objects:
+        prefetcher.add(obj)
+    return prefetcher.results()
 
 
 def test_get_cache_key():
@@ -77,9 +92,9 @@ def test_write_and_read_cache_roundtrip():
     # Capture what was written to storage
     written_data = None
 
-    def capture_put(address, data, metadata):
+    def capture_put(key, body, metadata, content_type="application/octet-stream"):
         nonlocal written_data
-        written_data = data
+        written_data = body
 
     mock_storage.put = capture_put
 
@@ -110,9 +125,7 @@ def test_write_and_read_cache_roundtrip():
     assert cache_data["stats"]["delta_objects"] == 140
 
     # Now test reading it back
-    mock_obj = MagicMock()
-    mock_obj.data = written_data
-    mock_storage.get = MagicMock(return_value=mock_obj)
+    mock_storage.get = MagicMock(return_value=io.BytesIO(written_data))
 
     stats, validation = _read_stats_cache(mock_client, "test-bucket", "quick")
 
@@ -157,9 +170,7 @@ def test_read_cache_invalid_json():
     mock_client.service = mock_service
 
     # Return invalid JSON
-    mock_obj = MagicMock()
-    mock_obj.data = b"not valid json {]["
-    mock_storage.get = MagicMock(return_value=mock_obj)
+    mock_storage.get = MagicMock(return_value=io.BytesIO(b"not valid json {]["))
 
     stats, validation = _read_stats_cache(mock_client, "test-bucket", "quick")
 
@@ -195,9 +206,7 @@ def test_read_cache_version_mismatch():
         },
     }
 
-    mock_obj = MagicMock()
-    mock_obj.data = json.dumps(cache_data).encode("utf-8")
-    mock_storage.get = MagicMock(return_value=mock_obj)
+    mock_storage.get = MagicMock(return_value=io.BytesIO(json.dumps(cache_data).encode("utf-8")))
 
     stats, validation = _read_stats_cache(mock_client, "test-bucket", "quick")
 
@@ -233,9 +242,7 @@ def test_read_cache_mode_mismatch():
         },
     }
 
-    mock_obj = MagicMock()
-    mock_obj.data = json.dumps(cache_data).encode("utf-8")
-    mock_storage.get = MagicMock(return_value=mock_obj)
+    mock_storage.get = MagicMock(return_value=io.BytesIO(json.dumps(cache_data).encode("utf-8")))
 
     # Request "quick" mode but cache has "detailed"
     stats, validation = _read_stats_cache(mock_client, "test-bucket", "quick")
@@ -282,3 +289,243 @@ def test_write_cache_handles_errors_gracefully():
     # Should log warning
     mock_logger.warning.assert_called_once()
     assert "Failed to write cache" in str(mock_logger.warning.call_args)
+
+
+def test_delta_metadata_index_roundtrip_skips_unchanged_heads():
+    """Deltas with an unchanged ETag are served from the stored index without HEAD."""
+    mock_storage = MagicMock()
+    mock_service = MagicMock()
+    mock_service.storage = mock_storage
+    mock_client = MagicMock()
+    mock_client.service = mock_service
+
+    def head(address):
+        key = address.split("/", 1)[1]
+        return ObjectHead(
+            key=key,
+            size=10,
+            etag="e",
+            last_modified=None,
+            metadata={"dg-file-size": "1000", "dg-ref-key": "app/reference.bin"},
+        )
+
+    mock_storage.head.side_effect = head
+    delta_objects = [
+        {"key": "app/v1.zip.delta", "size": 10, "etag": "etag-1"},
+        {"key": "app/v2.zip.delta", "size": 10, "etag": "etag-2"},
+    ]
+
+    # First run: nothing stored, every delta is HEADed
+    metadata_map, index = _resolve(mock_client, delta_objects, {})
+    assert mock_storage.head.call_count == 2
+    assert metadata_map["app/v1.zip.delta"].file_size == 1000
+
+    written = {}
+    mock_storage.put.side_effect = lambda key, body, metadata, **kw: written.update(data=body)
+    _write_stats_cache(
+        client=mock_client,
+        bucket="bucket",
+        mode="detailed",
+        stats=BucketStats(
+            bucket="bucket",
+            object_count=2,
+            total_size=2000,
+            compressed_size=20,
+            space_saved=1980,
+            average_compression_ratio=0.99,
+            delta_objects=2,
+            direct_objects=0,
+        ),
+        object_count=2,
+        compressed_size=20,
+        delta_metadata=index,
+    )
+    mock_storage.get = MagicMock(return_value=io.BytesIO(written["data"]))
+    stored = _delta_metadata_index_from_cache(_load_stats_cache(mock_client, "bucket", "detailed"))
+
+    # Second run: v2 was rewritten (new ETag) and v3 is new; only those are HEADed
+    mock_storage.head.reset_mock()
+    delta_objects[1]["etag"] = "etag-2b"
+    delta_objects.append({"key": "app/v3.zip.delta", "size": 10, "etag": "etag-3"})
+    metadata_map, index = _resolve(mock_client, delta_objects, stored)
+
+    headed = sorted(call.args[0] for call in mock_storage.head.call_args_list)
+    assert headed == ["bucket/app/v2.zip.delta", "bucket/app/v3.zip.delta"]
+    assert metadata_map["app/v1.zip.delta"] == _DeltaMeta(
+        file_size=1000, ratio=None, ref_key="app/reference.bin"
+    )
+    assert set(index) == {"app/v1.zip.delta", "app/v2.zip.delta", "app/v3.zip.delta"}
+    assert index["app/v2.zip.delta"]["etag"] == "etag-2b"
+
+
+def test_bucket_stats_fetch_the_cache_file_once():
+    """Stats and the delta metadata index come from a single cache GET."""
+    from deltaglider.client_operations.stats import get_bucket_stats
+
+    mock_storage = MagicMock()
+    mock_client = MagicMock()
+    mock_client.service.storage = mock_storage
+    mock_storage.list_objects.return_value = {
+        "objects": [{"key": "app/v1.zip.delta", "size": 10, "etag": "etag-1"}],
+        "is_truncated": False,
+    }
+    cached = BucketStats(
+        bucket="bucket",
+        object_count=1,
+        total_size=1000,
+        compressed_size=10,
+        space_saved=990,
+        average_compression_ratio=0.99,
+        delta_objects=1,
+        direct_objects=0,
+    )
+    written = {}
+    mock_storage.put.side_effect = lambda key, body, metadata, **kw: written.update(data=body)
+    _write_stats_cache(
+        client=mock_client,
+        bucket="bucket",
+        mode="detailed",
+        stats=cached,
+        object_count=1,
+        compressed_size=10,
+        delta_metadata={"app/v1.zip.delta": {"etag": "etag-1", "file_size": 1000}},
+    )
+    mock_storage.get.return_value = io.BytesIO(written["data"])
+
+    stats = get_bucket_stats(mock_client, "bucket", mode="detailed")
+
+    assert stats == cached
+    mock_storage.get.assert_called_once_with("bucket/.deltaglider/stats_detailed.json")
+    mock_storage.head.assert_not_called()
+
+
+def test_client_stats_ttl_serves_from_memory_until_write(monkeypatch):
+    """Within the stats TTL repeated calls skip the bucket LIST; writes invalidate."""
+    from deltaglider import client as client_module
+
+    stats = BucketStats(
+        bucket="bucket",
+        object_count=1,
+        total_size=100,
+        compressed_size=10,
+        space_saved=90,
+        average_compression_ratio=0.9,
+        delta_objects=1,
+        direct_objects=0,
+    )
+    compute = MagicMock(return_value=stats)
+    monkeypatch.setattr(client_module, "_get_bucket_stats", compute)
+    client = client_module.DeltaGliderClient(MagicMock(), stats_cache_ttl=30)
+
+    assert client.get_bucket_stats("bucket", mode="detailed") is stats
+    assert client.get_bucket_stats("bucket", mode="quick") is stats  # detailed covers quick
+    assert compute.call_count == 1
+
+    client.get_bucket_stats("bucket", mode="detailed", refresh_cache=True)
+    assert compute.call_count == 2
+
+    client._invalidate_bucket_stats_cache("bucket")
+    client.get_bucket_stats("bucket", mode="detailed")
+    assert compute.call_count == 3
+
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: float("inf"))
+    client.get_bucket_stats("bucket", mode="detailed")
+    assert compute.call_count == 4
+
+
+def test_metadata_wait_bounded_by_single_deadline():
+    """A stuck HEAD costs at most the overall deadline; finished HEADs are kept."""
+    release = threading.Event()
+    mock_client = MagicMock()
+
+    def head(address):
+        if address.endswith("slow.zip.delta"):
+            release.wait(timeout=10)
+        return ObjectHead(
+            key=address, size=10, etag="e", last_modified=None, metadata={"dg-file-size": "5"}
+        )
+
+    mock_client.service.storage.head.side_effect = head
+    mock_client.service.storage.max_pool_connections = 4
+    prefetcher = _DeltaMetadataPrefetcher(mock_client, "bucket")
+    prefetcher.add({"key": "app/fast.zip.delta", "size": 1, "etag": "a"})
+    prefetcher.add({"key": "app/slow.zip.delta", "size": 1, "etag": "b"})
+
+    start = time.monotonic()
+    try:
+        metadata_map, _ = prefetcher.results(max_timeout=0.3)
+    finally:
+        release.set()
+
+    assert time.monotonic() - start < 2
+    assert set(metadata_map) == {"app/fast.zip.delta"}
+
+
+def test_metadata_wait_fails_fast_when_most_heads_fail():
+    """Once over half of the first 100+ HEADs failed, the rest are abandoned."""
+    mock_client = MagicMock()
+
+    def head(address):
+        time.sleep(0.002)
+        raise RuntimeError("SlowDown")
+
+    mock_client.service.storage.head.side_effect = head
+    mock_client.service.storage.max_pool_connections = 2
+    prefetcher = _DeltaMetadataPrefetcher(mock_client, "bucket")
+    for i in range(400):
+        prefetcher.add({"key": f"app/v{i}.zip.delta", "size": 1, "etag": str(i)})
+
+    metadata_map, index = prefetcher.results()
+
+    assert metadata_map == {} and index == {}
+    assert mock_client.service.storage.head.call_count < 400
+    warning = str(mock_client.service.logger.warning.call_args)
+    assert "HEAD requests failed" in warning
+
+
+def test_delta_metadata_index_roundtrips_through_s3_adapter():
+    """With the real S3 adapter, a second run reuses the stored index instead of HEADing."""
+    from types import SimpleNamespace
+    from unittest.mock import patch
+
+    import pytest
+
+    moto = pytest.importorskip("moto")
+    import boto3
+
+    from deltaglider.adapters.storage_s3 import S3StorageAdapter
+    from deltaglider.client_operations.stats import get_bucket_stats
+
+    with moto.mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="stats-bucket")
+        s3.put_object(Bucket="stats-bucket", Key="app/reference.bin", Body=b"r" * 100)
+        for name in ("v1", "v2"):
+            s3.put_object(
+                Bucket="stats-bucket",
+                Key=f"app/{name}.zip.delta",
+                Body=b"d" * 10,
+                Metadata={"dg-file-size": "100", "dg-ref-key": "app/reference.bin"},
+            )
+        storage = S3StorageAdapter(client=s3)
+        client = SimpleNamespace(service=SimpleNamespace(storage=storage, logger=MagicMock()))
+
+        with patch.object(storage, "head", wraps=storage.head) as head:
+            first = get_bucket_stats(client, "stats-bucket", mode="detailed")
+            assert head.call_count == 2
+            assert "Failed to write cache" not in str(client.service.logger.mock_calls)
+
+            # A new delta invalidates the cached stats; only it needs a HEAD
+            s3.put_object(
+                Bucket="stats-bucket",
+                Key="app/v3.zip.delta",
+                Body=b"d" * 10,
+                Metadata={"dg-file-size": "100", "dg-ref-key": "app/reference.bin"},
+            )
+            head.reset_mock()
+            second = get_bucket_stats(client, "stats-bucket", mode="detailed")
+
+        headed = [call.args[0] for call in head.call_args_list]
+        assert headed == ["stats-bucket/app/v3.zip.delta"]
+        assert (first.delta_objects, second.delta_objects) == (2, 3)
+        assert second.total_size == 300
@@ -0,0 +1,500 @@
+"""Tests for S3StorageAdapter transfer behaviour."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from deltaglider.adapters import storage_s3
+from deltaglider.adapters.storage_s3 import S3StorageAdapter
+
+
+class TestMultipartUpload:
+    """Large files are uploaded as concurrent multipart uploads."""
+
+    def test_small_file_uses_single_put(self, temp_dir):
+        mock_client = MagicMock()
+        mock_client.put_object.return_value = {"ETag": '"small"'}
+        adapter = S3StorageAdapter(client=mock_client)
+
+        test_file = temp_dir / "small.zip"
+        test_file.write_bytes(b"x" * 1024)
+
+        result = adapter.put("bucket/small.zip", test_file, {"dg-tool": "test"})
+
+        assert result.etag == "small"
+        mock_client.put_object.assert_called_once()
+        mock_client.upload_file.assert_not_called()
+
+    def test_small_file_is_sent_from_a_mapping_and_rewound_on_retry(self, temp_dir):
+        sent: list[bytes] = []
+
+        def put_object(**kwargs):
+            body = kwargs["Body"]
+            sent.append(body if isinstance(body, bytes) else body.read())
+            if len(sent) == 1:
+                raise ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
+            return {"ETag": '"retried"'}
+
+        mock_client = MagicMock()
+        mock_client.put_object.side_effect = put_object
+        adapter = S3StorageAdapter(client=mock_client)
+
+        test_file = temp_dir / "small.zip"
+        test_file.write_bytes(b"payload" * 100)
+        empty_file = temp_dir / "empty.zip"
+        empty_file.write_bytes(b"")
+
+        with patch("time.sleep"):
+            result = adapter.put("bucket/small.zip", test_file, {})
+        adapter.put("bucket/empty.zip", empty_file, {})
+
+        assert result.etag == "retried"
+        assert sent == [b"payload" * 100, b"payload" * 100, b""]
+        assert mock_client.put_object.call_args_list[0].kwargs["Body"].closed
+
+    def test_large_file_uses_multipart(self, temp_dir):
+        mock_client = MagicMock()
+        mock_client.head_object.return_value = {"ETag": '"multi-2"', "VersionId": "v1"}
+        adapter = S3StorageAdapter(client=mock_client)
+
+        test_file = temp_dir / "large.zip"
+        test_file.write_bytes(b"x" * 2048)
+
+        with patch.object(storage_s3, "MULTIPART_THRESHOLD", 1024):
+            result = adapter.put("bucket/path/large.zip", test_file, {"DG-Tool": "test"})
+
+        assert result.etag == "multi-2"
+        assert result.version_id == "v1"
+        mock_client.put_object.assert_not_called()
+        mock_client.upload_file.assert_called_once()
+
+        args = mock_client.upload_file.call_args
+        assert args.args == (str(test_file), "bucket", "path/large.zip")
+        assert args.kwargs["ExtraArgs"]["Metadata"] == {"dg-tool": "test"}
+        config = args.kwargs["Config"]
+        assert config.multipart_chunksize == storage_s3.MULTIPART_PART_SIZE
+        assert config.max_concurrency == storage_s3.MULTIPART_CONCURRENCY
+
+    def test_multipart_keeps_the_put_contract(self, temp_dir, caplog):
+        from boto3.exceptions import S3UploadFailedError
+
+        mock_client = MagicMock()
+        mock_client.head_object.return_value = {"ETag": '"multi"', "Metadata": {}}
+        adapter = S3StorageAdapter(client=mock_client)
+        test_file = temp_dir / "large.zip.delta"
+        test_file.write_bytes(b"x" * 2048)
+
+        with patch.object(storage_s3, "MULTIPART_THRESHOLD", 1024):
+            adapter.put("bucket/large.zip.delta", test_file, {"dg-file-sha256": "abc"})
+            assert "NOT STORED" in caplog.text
+            mock_client.head_object.assert_called_once()
+
+            mock_client.upload_file.side_effect = S3UploadFailedError("part 3 failed")
+            with pytest.raises(RuntimeError, match="Failed to put object"):
+                adapter.put("bucket/large.zip.delta", test_file, {"dg-file-sha256": "abc"})
+
+
+class TestNativeBucketOps:
+    """Bucket operations reach boto3 through the adapter capability flag."""
+
+    def test_boto_client_exposes_underlying_client(self):
+        mock_client = MagicMock()
+        adapter = S3StorageAdapter(client=mock_client)
+
+        assert S3StorageAdapter.supports_native_bucket_ops is True
+        assert adapter.boto_client is mock_client
+
+
+class TestClientConfig:
+    """Connection pooling, keep-alive and retry tuning for the boto3 client."""
+
+    def test_pool_keepalive_and_adaptive_retries(self):
+        with patch("deltaglider.adapters.storage_s3.boto3.client") as mock_client:
+            S3StorageAdapter(endpoint_url="https://example.com")
+
+        config = mock_client.call_args.kwargs["config"]
+        assert config.max_pool_connections == storage_s3.MAX_POOL_CONNECTIONS
+        assert config.tcp_keepalive is True
+        assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+
+    def test_max_pool_connections_reports_client_pool(self):
+        mock_client = MagicMock()
+        mock_client.meta.config.max_pool_connections = 32
+        adapter = S3StorageAdapter(client=mock_client)
+
+        assert adapter.max_pool_connections == 32
+
+    def test_big_http_buffer_is_opt_in(self, monkeypatch):
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+        def blocksize(adapter):
+            manager = adapter.client._endpoint.http_session._manager
+            return manager.connection_from_url("https://s3.amazonaws.com")._get_conn().blocksize
+
+        monkeypatch.delenv(storage_s3.BIG_HTTP_BUFFER_ENV, raising=False)
+        default = blocksize(S3StorageAdapter())
+
+        monkeypatch.setenv(storage_s3.BIG_HTTP_BUFFER_ENV, "1")
+        adapter = S3StorageAdapter()
+
+        assert default != storage_s3.BIG_HTTP_BUFFER_SIZE
+        assert blocksize(adapter) == storage_s3.BIG_HTTP_BUFFER_SIZE
+        proxy = adapter.client._endpoint.http_session._get_proxy_manager("http://proxy:3128")
+        assert proxy.connection_pool_kw["blocksize"] == storage_s3.BIG_HTTP_BUFFER_SIZE
+
+
+class TestListObjects:
+    """LIST responses are normalised into plain dicts."""
+
+    def test_storage_class_strings_are_shared(self):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {
+            "Contents": [
+                {"Key": f"k{i}", "Size": 1, "LastModified": "x", "StorageClass": "".join("GLACIER")}
+                for i in range(3)
+            ],
+        }
+        adapter = S3StorageAdapter(client=mock_client)
+
+        objects = adapter.list_objects("bucket")["objects"]
+
+        assert [obj["storage_class"] for obj in objects] == ["GLACIER"] * 3
+        assert objects[0]["storage_class"] is objects[2]["storage_class"]
+
+
+class TestHeadMany:
+    """Batched HEADs run concurrently and report misses as None."""
+
+    def test_head_many_maps_each_key(self):
+        from botocore.exceptions import ClientError
+
+        def head_object(Bucket, Key):
+            if Key == "missing.delta":
+                raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+            return {"ContentLength": 1, "ETag": f'"{Key}"', "LastModified": "x", "Metadata": {}}
+
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = head_object
+        adapter = S3StorageAdapter(client=mock_client)
+
+        heads = adapter.head_many(["bucket/a.delta", "bucket/missing.delta", "bucket/b.delta"])
+
+        assert list(heads) == ["bucket/a.delta", "bucket/missing.delta", "bucket/b.delta"]
+        assert heads["bucket/a.delta"].etag == "a.delta"
+        assert heads["bucket/missing.delta"] is None
+        assert mock_client.head_object.call_count == 3
+
+    def test_head_many_concurrency_is_capped_by_the_pool(self):
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = peak = 0
+
+        def head_object(Bucket, Key):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return {"ContentLength": 1, "ETag": '"e"', "LastModified": "x", "Metadata": {}}
+
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = head_object
+        mock_client.meta.config.max_pool_connections = 3
+        adapter = S3StorageAdapter(client=mock_client)
+
+        callers = [
+            threading.Thread(target=adapter.head_many, args=([f"b/{c}{i}" for i in range(6)],))
+            for c in "xyz"
+        ]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+
+        assert mock_client.head_object.call_count == 18
+        assert peak <= 3
+
+
+class TestDeleteMany:
+    """Bulk deletes use DeleteObjects in batches and report per-key errors."""
+
+    def test_delete_many_batches_and_maps_errors(self):
+        mock_client = MagicMock()
+        mock_client.delete_objects.return_value = {
+            "Errors": [
+                {"Key": "k1", "Code": "AccessDenied", "Message": "denied"},
+                {"Key": "k2", "Code": "NoSuchKey", "Message": "gone"},
+            ]
+        }
+        adapter = S3StorageAdapter(client=mock_client)
+        keys = [f"bucket/k{i}" for i in range(5)]
+
+        with patch.object(storage_s3, "DELETE_BATCH_SIZE", 2):
+            results = adapter.delete_many(keys)
+
+        assert mock_client.delete_objects.call_count == 3
+        first = mock_client.delete_objects.call_args_list[0].kwargs
+        assert first["Bucket"] == "bucket"
+        assert first["Delete"]["Objects"] == [{"Key": "k0"}, {"Key": "k1"}]
+        assert [key for key, _ in results] == keys
+        failed = {key: error for key, error in results if error is not None}
+        assert list(failed) == ["bucket/k1"]
+        assert failed["bucket/k1"].response["Error"]["Code"] == "AccessDenied"
+
+
+class TestListPrefetch:
+    """The StoragePort listing prefetches pages and HEADs objects in order."""
+
+    def test_list_yields_every_page_in_order(self):
+        def head_object(Bucket, Key):
+            return {"ContentLength": 1, "ETag": '"e"', "LastModified": "x", "Metadata": {}}
+
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = head_object
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "p/a"}, {"Key": "p/b"}, {"Key": "p/c"}]},
+            {},
+            {"Contents": [{"Key": "p/d"}]},
+        ]
+        mock_client.meta.config.max_pool_connections = 2
+        adapter = S3StorageAdapter(client=mock_client)
+
+        assert [head.key for head in adapter.list("bucket/p")] == ["p/a", "p/b", "p/c", "p/d"]
+
+
+class TestConcurrentGet:
+    """Large downloads are fetched as parallel ranged GETs, read back in order."""
+
+    @staticmethod
+    def _ranged_client(payload):
+        import io
+
+        def get_object(Bucket, Key, Range=None, IfMatch=None):
+            start, end = (int(x) for x in Range.removeprefix("bytes=").split("-"))
+            end = min(end, len(payload) - 1)
+            return {
+                "Body": io.BytesIO(payload[start : end + 1]),
+                "ContentRange": f"bytes {start}-{end}/{len(payload)}",
+                "ETag": '"etag"',
+            }
+
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = get_object
+        return mock_client
+
+    def test_large_object_streams_in_order(self):
+        payload = bytes(range(256)) * 40
+        mock_client = self._ranged_client(payload)
+        adapter = S3StorageAdapter(client=mock_client)
+
+        with patch.object(storage_s3, "DOWNLOAD_PART_SIZE", 1000):
+            stream = adapter.get_concurrent("bucket/big.bin")
+            data = b"".join(iter(lambda: stream.read(777), b""))
+
+        assert data == payload
+        assert mock_client.get_object.call_count == 11
+        assert all(
+            c.kwargs["IfMatch"] == '"etag"' for c in mock_client.get_object.call_args_list[1:]
+        )
+
+    def test_read_without_size_drains_every_part(self):
+        payload = bytes(range(256)) * 40
+        adapter = S3StorageAdapter(client=self._ranged_client(payload))
+
+        with patch.object(storage_s3, "DOWNLOAD_PART_SIZE", 1000):
+            stream = adapter.get_concurrent("bucket/big.bin")
+            head = stream.read(10)
+            rest = stream.read()
+
+        assert head + rest == payload
+        assert stream.read() == b""
+
+    def test_large_object_round_trips_through_moto(self):
+        moto = pytest.importorskip("moto")
+        import boto3
+
+        payload = bytes(range(256)) * (storage_s3.DOWNLOAD_PART_SIZE // 256 * 2 + 17)
+        with moto.mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket="dg-bucket")
+            client.put_object(Bucket="dg-bucket", Key="big.bin", Body=payload)
+            adapter = S3StorageAdapter(client=client)
+
+            with adapter.get_concurrent("dg-bucket/big.bin") as stream:
+                assert stream.read() == payload
+
+            # A consumer that stops early cancels the ranges it will never read
+            stream = adapter.get_concurrent("dg-bucket/big.bin")
+            assert stream.read(10) == payload[:10]
+            stream.close()
+
+        assert stream._requests is adapter._requests
+        assert not stream._pending
+        assert stream.read(10) == b""
+
+    def test_small_object_uses_single_request(self):
+        mock_client = self._ranged_client(b"tiny")
+        adapter = S3StorageAdapter(client=mock_client)
+
+        assert adapter.get_concurrent("bucket/small.bin").read() == b"tiny"
+        mock_client.get_object.assert_called_once()
+
+
+class TestExistsAny:
+    """Reference safety probes list keys only and stop at the first hit."""
+
+    def test_first_small_page_answers(self):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {
+            "Contents": [{"Key": "ds/reference.bin"}, {"Key": "ds/other.zip.delta"}],
+            "IsTruncated": True,
+            "NextContinuationToken": "t",
+        }
+        adapter = S3StorageAdapter(client=mock_client)
+
+        assert adapter.exists_any("bucket/ds", exclude_key="ds/reference.bin") is True
+        mock_client.list_objects_v2.assert_called_once_with(
+            Bucket="bucket", Prefix="ds", MaxKeys=storage_s3.EXISTS_PROBE_KEYS
+        )
+        mock_client.head_object.assert_not_called()
+
+    def test_pages_past_keys_inside_the_deletion_scope(self):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.side_effect = [
+            {
+                "Contents": [{"Key": "ds/reference.bin"}, {"Key": "ds/gone/a.delta"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "t",
+            },
+            {"Contents": [{"Key": "ds/gone/b.delta"}], "IsTruncated": False},
+        ]
+        adapter = S3StorageAdapter(client=mock_client)
+
+        assert adapter.exists_any("bucket/ds", "ds/reference.bin", within="ds/gone/") is False
+        second = mock_client.list_objects_v2.call_args_list[1].kwargs
+        assert second["StartAfter"] == "ds/gone/\U0010ffff"  # jumps past the scope
+        assert "ContinuationToken" not in second
+        assert second["MaxKeys"] == 1000
+
+    def test_pages_normally_outside_the_deletion_scope(self):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.side_effect = [
+            {
+                "Contents": [{"Key": "ds/reference.bin"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "t",
+            },
+            {"Contents": [{"Key": "ds/z.delta"}], "IsTruncated": False},
+        ]
+        adapter = S3StorageAdapter(client=mock_client)
+
+        assert adapter.exists_any("bucket/ds", "ds/reference.bin", within="ds/gone/") is True
+        assert mock_client.list_objects_v2.call_args_list[1].kwargs["ContinuationToken"] == "t"
+
+
+class TestListSharded:
+    """Wide prefixes are listed one paginator per sub-folder."""
+
+    def test_sub_folders_are_listed_separately(self):
+        listings = {
+            ("root/", "/"): [
+                {"Contents": [{"Key": "root/top.bin"}], "CommonPrefixes": [{"Prefix": "root/a/"}]},
+                {"CommonPrefixes": [{"Prefix": "root/b/"}]},
+            ],
+            ("root/a/", None): [{"Contents": [{"Key": "root/a/1"}, {"Key": "root/a/2"}]}],
+            ("root/b/", None): [{"Contents": [{"Key": "root/b/1"}]}, {}],
+        }
+
+        def paginate(Bucket, Prefix, Delimiter=None):
+            return listings[(Prefix, Delimiter)]
+
+        def head_object(Bucket, Key):
+            return {"ContentLength": 1, "ETag": '"e"', "LastModified": "x", "Metadata": {}}
+
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.side_effect = paginate
+        mock_client.head_object.side_effect = head_object
+        mock_client.meta.config.max_pool_connections = 4
+        adapter = S3StorageAdapter(client=mock_client)
+
+        keys = [head.key for head in adapter.list_sharded("bucket/root/")]
+
+        assert sorted(keys) == ["root/a/1", "root/a/2", "root/b/1", "root/top.bin"]
+        assert mock_client.get_paginator.return_value.paginate.call_count == 3
+
+    def test_walkers_are_bounded_and_stop_with_the_consumer(self):
+        import time
+
+        produced = 0
+
+        def folder_pages(folder):
+            nonlocal produced
+            for i in range(1000):
+                produced += 1
+                yield {"Contents": [{"Key": f"{folder}{i}", "Size": 1, "LastModified": "x"}]}
+
+        def paginate(Bucket, Prefix, Delimiter=None):
+            if Delimiter:
+                return [{"CommonPrefixes": [{"Prefix": "root/a/"}]}]
+            return folder_pages(Prefix)
+
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.side_effect = paginate
+        adapter = S3StorageAdapter(client=mock_client)
+
+        listing = adapter.list_sharded("bucket/root/", metadata=False)
+        assert next(listing).key == "root/a/0"
+        time.sleep(0.2)  # let the walker fill the queue
+
+        assert produced <= storage_s3.LIST_SHARD_QUEUE_PAGES + 2
+        listing.close()  # returns only once the walker has given up
+        assert produced < 1000
+
+
+class TestCopy:
+    """Server-side copies replace metadata without moving bytes through the client."""
+
+    def test_copy_replaces_metadata(self):
+        mock_client = MagicMock()
+        mock_client.copy_object.return_value = {"CopyObjectResult": {"ETag": '"c"'}}
+        adapter = S3StorageAdapter(client=mock_client)
+
+        result = adapter.copy("bucket/src.bin", "bucket/tmp/dst.bin", {"DG-Expires-At": "t"})
+
+        assert result.etag == "c"
+        kwargs = mock_client.copy_object.call_args.kwargs
+        assert kwargs["CopySource"] == {"Bucket": "bucket", "Key": "src.bin"}
+        assert kwargs["Key"] == "tmp/dst.bin"
+        assert kwargs["Metadata"] == {"dg-expires-at": "t"}
+        assert kwargs["MetadataDirective"] == "REPLACE"
+        mock_client.get_object.assert_not_called()
+
+    def test_oversized_source_uses_managed_copy(self):
+        from botocore.exceptions import ClientError
+
+        mock_client = MagicMock()
+        mock_client.copy_object.side_effect = ClientError(
+            {"Error": {"Code": "InvalidRequest"}}, "CopyObject"
+        )
+        mock_client.head_object.return_value = {"ETag": '"big"'}
+        adapter = S3StorageAdapter(client=mock_client)
+
+        assert adapter.copy("bucket/src.bin", "bucket/dst.bin", {}).etag == "big"
+        mock_client.copy.assert_called_once()
+
+    def test_shallow_sharded_listing_skips_heads(self):
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "root/a", "Size": 3, "ETag": '"e"', "LastModified": "x"}]}
+        ]
+        adapter = S3StorageAdapter(client=mock_client)
+
+        [head] = adapter.list_sharded("bucket/root/", metadata=False)
+
+        assert (head.key, head.size, head.etag, head.metadata) == ("root/a", 3, "e", {})
+        mock_client.head_object.assert_not_called()